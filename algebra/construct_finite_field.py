@@ -1,7 +1,10 @@
 import random
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
-from polynomials.polynomial import Polynomial, gcd
+from polynomials.factorization import is_irreducible_mod
+from polynomials.modulus import Modulus
+from polynomials.polynomial import Polynomial, invmod
+from polynomials.univariate import from_dense
 
 # Construct a Finite Field/Galois Field of order p^i, GF(p^i)
 # Zech logarithm table stores every element of GF(p^i)
@@ -26,15 +29,20 @@ class ZechLogarithmTable:
             self.h: Polynomial = find_irreducible(p, i)
         else:
             self.h = h
+        # every reduction below is by h: prepare it once
+        self.modulus = Modulus(self.h)
         # find primitive element beta
-        beta = find_primitive_element(self.h, p, i)
+        beta = find_primitive_element(self.h, p, i, self.modulus)
+        beta_dense = self.modulus.to_dense(beta)
         self.poly_to_power: Dict[str, int] = {}
         self.power_to_poly: Dict[int, Polynomial] = {}
         beta_j: Polynomial = Polynomial(1, p)
+        beta_j_dense = [1]
         for j in range(self.field_characteristic - 1):
             self.poly_to_power[str(beta_j)] = j
             self.power_to_poly[j] = beta_j
-            beta_j = (beta_j * beta) % self.h
+            beta_j_dense = self.modulus.mulmod_dense(beta_j_dense, beta_dense)
+            beta_j = self.modulus.from_dense(beta_j_dense)
 
     def multiply(self, poly1: Polynomial, poly2: Polynomial) -> Polynomial:
         """
@@ -46,18 +54,29 @@ class ZechLogarithmTable:
         j = self.poly_to_power[str(poly2)]
         return self.power_to_poly[(i + j) % (self.field_characteristic - 1)]
 
+    def inverse(self, poly: Polynomial) -> Polynomial:
+        """
+        multiplicative inverse in F_p[x]/h by the extended Euclidean algorithm, no table lookup
+        raises ZeroDivisionError for 0
+        """
+        if poly == 0:
+            raise ZeroDivisionError("0 has no inverse in GF(p^i)")
+        return invmod(poly, self.h)
+
+    def divide(self, poly1: Polynomial, poly2: Polynomial) -> Polynomial:
+        """
+        poly1 / poly2 in F_p[x]/h
+        """
+        if poly1 == 0:
+            return Polynomial(0, self.h.field_characteristic)
+        return self.multiply(poly1, self.inverse(poly2))
+
 
 def random_monic(p: int, n: int) -> Polynomial:
     """
     returns a random monic polynomial of degree n over field F_q
     """
-    x = Polynomial("x", p)
-    f = x**n
-    m = n - 1
-    while m >= 0:
-        f += random.randint(0, p - 1) * (x**m)
-        m -= 1
-    return f
+    return from_dense([random.randint(0, p - 1) for _ in range(n)] + [1], "x", p)
 
 
 def find_irreducible(p: int, n: int) -> Polynomial:
@@ -71,58 +90,61 @@ def find_irreducible(p: int, n: int) -> Polynomial:
     # g_i = gcd(x^(p^i) - x, f)
     # if g_i != 1 then go to 1.
     # return f
-    max_attempts = 1000
+    # polynomials.factorization.is_irreducible_mod runs step 2 with x^(p^i) reduced modulo f and
+    # one gcd for several i at a time
+    max_attempts = max(1000, 20 * n)  # about one in n monic polynomials is irreducible
     attempts = 0
     while attempts < max_attempts:
-        f = random_monic(p, n)
-        i = 1
-        reducible = False
-        while i <= n // 2:
-            g_i = gcd(Polynomial("x", p) ** (p**i) - Polynomial("x", p), f)
-            if g_i != 1:
-                if g_i != f:
-                    reducible = True
-                elif Polynomial("x", p) ** (p**i) - Polynomial("x", p) == f:
-                    reducible = True
-                break
-            i += 1
-        if not reducible:
-            return f
+        f = [random.randint(0, p - 1) for _ in range(n)] + [1]
+        if is_irreducible_mod(f, p):
+            return from_dense(f, "x", p)
         attempts += 1
-    raise RuntimeError(
-        f"Failed to find irreducible polynomial of degree {n} over F_{p} after {max_attempts} attempts."
-    )
+    raise RuntimeError(f"Failed to find irreducible polynomial of degree {n} over F_{p} after {max_attempts} attempts.")
 
 
-def find_primitive_element(h: Polynomial, p: int, i: int) -> Polynomial:
+def prime_factors(n: int) -> List[int]:
+    """
+    distinct prime factors of n by trial division
+    """
+    factors = []
+    d = 2
+    while d * d <= n:
+        if n % d == 0:
+            factors.append(d)
+            while n % d == 0:
+                n //= d
+        d += 1 if d == 2 else 2
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def find_primitive_element(h: Polynomial, p: int, i: int, modulus: Optional[Modulus] = None) -> Polynomial:
     """
     input irreducible polynomial h over field with characteristic q
     output element of F_q[x] that generates the multiplication group of F_q[x]/h
+    modulus: h prepared as a Modulus, if the caller already has one
     """
     # related: https://arxiv.org/pdf/1304.1206v4.pdf
     # https://www.sciencedirect.com/science/article/pii/S1071579705000456
+    # b has order q - 1 iff b^(q - 1) = 1 and b^((q - 1) / r) != 1 for every prime r dividing q - 1
     q = p**i
+    cofactors = [(q - 1) // r for r in prime_factors(q - 1)]
+    if modulus is None:
+        modulus = Modulus(h)
+
+    def is_primitive(b: Polynomial) -> bool:
+        dense = modulus.to_dense(b)
+        if modulus.powmod_dense(dense, q - 1) != [1]:
+            return False
+        return all(modulus.powmod_dense(dense, c) != [1] for c in cofactors)
 
-    def order(b: Polynomial) -> int:
-        if b == 0:
-            return 0
-        b = b.copy()
-        b_j = b.copy()
-        j = 1
-        while b_j != 1:
-            b_j *= b
-            b_j %= h
-            if b_j == 0:
-                return 0
-            j += 1
-        return j
-
-    f = Polynomial("x", p)
-    while order(f) != q - 1:
+    x = Polynomial("x", p)
+    f = x
+    while not is_primitive(f):
         f = Polynomial(0, p)
-        a = random.randint(1, i - 1)
-        for k in range(a):
-            f += random.randint(0, p - 1) * Polynomial("x", p) ** k
+        for k in range(i):
+            f += random.randint(0, p - 1) * x**k
     return f
 
 
@@ -1,11 +1,79 @@
-from typing import List, Sequence
+from fractions import Fraction
+from typing import Any, List, Sequence
 
 Number = float  # Internally coerced to float in implementation
 Vector = Sequence[Number]
 Matrix = Sequence[Sequence[Number]]
 
 
-def lll_reduction(basis: Matrix, delta: float = 0.75) -> List[List[Number]]:
+def _dot(u: Sequence[Any], v: Sequence[Any]) -> Any:
+    return sum(a * b for a, b in zip(u, v))
+
+
+def _lll_exact(basis: Sequence[Sequence[Any]], delta: Fraction) -> List[List[Any]]:
+    """
+    LLL on integer (or Fraction) vectors in exact arithmetic, with the Gram-Schmidt coefficients
+    mu and squared norms B updated incrementally (Cohen, A Course in Computational Algebraic
+    Number Theory, Algorithm 2.6.3) instead of recomputed after every step
+    """
+    b = [list(v) for v in basis]
+    n = len(b)
+    if n == 0:
+        return b
+    mu = [[Fraction(0)] * n for _ in range(n)]
+    B: List[Fraction] = [Fraction(_dot(b[0], b[0]))] + [Fraction(0)] * (n - 1)
+    if B[0] == 0:
+        raise ValueError("the basis vectors are linearly dependent")
+
+    def reduce(k: int, j: int) -> None:
+        if abs(mu[k][j]) > Fraction(1, 2):
+            q = round(mu[k][j])
+            b[k] = [x - q * y for x, y in zip(b[k], b[j])]
+            mu[k][j] -= q
+            for i in range(j):
+                mu[k][i] -= q * mu[j][i]
+
+    k, k_max = 1, 0
+    while k < n:
+        if k > k_max:
+            k_max = k
+            for j in range(k):
+                mu[k][j] = (_dot(b[k], b[j]) - sum(mu[j][i] * mu[k][i] * B[i] for i in range(j))) / B[j]
+            B[k] = _dot(b[k], b[k]) - sum(mu[k][j] ** 2 * B[j] for j in range(k))
+            if B[k] == 0:
+                raise ValueError("the basis vectors are linearly dependent")
+        reduce(k, k - 1)
+        if B[k] < (delta - mu[k][k - 1] ** 2) * B[k - 1]:
+            # swap b_k and b_(k-1)
+            m = mu[k][k - 1]
+            total = B[k] + m * m * B[k - 1]
+            mu[k][k - 1] = m * B[k - 1] / total
+            B[k] = B[k - 1] * B[k] / total
+            B[k - 1] = total
+            b[k], b[k - 1] = b[k - 1], b[k]
+            for j in range(k - 1):
+                mu[k][j], mu[k - 1][j] = mu[k - 1][j], mu[k][j]
+            for i in range(k + 1, k_max + 1):
+                t = mu[i][k]
+                mu[i][k] = mu[i][k - 1] - m * t
+                mu[i][k - 1] = t + mu[k][k - 1] * mu[i][k]
+            k = max(1, k - 1)
+        else:
+            for j in range(k - 2, -1, -1):
+                reduce(k, j)
+            k += 1
+    return b
+
+
+def lll_reduction(basis: Matrix, delta: float = 0.75, exact: bool = False) -> List[List[Number]]:
+    """
+    LLL-reduced basis of the lattice spanned by the rows of basis
+    exact=True works on the integers (or Fractions) themselves, without numpy or rounding
+    errors, and returns them as such: for lattices whose entries do not fit a float, as in the
+    recombination step of polynomial factorization (polynomials.factorization)
+    """
+    if exact:
+        return _lll_exact(basis, Fraction(delta))
     import numpy as np
 
     B = [np.array(list(map(float, v))) for v in basis]
@@ -5,8 +5,12 @@ import unittest
 from algebra.construct_finite_field import (
     ZechLogarithmTable,
     find_irreducible,
+    find_primitive_element,
+    prime_factors,
     random_monic,
 )
+from polynomials.polynomial import Polynomial, powmod
+from polynomials.univariate import divmod_mod, to_dense
 
 
 class TestConstructFiniteField(unittest.TestCase):
@@ -22,12 +26,50 @@ class TestConstructFiniteField(unittest.TestCase):
         # Should be monic
         self.assertEqual(poly.LT(), poly.LM())
 
+    def test_find_irreducible_has_no_factors(self):
+        # previously polynomials dividing x^(p^i) - x were accepted
+        for _ in range(20):
+            f = to_dense(find_irreducible(3, 4), "x", 3)
+            for d in (1, 2):
+                for k in range(3**d):
+                    g = [k // 3**j % 3 for j in range(d)] + [1]
+                    self.assertTrue(divmod_mod(f, g, 3)[1])
+
+    def test_find_irreducible_large_degree(self):
+        f = find_irreducible(2, 64)
+        self.assertEqual(f.degree(), 64)
+        x = Polynomial("x", 2)
+        self.assertEqual(powmod(x, 2**64, f), x)
+        self.assertNotEqual(powmod(x, 2**32, f), x)
+
+    def test_find_primitive_element(self):
+        self.assertEqual(prime_factors(720), [2, 3, 5])
+        self.assertEqual(prime_factors(3**8 - 1), [2, 5, 41])
+        h = Polynomial("x^2 + 1", 3)  # x has order 4 here
+        beta = find_primitive_element(h, 3, 2)
+        self.assertEqual(powmod(beta, 8, h), 1)
+        self.assertNotEqual(powmod(beta, 4, h), 1)
+        table = ZechLogarithmTable(3, 2, h)
+        self.assertEqual(len(table.poly_to_power), 8)
+        self.assertEqual(len(ZechLogarithmTable(7, 1).poly_to_power), 6)
+
     def test_zech_logarithm_table(self):
         table = ZechLogarithmTable(2, 3)
         self.assertEqual(table.h.degree(), 3)
         self.assertTrue(hasattr(table, "poly_to_power"))
         self.assertTrue(hasattr(table, "power_to_poly"))
 
+    def test_inverse_and_divide(self):
+        table = ZechLogarithmTable(3, 2, Polynomial("x^2 + x + 2", 3))
+        one = table.power_to_poly[0]
+        for j, element in table.power_to_poly.items():
+            inverse = table.inverse(element)
+            self.assertEqual(table.multiply(element, inverse), one)
+            self.assertEqual(table.poly_to_power[str(inverse)], -j % 8)
+        self.assertEqual(table.divide(table.power_to_poly[5], table.power_to_poly[7]), table.power_to_poly[6])
+        with self.assertRaises(ZeroDivisionError):
+            table.inverse(Polynomial(0, 3))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -69,6 +69,20 @@ class TestLLL(unittest.TestCase):
         m = [list(map(float, v)) for v in m]
         self.is_lll_reduced(m, delta=0.75)
 
+    def test_exact(self):
+        m = [[105, 821, 404, 328], [881, 667, 644, 927], [181, 483, 87, 500], [893, 834, 732, 441]]
+        reduced = lll_reduction(m, 0.75, exact=True)
+        self.assertTrue(all(type(x) is int for v in reduced for x in v))
+        self.assertEqual(reduced, [[int(x) for x in v] for v in lll_reduction(m, 0.75)])
+        self.is_lll_reduced([list(map(float, v)) for v in reduced], delta=0.75)
+        # 3 a_1 + 5 a_2 - 7 a_3 = 0 for numbers of 100 bits, past the precision of floats
+        x, y = 2**100 + 12345, 2**99 + 678
+        a = [7 * x, 7 * y, 3 * x + 5 * y]
+        basis = [[int(i == j) for j in range(3)] + [10**6 * a[i]] for i in range(3)]
+        self.assertIn(lll_reduction(basis, exact=True)[0], ([3, 5, -7, 0], [-3, -5, 7, 0]))
+        with self.assertRaises(ValueError):
+            lll_reduction([[1, 2], [2, 4]], exact=True)
+
 
 if __name__ == "__main__":
     unittest.main()
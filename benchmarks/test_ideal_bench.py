@@ -0,0 +1,129 @@
+import pytest
+
+from polynomials.grid_solver import grid_solutions
+from polynomials.groebner_cache import configure_groebner_cache, get_groebner_cache
+from polynomials.ideal import Ideal
+from polynomials.polynomial import Polynomial, division_algorithm
+from polynomials.reducer import Reducer
+
+
+def _ideal() -> Ideal:
+    return Ideal(Polynomial("x^2 + y^2 + z^2 - 1"), Polynomial("x - y"), Polynomial("y - z^2"))
+
+
+def _targets(n: int):
+    return [Polynomial(f"x^{i % 7}y^{i % 5}z^{i % 3} + {i}xy - 3y^3 + z") for i in range(n)]
+
+
+@pytest.mark.parametrize("n", [100, 1000])
+def test_normal_forms_benchmark(benchmark, n):
+    ideal = _ideal()
+    polys = _targets(n)
+    ideal.reducer()  # prepare outside the timed code
+
+    res = benchmark(lambda: ideal.normal_forms(polys))
+    assert len(res) == n
+
+
+@pytest.mark.parametrize("n", [100])
+def test_division_algorithm_against_basis_benchmark(benchmark, n):
+    G = _ideal().groebner_basis()
+    polys = _targets(n)
+
+    res = benchmark(lambda: [division_algorithm(p, *G)[1] for p in polys])
+    assert len(res) == n
+
+
+def _staircase(n: int):
+    # n binomials with pairwise distinct leading monomials of degree 12 in x, y, z, w
+    monomials = [(a, b, c, 12 - a - b - c) for a in range(13) for b in range(13 - a) for c in range(13 - a - b)]
+    return [Polynomial(f"x^{a}y^{b}z^{c}w^{d} - x") for a, b, c, d in monomials[:n]]
+
+
+@pytest.mark.parametrize("n", [300])
+def test_reduce_large_basis_benchmark(benchmark, n):
+    reducer = Reducer(_staircase(n))
+    polys = [Polynomial(f"x^{i % 9}y^{i % 4}z^{(i * 7) % 11}w^{i % 13} + xw") for i in range(100)]
+
+    res = benchmark(lambda: reducer.reduce_many(polys))
+    assert len(res) == 100
+
+
+@pytest.mark.parametrize("n", [100])
+def test_minimize_benchmark(benchmark, n):
+    G = _staircase(n)
+
+    res = benchmark(lambda: Ideal.minimize(G))
+    assert len(res) == n
+
+
+@pytest.mark.parametrize("n", [100])
+def test_interreduce_benchmark(benchmark, n):
+    G = _staircase(n)
+
+    res = benchmark(lambda: Ideal.reduce(G))
+    assert len(res) == n
+
+
+@pytest.mark.parametrize("n", [200])
+def test_s_polynomial_benchmark(benchmark, n):
+    G = _ideal().polynomials
+    pairs = [(p, G[i % len(G)]) for i, p in enumerate(_targets(n))]
+
+    res = benchmark(lambda: [Ideal.s_polynomial(p, q) for p, q in pairs])
+    assert len(res) == n
+
+
+_ZERO_DIMENSIONAL = {
+    "katsura3": ["a + 2b + 2c + 2d - 1", "a^2 + 2b^2 + 2c^2 + 2d^2 - a", "2ab + 2bc + 2cd - b", "b^2 + 2ac + 2bd - c"],
+    "cubic3": ["x^3 + y^2 - z - 1", "y^3 + z^2 - x - 2", "z^3 + x^2 - y - 3"],
+}
+
+
+@pytest.fixture
+def no_groebner_cache():
+    previous = get_groebner_cache()
+    configure_groebner_cache(maxsize=0)
+    yield
+    configure_groebner_cache(previous.maxsize, previous.cache_dir)
+
+
+@pytest.mark.parametrize("system", sorted(_ZERO_DIMENSIONAL))
+@pytest.mark.parametrize("path", ["fglm", "walk", "lex_buchberger"])
+def test_lex_basis_benchmark(benchmark, no_groebner_cache, system, path):
+    ideal = Ideal(*(Polynomial(s) for s in _ZERO_DIMENSIONAL[system]))
+    compute = {
+        "fglm": ideal.lex_basis,
+        "walk": lambda: ideal.walk_basis("lex"),
+        "lex_buchberger": lambda: ideal.groebner_basis("lex"),
+    }[path]
+
+    res = benchmark(compute)
+    assert res == ideal.groebner_basis("lex")
+
+
+@pytest.mark.parametrize("system", sorted(_ZERO_DIMENSIONAL))
+@pytest.mark.parametrize("method", ["lex", "rur"])
+def test_solve_system_benchmark(benchmark, system, method):
+    ideal = Ideal(*(Polynomial(s) for s in _ZERO_DIMENSIONAL[system]))
+    ideal.lex_basis()  # bases are shared, time the solving
+
+    res = benchmark(lambda: ideal.solve_system_structured(method))
+    assert len(res) == ideal.degree()
+
+
+@pytest.mark.parametrize("system", sorted(_ZERO_DIMENSIONAL))
+def test_solve_numeric_benchmark(benchmark, system):
+    ideal = Ideal(*(Polynomial(s) for s in _ZERO_DIMENSIONAL[system]))
+
+    res = benchmark(ideal.solve_numeric)
+    assert len(res) == ideal.degree()
+
+
+@pytest.mark.parametrize("processes", [1, None])
+def test_grid_solutions_benchmark(benchmark, processes):
+    # 31^4 (about 920k) points in chunks
+    gens = [Polynomial("x^2 + y^2 + z^2 + w^2 - 1", 31), Polynomial("xyz - w", 31)]
+
+    res = benchmark(lambda: grid_solutions(gens, processes=processes))
+    assert len(res) == 930
@@ -1,6 +1,9 @@
+import random
+
 import pytest
 
-from polynomials.polynomial import Polynomial, division_algorithm
+from polynomials import univariate
+from polynomials.polynomial import NonFactor, Polynomial, divexact, division_algorithm, gcd
 
 
 def _rand_poly(deg: int, var: str = "x") -> Polynomial:
@@ -54,11 +57,21 @@ def test_add_benchmark(benchmark, deg):
     assert isinstance(res, Polynomial)
 
 
-@pytest.mark.parametrize("deg", [10, 50])
+def _rand_poly_mod_p(deg: int, p: int = 2**31 - 1) -> Polynomial:
+    rng = random.Random(deg)
+    return univariate.from_dense([rng.randrange(p) for _ in range(deg)] + [1], "x", p)
+
+
+@pytest.mark.parametrize("deg", [10, 50, 1000, 10000])
 def test_division_algorithm_like_benchmark(benchmark, deg):
     # Use simple division by a lower-degree polynomial; indirectly exercises internal normalization
-    f = _rand_poly(deg)
-    g = _rand_poly(max(1, deg // 2))
+    # from degree 1000 on over F_p: exact quotients over Q leave the float range there
+    if deg < 1000:
+        f = _rand_poly(deg)
+        g = _rand_poly(max(1, deg // 2))
+    else:
+        f = _rand_poly_mod_p(deg)
+        g = _rand_poly_mod_p(deg // 2)
 
     def do_mod():
         return f % g
@@ -107,3 +120,124 @@ def test_division_multi_divisors_benchmark(benchmark, k, deg):
 
     res = benchmark(do_division)
     assert isinstance(res, Polynomial)
+
+
+def _rand_multivariate(nvars: int, terms: int, degree: int, seed: int) -> Polynomial:
+    # deterministic sparse polynomial with small integer coefficients in x0..x{nvars-1}
+    rng = random.Random(seed)
+    names = tuple("x%d" % i for i in range(nvars))
+    p = Polynomial(0)
+    for _ in range(terms):
+        exps = [0] * nvars
+        for _ in range(rng.randint(0, degree)):
+            exps[rng.randrange(nvars)] += 1
+        p = p + Polynomial.from_term(float(rng.choice([-3, -2, -1, 1, 2, 3])), names, exps)
+    return p
+
+
+@pytest.mark.parametrize("nvars", [3, 4, 6])
+def test_multivariate_gcd_benchmark(benchmark, nvars):
+    # hundreds of terms: g * a against g * b
+    g = _rand_multivariate(nvars, 15, 5, 1)
+    f, h = g * _rand_multivariate(nvars, 15, 5, 2), g * _rand_multivariate(nvars, 15, 5, 3)
+
+    res = benchmark(lambda: gcd(f, h))
+    assert len(res.terms) >= len(g.terms)
+
+
+@pytest.mark.parametrize("divisor", [True, False])
+@pytest.mark.parametrize("method", ["truediv", "divexact"])
+def test_exact_division_benchmark(benchmark, method, divisor):
+    # a product of two 3-variable factors divided by one of them, or off by one term
+    g = _rand_multivariate(3, 15, 5, 1)
+    f = g * _rand_multivariate(3, 15, 5, 2) + (0 if divisor else 1)
+    divide = (lambda: f / g) if method == "truediv" else (lambda: divexact(f, g))
+
+    def run():
+        try:
+            return divide()
+        except NonFactor:
+            return None
+
+    res = benchmark(run)
+    assert (res is not None) == divisor
+
+
+@pytest.mark.parametrize("bits", [8, 64, 256])
+@pytest.mark.parametrize("deg", [20, 100, 400])
+@pytest.mark.parametrize("method", ["subresultant", "modular"])
+def test_univariate_gcd_benchmark(benchmark, method, deg, bits):
+    # scaling in degree and coefficient size: g * a against g * b, deg(g) = deg / 2
+    if method == "subresultant" and deg * bits > 1600:
+        pytest.skip("coefficient growth makes the subresultant sequence impractical here")
+    rng = random.Random(deg + bits)
+
+    def rand(n):
+        return [rng.randint(-(2**bits), 2**bits) for _ in range(n)] + [1]
+
+    g = rand(deg // 2)
+    a, b = univariate.mul(g, rand(deg // 2)), univariate.mul(g, rand(deg // 2))
+    gcd_fn = univariate.subresultant_gcd if method == "subresultant" else univariate.modular_gcd
+
+    res = benchmark(lambda: gcd_fn(a, b))
+    assert len(res) >= len(g)
+
+
+@pytest.mark.parametrize("deg", [1000, 10000])
+@pytest.mark.parametrize("method", ["euclid", "half_gcd"])
+def test_gcd_mod_p_benchmark(benchmark, monkeypatch, method, deg):
+    # coprime dense inputs over F_p, the size of the gcds in finite field construction
+    if method == "euclid":
+        if deg > 1000:
+            pytest.skip("quadratic")
+        monkeypatch.setattr(univariate, "HALF_GCD_DEGREE", deg + 1)
+    p = 2**31 - 1
+    rng = random.Random(deg)
+    a = [rng.randrange(p) for _ in range(deg)] + [1]
+    b = [rng.randrange(p) for _ in range(deg - 1)] + [1]
+
+    res = benchmark.pedantic(univariate.gcd_mod, args=(a, b, p), rounds=1)
+    assert res == [1]
+
+
+@pytest.mark.parametrize("deg", [16, 256, 2048])
+def test_powmod_benchmark(benchmark, deg):
+    # x^(p^2) mod h over F_p, the Frobenius power behind irreducibility tests
+    p = 2**31 - 1
+    rng = random.Random(deg)
+    h = [rng.randrange(p) for _ in range(deg)] + [1]
+
+    res = benchmark.pedantic(univariate.powmod_mod, args=([0, 1], p**2, h, p), rounds=1)
+    assert len(res) <= deg
+
+
+@pytest.mark.parametrize("p,i", [(2, 10), (3, 6), (101, 2)])
+def test_zech_table_benchmark(benchmark, p, i):
+    # q - 1 products and reductions by the same modulus h
+    from algebra.construct_finite_field import ZechLogarithmTable
+
+    random.seed(p * i)
+    res = benchmark.pedantic(ZechLogarithmTable, args=(p, i), rounds=1)
+    assert len(res.poly_to_power) == p**i - 1
+
+
+@pytest.mark.parametrize("p,deg", [(2, 200), (101, 100), (2**31 - 1, 100)])
+def test_factor_mod_p_benchmark(benchmark, p, deg):
+    # dense random polynomials: a few small factors and one or two large ones
+    from polynomials.factorization import factor_mod
+
+    rng = random.Random(deg)
+    f = [rng.randrange(p) for _ in range(deg)] + [1]
+
+    lc, factors = benchmark.pedantic(factor_mod, args=(f, p), rounds=1)
+    assert sum((len(g) - 1) * e for g, e in factors) == deg
+
+
+@pytest.mark.parametrize("n", [60, 120])
+def test_factor_integer_benchmark(benchmark, n):
+    # x^n - 1: the cyclotomic factors, many more factors mod p, recombined by the lattice
+    from polynomials.factorization import factor_integer
+
+    f = [-1] + [0] * (n - 1) + [1]
+    c, factors = benchmark.pedantic(factor_integer, args=(f,), rounds=1)
+    assert len(factors) == sum(1 for d in range(1, n + 1) if n % d == 0)
@@ -15,22 +15,29 @@ Key Classes:
 
 Functions:
     division_algorithm: Multivariate polynomial division
+    divexact: Exact division of a polynomial by one of its divisors
     gcd: Greatest common divisor of polynomials
     lcm: Least common multiple of polynomials
+    xgcd, invmod: Extended gcd and inverses modulo a univariate polynomial
+    powmod: Powers modulo a polynomial
 """
 
 from .formulas import solve
 from .ideal import Ideal
 from .orderings import graded_lex, order_grevlex, order_lex
-from .polynomial import NonFactor, Polynomial, division_algorithm, gcd, lcm
+from .polynomial import NonFactor, Polynomial, divexact, division_algorithm, gcd, invmod, lcm, powmod, xgcd
 
 __all__ = [
     "Polynomial",
     "NonFactor",
     "Ideal",
     "division_algorithm",
+    "divexact",
     "gcd",
     "lcm",
+    "xgcd",
+    "invmod",
+    "powmod",
     "solve",
     "order_lex",
     "graded_lex",
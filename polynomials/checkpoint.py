@@ -0,0 +1,77 @@
+"""
+Checkpoints of Groebner basis runs.
+
+A checkpoint is a JSON file holding an open Buchberger run (polynomials.groebner.GroebnerState:
+the basis so far, the active elements, the pending pairs and the counters) together with the
+variable names and the fingerprint of the generators it belongs to. Ideal.groebner_basis(order,
+checkpoint=path) writes one every checkpoint_interval seconds, when the run is stopped by its
+ExecutionContext and when it finishes; Ideal.groebner_basis(resume_from=path) continues from it,
+on this machine or another one.
+"""
+
+import json
+import os
+import time
+from typing import Sequence, Tuple
+
+from polynomials.groebner import GroebnerState
+
+__all__ = [
+    "Checkpointer",
+    "load_checkpoint",
+    "save_checkpoint",
+]
+
+_FORMAT = 1
+
+
+def save_checkpoint(path: str, state: GroebnerState, variables: Sequence[str], fingerprint: str) -> None:
+    """
+    writes the state to path atomically (a preempted write leaves the previous checkpoint intact)
+    """
+    data = {
+        "format": _FORMAT,
+        "fingerprint": fingerprint,
+        "variables": list(variables),
+        "state": state.to_dict(),
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: str) -> Tuple[Tuple[str, ...], str, GroebnerState]:
+    """
+    returns (variable names, fingerprint, state) read from path
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("format") != _FORMAT:
+        raise ValueError("unsupported checkpoint format in %s" % path)
+    return tuple(data["variables"]), data["fingerprint"], GroebnerState.from_dict(data["state"])
+
+
+class Checkpointer:
+    """
+    on_pair hook for GroebnerState.complete saving the state at most every interval seconds
+    """
+
+    def __init__(self, path: str, variables: Sequence[str], fingerprint: str, interval: float = 60.0) -> None:
+        self.path = path
+        self.variables = tuple(variables)
+        self.fingerprint = fingerprint
+        self.interval = interval
+        self.last = time.monotonic()
+        self.saves = 0
+
+    def __call__(self, state: GroebnerState) -> None:
+        if time.monotonic() - self.last >= self.interval:
+            self.save(state)
+
+    def save(self, state: GroebnerState) -> None:
+        save_checkpoint(self.path, state, self.variables, self.fingerprint)
+        self.last = time.monotonic()
+        self.saves += 1
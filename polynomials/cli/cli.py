@@ -169,6 +169,13 @@ def main() -> int:
         default="lex",
         help="Monomial order to use (default: lex)",
     )
+    groebner_parser.add_argument(
+        "--engine",
+        choices=["legacy", "exact"],
+        default="legacy",
+        help="legacy: original implementation; exact: reduced basis with exact arithmetic (default: legacy)",
+    )
+    groebner_parser.add_argument("--stats", action="store_true", help="Also print computation statistics as JSON")
 
     # Subcommand: solve-system (structured)
     solve_sys_parser = subparsers.add_parser(
@@ -178,6 +185,18 @@ def main() -> int:
     solve_sys_parser.add_argument(
         "polys", nargs="+", type=str, help="List of polynomials as strings"
     )
+    solve_sys_parser.add_argument(
+        "-p",
+        type=int,
+        default=0,
+        help="Prime characteristic p; solutions in F_p^n from the lex basis and root finding, "
+        "by grid search for small fields (default: 0)",
+    )
+    solve_sys_parser.add_argument(
+        "--numeric",
+        action="store_true",
+        help="Approximate the solutions of a square system by homotopy continuation (needs numpy)",
+    )
 
     try:
         args = parser.parse_args(argv)
@@ -319,7 +338,12 @@ def main() -> int:
 
             polys = [Polynomial(p) for p in args.polys]
             ideal = Ideal(*polys)
-            G = ideal.groebner_basis()
+            engine_order = args.order if args.engine == "exact" else None
+            report = None
+            if args.stats:
+                G, report = ideal.groebner_basis(engine_order, stats=True)
+            else:
+                G = ideal.groebner_basis(engine_order)
             if args.json:
                 payload = {
                     "command": "groebner",
@@ -329,19 +353,34 @@ def main() -> int:
                     "basis": [str(g) for g in G],
                     "count": len(G),
                 }
+                if report is not None:
+                    payload["stats"] = report.as_dict()
                 print(json.dumps(payload))
             else:
                 print("Groebner basis:")
                 for g in G:
                     print(f"  {g}")
+                if report is not None:
+                    print(json.dumps(report.as_dict()))
 
         elif args.command == "solve-system":
             from polynomials.ideal import Ideal
             from polynomials.polynomial import Polynomial
 
-            polys = [Polynomial(p) for p in args.polys]
+            polys = [Polynomial(p, args.p) for p in args.polys]
             ideal = Ideal(*polys)
-            solutions = ideal.solve_system_structured()
+            if args.numeric:
+                try:
+                    solutions = ideal.solve_numeric()
+                except ImportError:
+                    print(
+                        "Error: Numeric solving requires optional dependencies. "
+                        "Install extras: pip install 'PolynomialCalculator[algebra]'",
+                        file=sys.stderr,
+                    )
+                    return 1
+            else:
+                solutions = ideal.solve_system_structured()
             if args.json:
                 if solutions is None:
                     payload = {
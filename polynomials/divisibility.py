@@ -0,0 +1,150 @@
+"""
+Exact division and divisibility tests.
+
+Polynomial.__truediv__ runs the whole division algorithm and only looks at the remainder at the
+end. divide_exact is for the callers that expect b to divide a (lcm, S-polynomials) or only ask
+whether it does: it gives up at the first sign that b is not a divisor, and cheap necessary
+conditions are checked before any term is divided:
+
+- for every variable the lowest and highest powers in b are at most those in a, as the lowest
+  and highest parts of a product are the products of the lowest and highest parts;
+- b(x_k, r) divides a(x_k, r) modulo a word sized prime, for a random point r of the other
+  variables and x_k the variable of largest degree in b: a univariate Newton division
+  (polynomials.univariate.fast_divmod_mod) on images with small coefficients.
+
+The quotient then comes from the sparse exact division of polynomials.multivariate_gcd, which
+stops at the first term whose monomial is not divisible by the leading monomial of b, whose
+coefficient does not divide over Z, or which lies below the smallest monomial the quotient can
+have. Univariate inputs use dense division instead.
+
+Over Q both polynomials are scaled to integer polynomials and b to its primitive part: by
+Gauss's lemma b divides a over Q exactly when the primitive part divides the scaled a over Z, so
+the coefficient checks and the images modulo the prime stay valid.
+
+Polynomials are exact sparse maps {exponent tuple: coefficient} as in polynomials.groebner.
+"""
+
+import math
+import random
+from fractions import Fraction
+from typing import List, Optional, Tuple
+
+from polynomials.groebner import Terms
+from polynomials.multivariate_gcd import exact_divide
+from polynomials.univariate import NEWTON_DIVISION_LENGTH, Dense, exact_quotient, fast_divmod, fast_divmod_mod, trim
+
+__all__ = [
+    "IMAGE_PRIME",
+    "divide_exact",
+]
+
+IMAGE_PRIME = 2**31 - 1  # the images over Z are taken modulo this prime
+
+_random = random.Random()
+
+
+def _degree_bounds(a: Terms, nvars: int) -> List[Tuple[int, int]]:
+    return [(min(m[i] for m in a), max(m[i] for m in a)) for i in range(nvars)]
+
+
+def _support_divides(a: Terms, b: Terms, nvars: int) -> bool:
+    """the lowest and highest powers of every variable in b are at most those in a"""
+    for (low_a, high_a), (low_b, high_b) in zip(_degree_bounds(a, nvars), _degree_bounds(b, nvars)):
+        if low_b > low_a or high_b > high_a or high_a - high_b < low_a - low_b:
+            return False
+    return True
+
+
+def _image(a: Terms, k: int, point: List[int], p: int) -> Dense:
+    """a mod p with every variable but x_k replaced by the value in point, dense in x_k"""
+    dense = [0] * (max(m[k] for m in a) + 1)
+    for m, c in a.items():
+        v = c % p
+        for i, e in enumerate(m):
+            if e and i != k:
+                v = v * pow(point[i], e, p) % p
+        dense[m[k]] = (dense[m[k]] + v) % p
+    return trim(dense)
+
+
+def _image_divides(a: Terms, b: Terms, nvars: int, p: int) -> bool:
+    """
+    False if the images of a and b at a random point modulo p show that b does not divide a
+    (True when the point tells nothing: b vanishes there)
+    """
+    k = max(range(nvars), key=lambda i: max(m[i] for m in b))
+    point = [_random.randrange(p) for _ in range(nvars)]
+    ib = _image(b, k, point, p)
+    if not ib:
+        return True
+    ia = _image(a, k, point, p)
+    return not ia or not fast_divmod_mod(ia, ib, p)[1]
+
+
+def _dense(a: Terms) -> Dense:
+    dense = [0] * (max(m[0] for m in a) + 1)
+    for (e,), c in a.items():
+        dense[e] = c
+    return dense
+
+
+def _sparse(a: Dense) -> Terms:
+    return {(e,): c for e, c in enumerate(a) if c}
+
+
+def _divide_univariate(a: Terms, b: Terms, p: int) -> Optional[Terms]:
+    da, db = _dense(a), _dense(b)
+    if p:
+        q, r = fast_divmod_mod(da, db, p)
+        return None if r else _sparse(q)
+    if db[-1] in (1, -1) and min(len(da) - len(db) + 1, len(db) - 1) >= NEWTON_DIVISION_LENGTH:
+        q, r = fast_divmod(da, db)
+        return None if r else _sparse(q)
+    quotient = exact_quotient(da, db)
+    return None if quotient is None else _sparse(quotient)
+
+
+def _integral(a: Terms) -> Tuple[Terms, int]:
+    """a times the lcm d of its denominators, and d"""
+    d = 1
+    for c in a.values():
+        d = d * c.denominator // math.gcd(d, c.denominator)
+    return {m: int(c * d) for m, c in a.items()}, d
+
+
+def divide_exact(a: Terms, b: Terms, nvars: int, char: int = 0) -> Optional[Terms]:
+    """
+    returns a / b if b divides a (over F_char, over Q with Fraction coefficients for char 0),
+    else None
+    """
+    if not b:
+        raise ZeroDivisionError("division by zero")
+    if not a:
+        return {}
+    if nvars == 0:
+        c, d = a[()], b[()]
+        return {(): c * pow(d, -1, char) % char if char else Fraction(c) / d}
+    if not _support_divides(a, b, nvars):
+        return None
+    if char:
+        if nvars == 1:
+            return _divide_univariate(a, b, char)
+        if not _image_divides(a, b, nvars, char):
+            return None
+        return exact_divide(a, b, char)
+    a, da = _integral(a)
+    b, db = _integral(b)
+    content = 0
+    for c in b.values():
+        content = math.gcd(content, c)
+    if b[max(b)] < 0:
+        content = -content
+    b = {m: c // content for m, c in b.items()}
+    if not _image_divides(a, b, nvars, IMAGE_PRIME):
+        return None
+    q = _divide_univariate(a, b, 0) if nvars == 1 else exact_divide(a, b)
+    if q is None:
+        return None
+    # a / da = q b / content * db
+    scale = Fraction(db, content * da)
+    return {m: c * scale for m, c in q.items()}
@@ -0,0 +1,136 @@
+"""
+Cooperative execution control for long computations.
+
+An ExecutionContext is passed to Ideal.groebner_basis, Ideal.lex_basis, division_algorithm
+and gcd_singlevariate. They call check() before every step (a critical pair, a division step,
+a remainder) and it raises Incomplete when the deadline has passed, the CancellationToken was
+cancelled or the step budget is spent. Incomplete carries why it stopped, the progress made
+and the partial result, so a capped computation is never mistaken for a finished one.
+
+    context = ExecutionContext(timeout=0.5, on_progress=print)
+    try:
+        basis = ideal.groebner_basis("grevlex", context=context)
+    except Incomplete as e:
+        print(e.reason, e.progress.pairs_processed, e.progress.basis_size)
+"""
+
+import threading
+import time
+from collections import namedtuple
+from typing import Any, Callable, Optional
+
+__all__ = [
+    "CancellationToken",
+    "ExecutionContext",
+    "Incomplete",
+    "Progress",
+    "DEADLINE",
+    "CANCELLED",
+    "STEP_LIMIT",
+    "STALLED",
+]
+
+# reasons carried by Incomplete
+DEADLINE = "deadline"
+CANCELLED = "cancelled"
+STEP_LIMIT = "step limit"
+STALLED = "stalled"
+
+Progress = namedtuple("Progress", ["steps", "pairs_processed", "basis_size", "max_degree", "elapsed"])
+Progress.__doc__ = "steps taken, critical pairs processed, current basis size, largest degree reached, seconds elapsed"
+
+
+class Incomplete(RuntimeError):
+    """
+    raised when a computation stops before finishing; reason is one of DEADLINE, CANCELLED,
+    STEP_LIMIT or STALLED, partial the state reached (None if there is nothing meaningful)
+    """
+
+    def __init__(self, reason: str, progress: Progress, partial: Any = None) -> None:
+        super().__init__("computation incomplete (%s) after %d steps" % (reason, progress.steps))
+        self.reason = reason
+        self.progress = progress
+        self.partial = partial
+
+
+class CancellationToken:
+    """
+    thread-safe flag another thread (or a progress callback) sets to stop a computation
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class ExecutionContext:
+    """
+    deadline (time.monotonic() value) or timeout (seconds from now), cancellation token,
+    progress callback and step budget for one computation (or several, sharing the budget)
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        token: Optional[CancellationToken] = None,
+        on_progress: Optional[Callable[[Progress], None]] = None,
+        max_steps: Optional[int] = None,
+    ) -> None:
+        self.started = time.monotonic()
+        if timeout is not None:
+            deadline = self.started + timeout if deadline is None else min(deadline, self.started + timeout)
+        self.deadline = deadline
+        self.token = token
+        self.on_progress = on_progress
+        self.max_steps = max_steps
+        self.steps = 0
+        self.pairs_processed = 0
+        self.basis_size = 0
+        self.max_degree = 0
+
+    def progress(self) -> Progress:
+        return Progress(
+            self.steps, self.pairs_processed, self.basis_size, self.max_degree, time.monotonic() - self.started
+        )
+
+    def check(
+        self,
+        partial: Any = None,
+        pairs_processed: int = 0,
+        basis_size: Optional[int] = None,
+        degree: Optional[int] = None,
+    ) -> None:
+        """
+        raises Incomplete if the next step must not be taken, otherwise counts it and reports
+        progress; partial is a callable returning the partial result, evaluated only when stopping
+        """
+        reason = None
+        if self.token is not None and self.token.cancelled:
+            reason = CANCELLED
+        elif self.deadline is not None and time.monotonic() >= self.deadline:
+            reason = DEADLINE
+        elif self.max_steps is not None and self.steps >= self.max_steps:
+            reason = STEP_LIMIT
+        if reason is not None:
+            self.stop(reason, partial)
+        self.steps += 1
+        self.pairs_processed += pairs_processed
+        if basis_size is not None:
+            self.basis_size = basis_size
+        if degree is not None and degree > self.max_degree:
+            self.max_degree = degree
+        if self.on_progress is not None:
+            self.on_progress(self.progress())
+
+    def stop(self, reason: str, partial: Any = None) -> None:
+        """
+        raises Incomplete with the current progress
+        """
+        raise Incomplete(reason, self.progress(), partial() if callable(partial) else partial)
@@ -0,0 +1,584 @@
+"""
+Factorization of univariate polynomials over F_p and Z.
+
+factor_mod runs the three stages of Cantor and Zassenhaus:
+
+- square-free factorization (Yun): gcd(f, f') holds the repeated factors, and the quotients of
+  successive gcds give the factors of each multiplicity. Over F_p a polynomial whose derivative
+  vanishes is g(x^p) = g(x)^p (a^p = a in F_p), so what is left at the end is taken apart again
+  after a p-th root.
+- distinct-degree factorization: x^(p^d) - x is the product of the monic irreducibles whose
+  degree divides d, so once the factors of degree below d are divided out, gcd(x^(p^d) - x, f)
+  is the product of the factors of degree d. x^(p^d) only ever exists modulo f, raised to the
+  p-th power once per degree by the Frobenius matrix of a Modulus, and the gcds are taken for
+  blocks of degrees at once: the product of the x^(p^d) - x is coprime to f exactly when each
+  of them is, and only blocks with a common factor are gone through degree by degree. Past
+  half the remaining degree what is left is irreducible.
+- equal-degree splitting: for f a product of irreducibles of degree d and a random a,
+  gcd(a^((p^d - 1) / 2) - 1, f), or gcd(a + a^2 + ... + a^(2^(d - 1)), f) for p = 2, is a proper
+  factor with probability about 1/2; the two parts are split recursively.
+
+Stopping the distinct-degree loop at the first nontrivial gcd gives Ben-Or's irreducibility test
+(is_irreducible_mod). Random polynomials mostly have small factors, so they are rejected after
+a few steps; the Frobenius matrix is only built for candidates that pass the first ones.
+roots_mod splits gcd(x^p - x, f), the product of the linear factors.
+
+Over Z (factor_integer), after the square-free factorization, a square-free g is factored
+modulo a prime p that keeps it square-free and does not divide its leading coefficient; of
+PRIME_TRIALS such primes the one with the fewest factors is used, and when the factor degrees
+modulo them have no subset sum in common but 0 and deg g, g is irreducible. The factors mod p
+are Hensel-lifted to p^a beyond twice lc(g) times Mignotte's bound on the coefficients of the
+factors of g, so that every factor over Z is lc(g) times the product of some of the lifted
+factors, reduced into (-p^a / 2, p^a / 2]. Up to ZASSENHAUS_FACTORS lifted factors, the subsets
+are tried by size (Zassenhaus). Beyond, which combinations make factors is found by lattice
+reduction (van Hoeij): the power sums of the roots of the lifted factors must add up to small
+integers for the true combinations, and exact LLL (algebra.lll.lll_reduction) on the lattice of
+the combinations with their power sums cuts it down to the span of the true ones, in time
+polynomial in the number of factors.
+
+Polynomials are dense coefficient lists over F_p or Z as in polynomials.univariate.
+"""
+
+import itertools
+import math
+import random
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from algebra.lll import lll_reduction
+from polynomials.modulus import Modulus
+from polynomials.univariate import (
+    Dense,
+    add_mod,
+    exact_quotient,
+    fast_divmod_mod,
+    from_dense,
+    gcd_integer,
+    gcd_mod,
+    monic_mod,
+    mul_mod,
+    primitive,
+    sub_mod,
+    trim,
+    xgcd_mod,
+)
+
+__all__ = [
+    "Factors",
+    "GCD_BLOCK",
+    "LATTICE_BITS",
+    "PRIME_TRIALS",
+    "ZASSENHAUS_FACTORS",
+    "distinct_degree_mod",
+    "equal_degree_mod",
+    "factor_integer",
+    "factor_mod",
+    "hensel_lift",
+    "is_irreducible_mod",
+    "roots_mod",
+    "squarefree_mod",
+]
+
+Factors = List[Tuple[Dense, int]]  # (monic factor, multiplicity or degree)
+
+# distinct_degree_mod and is_irreducible_mod take one gcd per this many degrees
+GCD_BLOCK = 8
+
+# factor_integer factors modulo up to this many primes and keeps the one with the fewest factors
+PRIME_TRIALS = 5
+
+# up to this many factors mod p, their combinations are tried one by one; the lattice beyond
+ZASSENHAUS_FACTORS = 8
+
+# bits of each power sum kept in the recombination lattice (doubled when they are not enough)
+LATTICE_BITS = 64
+
+_random = random.Random()
+
+_X = [0, 1]
+
+
+def _modulus(f: Dense, p: int) -> Modulus:
+    return Modulus(from_dense(f, "x", p))
+
+
+def _quotient(a: Dense, b: Dense, p: int) -> Dense:
+    return fast_divmod_mod(a, b, p)[0]
+
+
+def _derivative(f: Dense, p: int) -> Dense:
+    return trim([k * c % p for k, c in enumerate(f)][1:])
+
+
+def squarefree_mod(f: Dense, p: int) -> Factors:
+    """
+    the square-free factorization of a monic f: pairwise coprime square-free monic (g, e)
+    with f the product of the g^e
+    """
+    out: Factors = []
+    if len(f) <= 1:
+        return out
+    c = gcd_mod(f, _derivative(f, p), p)
+    w = _quotient(f, c, p)
+    e = 1
+    while len(w) > 1:
+        y = gcd_mod(w, c, p)
+        z = _quotient(w, y, p)
+        if len(z) > 1:
+            out.append((z, e))
+        e += 1
+        w = y
+        c = _quotient(c, y, p)
+    if len(c) > 1:
+        # only powers of x^p are left: c = c[::p](x)^p
+        out.extend((g, k * p) for g, k in squarefree_mod(c[::p], p))
+    return out
+
+
+def _frobenius(modulus: Modulus, p: int) -> Callable[[Dense], Dense]:
+    """a -> a^p mod h: by the Frobenius matrix of the modulus, squaring for p = 2"""
+    if p == 2:
+        return modulus.sqrmod_dense
+    return modulus.frobenius_dense
+
+
+def distinct_degree_mod(f: Dense, p: int) -> Factors:
+    """
+    for a square-free monic f, the pairs (g, d) with g the product of the irreducible factors
+    of degree d of f
+    """
+    out: Factors = []
+    if len(f) <= 2:
+        return [(f, 1)] if len(f) == 2 else out
+    # x^(p^d) stays reduced modulo the whole f, the gcds are taken with what is left of it
+    modulus = _modulus(f, p)
+    frobenius = _frobenius(modulus, p)
+    x_power = _X
+    d = 0
+    while 2 * (d + 1) <= len(f) - 1:
+        block = []
+        product = [1]
+        while len(block) < GCD_BLOCK and 2 * (d + 1) <= len(f) - 1:
+            d += 1
+            x_power = frobenius(x_power)
+            block.append((d, x_power))
+            product = modulus.mulmod_dense(product, sub_mod(x_power, _X, p))
+        g = gcd_mod(product, f, p)
+        if len(g) == 1:
+            continue
+        f = _quotient(f, g, p)
+        for e, power in block:
+            h = gcd_mod(sub_mod(power, _X, p), g, p)
+            if len(h) > 1:
+                out.append((h, e))
+                g = _quotient(g, h, p)
+                if len(g) == 1:
+                    break
+    if len(f) > 1:
+        out.append((f, len(f) - 1))
+    return out
+
+
+def _random_element(n: int, p: int) -> Dense:
+    while True:
+        a = trim([_random.randrange(p) for _ in range(n)])
+        if len(a) > 1:
+            return a
+
+
+def _split(f: Dense, d: int, p: int) -> Dense:
+    """a proper monic factor of f, a product of irreducibles of degree d"""
+    n = len(f) - 1
+    modulus = _modulus(f, p)
+    while True:
+        a = _random_element(n, p)
+        if p == 2:
+            b = t = a
+            for _ in range(d - 1):
+                t = modulus.sqrmod_dense(t)
+                b = add_mod(b, t, p)
+        else:
+            b = sub_mod(modulus.powmod_dense(a, (p**d - 1) // 2), [1], p)
+        g = gcd_mod(b, f, p)
+        if 1 < len(g) < len(f):
+            return g
+
+
+def equal_degree_mod(f: Dense, d: int, p: int) -> List[Dense]:
+    """the monic irreducible factors of f, a square-free monic product of irreducibles of degree d"""
+    out: List[Dense] = []
+    stack = [f]
+    while stack:
+        g = stack.pop()
+        if len(g) - 1 == d:
+            out.append(g)
+            continue
+        h = _split(g, d, p)
+        stack.extend((h, _quotient(g, h, p)))
+    return out
+
+
+def factor_mod(f: Dense, p: int) -> Tuple[int, Factors]:
+    """
+    (lc, [(g, e), ...]) with f = lc * product of g^e and the g distinct monic irreducibles over
+    F_p, sorted by degree and coefficients
+    raises ValueError for f = 0
+    """
+    if not f:
+        raise ValueError("the zero polynomial has no factorization")
+    lc = f[-1]
+    out: Factors = []
+    for g, e in squarefree_mod(monic_mod(f, p), p):
+        for h, d in distinct_degree_mod(g, p):
+            out.extend((k, e) for k in equal_degree_mod(h, d, p))
+    out.sort(key=lambda t: (len(t[0]), t[0][::-1]))
+    return lc, out
+
+
+def is_irreducible_mod(f: Dense, p: int) -> bool:
+    """whether f is irreducible over F_p (Ben-Or, with block gcds)"""
+    n = len(f) - 1
+    if n <= 0:
+        return False
+    f = monic_mod(f, p)
+    modulus = _modulus(f, p)
+    # most candidates fail the first steps: build the Frobenius matrix for the others only
+    frobenius = modulus.sqrmod_dense if p == 2 else partial(modulus.powmod_dense, e=p)
+    x_power = _X
+    product = [1]
+    for d in range(1, n // 2 + 1):
+        if d == 3:
+            frobenius = _frobenius(modulus, p)
+        x_power = frobenius(x_power)
+        product = modulus.mulmod_dense(product, sub_mod(x_power, _X, p))
+        if not product:
+            return False
+        if d <= 2 or d % GCD_BLOCK == 0 or d == n // 2:
+            if len(gcd_mod(product, f, p)) > 1:
+                return False
+            product = [1]
+    return True
+
+
+def roots_mod(f: Dense, p: int) -> List[int]:
+    """the distinct roots of f (not 0) in F_p, in increasing order"""
+    f = monic_mod(f, p)
+    if len(f) <= 1:
+        return []
+    if len(f) == 2:
+        return [-f[0] % p]
+    linear = gcd_mod(sub_mod(_modulus(f, p).powmod_dense(_X, p), _X, p), f, p)
+    if len(linear) <= 1:
+        return []
+    return sorted(-g[0] % p for g in equal_degree_mod(linear, 1, p))
+
+
+# over Z
+
+
+def _symmetric(a: Dense, m: int) -> Dense:
+    """coefficients mod m in (-m/2, m/2]"""
+    half = m // 2
+    return trim([c % m - m if c % m > half else c % m for c in a])
+
+
+def _product_mod(factors: List[Dense], m: int) -> Dense:
+    out = [1]
+    for g in factors:
+        out = mul_mod(out, g, m)
+    return out
+
+
+def _small_primes() -> Iterator[int]:
+    n = 2
+    while True:
+        if all(n % q for q in range(2, math.isqrt(n) + 1)):
+            yield n
+        n += 1
+
+
+def _choose_prime(g: Dense) -> Tuple[int, List[Dense], int]:
+    """
+    (p, monic factors of g mod p, subset degree mask): the prime with the fewest factors among
+    PRIME_TRIALS primes for which g stays square-free. Bit d of the mask is set when every prime
+    tried has a subset of factors of total degree d, the degrees a factor over Z can have.
+    """
+    best: Tuple[int, List[Dense]] = (0, [])
+    mask = -1
+    found = 0
+    for p in _small_primes():
+        if g[-1] % p == 0:
+            continue
+        image = [c % p for c in g]
+        if len(gcd_mod(image, _derivative(image, p), p)) > 1:
+            continue
+        factors = [h for h, _ in factor_mod(image, p)[1]]
+        degrees = 1
+        for h in factors:
+            degrees |= degrees << (len(h) - 1)
+        mask &= degrees
+        if not best[0] or len(factors) < len(best[1]):
+            best = (p, factors)
+        found += 1
+        if found == PRIME_TRIALS or len(factors) == 1 or mask == 1 | 1 << (len(g) - 1):
+            return best[0], best[1], mask
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def _hensel_step(f: Dense, g: Dense, h: Dense, s: Dense, t: Dense, m: int) -> Tuple[Dense, Dense, Dense, Dense]:
+    """
+    f = g h and s g + t h = 1 mod m, g and h monic, lifted to mod m^2 (von zur Gathen and
+    Gerhard, Modern Computer Algebra, Algorithm 15.10)
+    """
+    m2 = m * m
+    e = sub_mod(f, mul_mod(g, h, m2), m2)
+    q, r = fast_divmod_mod(mul_mod(s, e, m2), h, m2)
+    g = add_mod(g, add_mod(mul_mod(t, e, m2), mul_mod(q, g, m2), m2), m2)
+    h = add_mod(h, r, m2)
+    b = sub_mod(add_mod(mul_mod(s, g, m2), mul_mod(t, h, m2), m2), [1], m2)
+    c, d = fast_divmod_mod(mul_mod(s, b, m2), h, m2)
+    s = sub_mod(s, d, m2)
+    t = sub_mod(t, add_mod(mul_mod(t, b, m2), mul_mod(c, g, m2), m2), m2)
+    return g, h, s, t
+
+
+def _factor_tree(factors: List[Dense], p: int) -> List[Any]:
+    """[g, h, s, t, left, right] for the products g and h of the two halves, s g + t h = 1 mod p"""
+    if len(factors) == 1:
+        return []
+    left, right = factors[: len(factors) // 2], factors[len(factors) // 2 :]
+    g, h = _product_mod(left, p), _product_mod(right, p)
+    _, s, t = xgcd_mod(g, h, p)
+    return [g, h, s, t, _factor_tree(left, p), _factor_tree(right, p)]
+
+
+def _lift_tree(node: List[Any], f: Dense, m: int) -> None:
+    if node:
+        node[:4] = _hensel_step(f, *node[:4], m)
+        _lift_tree(node[4], node[0], m)
+        _lift_tree(node[5], node[1], m)
+
+
+def _leaves(node: List[Any]) -> List[Dense]:
+    out: List[Dense] = []
+    for k in (0, 1):
+        out.extend(_leaves(node[4 + k]) if node[4 + k] else [node[k]])
+    return out
+
+
+def hensel_lift(g: Dense, factors: List[Dense], p: int, bound: int) -> Tuple[List[Dense], int]:
+    """
+    (lifted factors, m): for g over Z and pairwise coprime monic factors with g = lc(g) times
+    their product mod p, monic factors mod m = p^(2^k) > bound with the same product mod m,
+    each congruent to its factor mod p (quadratic lifting along a binary tree of products)
+    """
+    if len(factors) == 1:
+        m = p
+        while m <= bound:
+            m *= m
+        return [monic_mod([c % m for c in g], m)], m
+    tree = _factor_tree(factors, p)
+    m = p
+    while m <= bound:
+        m2 = m * m
+        _lift_tree(tree, monic_mod([c % m2 for c in g], m2), m)
+        m = m2
+    return _leaves(tree), m
+
+
+def _candidate(g: Dense, subset: Sequence[Dense], m: int) -> Optional[Dense]:
+    """the primitive factor of g that lc(g) times the product of subset mod m is, or None"""
+    v = _symmetric([c * g[-1] for c in _product_mod(list(subset), m)], m)
+    if v[0] and g[0] % primitive(v)[0]:
+        return None
+    h = primitive(v)
+    return h if exact_quotient(g, h) is not None else None
+
+
+def _zassenhaus(g: Dense, lifted: List[Dense], m: int) -> List[Dense]:
+    """the irreducible factors of g from its lifted factors mod m, by trying subsets by size"""
+    out: List[Dense] = []
+    k = 1
+    while 2 * k <= len(lifted):
+        for subset in itertools.combinations(range(len(lifted)), k):
+            h = _candidate(g, [lifted[i] for i in subset], m)
+            if h is not None:
+                out.append(h)
+                g = exact_quotient(g, h)  # type: ignore[assignment]
+                lifted = [u for i, u in enumerate(lifted) if i not in subset]
+                break
+        else:
+            k += 1
+    out.append(g)
+    return out
+
+
+def _power_sums(u: Dense, count: int, m: int) -> List[int]:
+    """the sums of the j-th powers of the roots of monic u mod m, j = 1, ..., count (Newton identities)"""
+    n = len(u) - 1
+    c = [u[n - i] if i <= n else 0 for i in range(count + 1)]  # x^n + c_1 x^(n-1) + ...
+    sums = [0] * (count + 1)
+    for j in range(1, count + 1):
+        s = j * c[j]
+        for i in range(1, j):
+            s += c[i] * sums[j - i]
+        sums[j] = -s % m
+    return sums[1:]
+
+
+def _root_scale(g: Dense) -> int:
+    """L >= |lc(g) x| for every complex root x of g (Fujiwara's bound, rounded up to powers of 2)"""
+    n = len(g) - 1
+    lc = abs(g[-1])
+    top = 0
+    for i in range(1, n + 1):
+        if g[n - i]:
+            top = max(top, -(-(abs(g[n - i]) * lc ** (i - 1)).bit_length() // i))
+    return 2 ** (top + 1)
+
+
+def _gram_determinants(basis: List[List[int]]) -> List[int]:
+    """
+    the Gram determinants d_0 = 1, d_1, ... of the leading vectors of an integral basis, in
+    integer arithmetic (Cohen, Algorithm 2.6.7): d_k / d_(k-1) is the squared length of the k-th
+    Gram-Schmidt vector
+    """
+    d = [1]
+    lam: List[List[int]] = []
+    for k, b in enumerate(basis):
+        row: List[int] = []
+        lam.append(row)
+        for j in range(k + 1):
+            u = sum(x * y for x, y in zip(b, basis[j]))
+            for i in range(j):
+                u = (d[i + 1] * u - row[i] * lam[j][i]) // d[i]
+            if j < k:
+                row.append(u)
+            else:
+                d.append(u)
+    return d
+
+
+def _partition(rows: List[List[int]]) -> Optional[List[List[int]]]:
+    """
+    the blocks of the partition of the columns whose 0/1 indicators span the (independent) rows
+    over Q, or None: the rows are constant on the blocks, so there are as many distinct columns
+    as rows
+    """
+    columns: Dict[Tuple[int, ...], List[int]] = {}
+    for i in range(len(rows[0])):
+        columns.setdefault(tuple(row[i] for row in rows), []).append(i)
+    if len(columns) != len(rows):
+        return None
+    return sorted(columns.values())
+
+
+def _van_hoeij(g: Dense, lifted: List[Dense], p: int, m: int, bits: int) -> Optional[List[Dense]]:
+    """
+    the irreducible factors of g from its lifted factors mod m = p^a, or None when the precision
+    is not enough to tell the combinations apart
+
+    For a factor h of g over Z, lc(g)^j times the sum of the j-th powers of the roots of h is an
+    integer of at most n L^j (L from _root_scale), and the same sum of the roots of the lifted
+    factors it is made of mod m. So the 0/1 vector of those factors is short in the lattice of the
+    combination vectors e, extended by the j-th power sums mod m divided by p^b, b with
+    p^b >= n L^j, and rounded: up to the multiples of m / p^b, the 0/1 vectors get at most
+    1 + r / 2 there. One j at a time, the lattice gets another such column and is LLL-reduced,
+    and the vectors past the last Gram-Schmidt length within the bound of the 0/1 vectors are
+    dropped: the rest span all of them.
+    Only about bits bits of each power sum above p^b are kept, which bounds the size of the entries.
+    """
+    r = len(lifted)
+    n = len(g) - 1
+    lc = g[-1]
+    a = 0
+    while p**a < m:
+        a += 1
+    scale = _root_scale(g)
+    sums = [_power_sums(u, n, m) for u in lifted]
+    basis = [[int(i == k) for k in range(r)] for i in range(r)]
+    for j in range(1, n + 1):
+        low = 0
+        while p**low < n * scale**j:
+            low += 1
+        low = max(low, a - max(1, bits // p.bit_length()))
+        if low >= a:
+            break
+        divisor = p**low
+        cuts = [(lc**j * s[j - 1] % m + divisor // 2) // divisor for s in sums]
+        rows = [row + [sum(x * c for x, c in zip(row, cuts))] for row in basis]
+        rows.append([0] * len(basis[0]) + [p ** (a - low)])
+        reduced = lll_reduction(rows, exact=True)
+        d = _gram_determinants(reduced)
+        bound = r + (len(rows[0]) - r) * (r // 2 + 2) ** 2
+        keep = len(reduced)
+        while keep > 1 and d[keep] > bound * d[keep - 1]:
+            keep -= 1
+        basis = reduced[:keep]
+        if keep == 1:
+            return [g]
+        blocks = _partition([row[:r] for row in basis])
+        if blocks is not None:
+            out = []
+            rest = g
+            for block in blocks[:-1]:
+                h = _candidate(rest, [lifted[i] for i in block], m)
+                if h is None:
+                    break
+                out.append(h)
+                rest = exact_quotient(rest, h)  # type: ignore[assignment]
+            else:
+                return out + [rest]
+    return None
+
+
+def _factor_squarefree(g: Dense) -> List[Dense]:
+    """the irreducible factors of a square-free primitive g with positive leading coefficient"""
+    n = len(g) - 1
+    if n <= 1:
+        return [g]
+    p, factors, mask = _choose_prime(g)
+    if len(factors) == 1 or mask == 1 | 1 << n:
+        return [g]
+    # coefficients of factors times lc(g): Mignotte's bound, for either sign
+    bound = 2 * abs(g[-1]) * 2**n * (math.isqrt(sum(c * c for c in g)) + 1)
+    bits = LATTICE_BITS
+    while True:
+        lifted, m = hensel_lift(g, factors, p, bound)
+        if len(factors) <= ZASSENHAUS_FACTORS:
+            return _zassenhaus(g, lifted, m)
+        out = _van_hoeij(g, lifted, p, m, bits)
+        if out is not None:
+            return out
+        bound, bits = m * m, 2 * bits
+
+
+def factor_integer(f: Dense) -> Tuple[int, Factors]:
+    """
+    (c, [(g, e), ...]) with f = c * product of g^e over Z and the g distinct irreducible primitive
+    polynomials with positive leading coefficients, sorted by degree and coefficients
+    raises ValueError for f = 0
+    """
+    if not f:
+        raise ValueError("the zero polynomial has no factorization")
+    f, c = primitive(f), f[-1]
+    c //= f[-1]
+    out: Factors = []
+    shift = next(k for k, x in enumerate(f) if x)
+    if shift:
+        out.append(([0, 1], shift))
+        f = f[shift:]
+    # square-free factorization over Z (Yun), as squarefree_mod
+    if len(f) > 1:
+        u = gcd_integer(f, trim([k * x for k, x in enumerate(f)][1:]))
+        w = exact_quotient(f, u)
+        e = 1
+        while w is not None and len(w) > 1:
+            y = gcd_integer(w, u)
+            z = exact_quotient(w, y)
+            if z is not None and len(z) > 1:
+                out.extend((h, e) for h in _factor_squarefree(z))
+            e += 1
+            w, u = y, exact_quotient(u, y)  # type: ignore[assignment]
+    out.sort(key=lambda t: (len(t[0]), t[0][::-1]))
+    return c, out
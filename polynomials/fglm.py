@@ -0,0 +1,165 @@
+"""
+FGLM: change of monomial order for zero-dimensional ideals.
+
+Given the reduced Groebner basis G of a zero-dimensional ideal I for one order, the
+quotient ring k[x]/I is a finite dimensional vector space with the standard monomials
+of G as a basis, and multiplication by each variable is a matrix on that space. FGLM
+walks the monomials in increasing target order, expressing each one through these
+matrices; the first linear dependency found among the vectors of a monomial and the
+target-standard monomials before it is an element of the target basis. Only linear
+algebra is involved, so converting a grevlex basis to lex is much cheaper than running
+Buchberger's algorithm for lex.
+
+Works on the exact sparse terms of polynomials.groebner (Fractions or ints modulo p).
+"""
+
+import heapq
+from fractions import Fraction
+from typing import Any, Dict, List, Sequence, Tuple
+
+from polynomials.groebner import Exponents, Terms, leading_monomial, normal_forms
+from polynomials.monomial_index import MonomialIndex
+from polynomials.orderings import monomial_key
+
+__all__ = [
+    "NotZeroDimensional",
+    "fglm",
+    "is_zero_dimensional",
+    "standard_monomials",
+    "multiplication_matrices",
+]
+
+Vector = Dict[int, Any]
+
+
+class NotZeroDimensional(ValueError):
+    """the ideal has infinitely many standard monomials (and solutions)"""
+
+
+def is_zero_dimensional(leads: Sequence[Exponents], nvars: int) -> bool:
+    """
+    True when every variable has a pure power among the leading monomials
+    (or the ideal is the whole ring)
+    """
+    pure = set()
+    for lead in leads:
+        support = [i for i, e in enumerate(lead) if e]
+        if not support:
+            return True
+        if len(support) == 1:
+            pure.add(support[0])
+    return len(pure) == nvars
+
+
+def standard_monomials(leads: Sequence[Exponents], nvars: int) -> List[Exponents]:
+    """
+    returns the monomials divisible by no leading monomial (the basis of the quotient ring)
+    raises NotZeroDimensional if there are infinitely many
+    """
+    if not is_zero_dimensional(leads, nvars):
+        raise NotZeroDimensional("ideal is not zero-dimensional")
+    index = MonomialIndex(nvars, leads)
+    found: List[Exponents] = []
+    stack = [tuple([0] * nvars)] if index.find_divisor(tuple([0] * nvars)) is None else []
+    seen = set(stack)
+    while stack:
+        m = stack.pop()
+        found.append(m)
+        for i in range(nvars):
+            nm = m[:i] + (m[i] + 1,) + m[i + 1 :]
+            if nm not in seen and index.find_divisor(nm) is None:
+                seen.add(nm)
+                stack.append(nm)
+    return sorted(found)
+
+
+def multiplication_matrices(
+    basis: Sequence[Terms], nvars: int, order: str, char: int = 0
+) -> Tuple[List[Exponents], List[List[Vector]]]:
+    """
+    returns the standard monomials B and, for every variable x_i, the columns NF(x_i * b)
+    for b in B as sparse vectors over B
+    """
+    key = monomial_key(order)
+    staircase = standard_monomials([leading_monomial(g, key) for g in basis], nvars)
+    position = {b: k for k, b in enumerate(staircase)}
+    products = [[b[:i] + (b[i] + 1,) + b[i + 1 :] for b in staircase] for i in range(nvars)]
+    border = sorted({nb for row in products for nb in row if nb not in position})
+    reduced = dict(zip(border, normal_forms(({nb: 1} for nb in border), basis, nvars, order, char)))
+    matrices: List[List[Vector]] = []
+    for row in products:
+        columns: List[Vector] = []
+        for nb in row:
+            if nb in position:
+                columns.append({position[nb]: 1})
+            else:
+                columns.append({position[m]: c for m, c in reduced[nb].items()})
+        matrices.append(columns)
+    return staircase, matrices
+
+
+def _apply(columns: List[Vector], v: Vector, char: int) -> Vector:
+    out: Vector = {}
+    for k, c in v.items():
+        for r, a in columns[k].items():
+            out[r] = out.get(r, 0) + c * a
+    if char:
+        return {r: a % char for r, a in out.items() if a % char}
+    return {r: a for r, a in out.items() if a != 0}
+
+
+def _axpy(y: Dict[Any, Any], a: Any, x: Dict[Any, Any], char: int) -> None:
+    """y -= a * x in place"""
+    for k, c in x.items():
+        v = y.get(k, 0) - a * c
+        if char:
+            v %= char
+        if v == 0:
+            y.pop(k, None)
+        else:
+            y[k] = v
+
+
+def fglm(basis: Sequence[Terms], nvars: int, from_order: str, to_order: str = "lex", char: int = 0) -> List[Terms]:
+    """
+    converts the reduced Groebner basis of a zero-dimensional ideal from from_order to to_order
+    raises NotZeroDimensional if the ideal is not zero-dimensional
+    """
+    staircase, matrices = multiplication_matrices(basis, nvars, from_order, char)
+    one = tuple([0] * nvars)
+    if not staircase:
+        return [{one: 1}]
+    key = monomial_key(to_order)
+    result: List[Terms] = []
+    new_leads = MonomialIndex(nvars)
+    # echelon rows (pivot, vector, combination of monomials giving that vector)
+    rows: List[Tuple[int, Vector, Terms]] = []
+    heap = [(key(one), one, {staircase.index(one): 1})]
+    seen = {one}
+    while heap:
+        _, m, v = heapq.heappop(heap)
+        if new_leads.find_divisor(m) is not None:
+            continue
+        w = dict(v)
+        combo: Terms = {m: 1}
+        for pivot, row, row_combo in rows:
+            a = w.get(pivot)
+            if a is not None:
+                _axpy(w, a, row, char)
+                _axpy(combo, a, row_combo, char)
+        if not w:
+            # m minus a combination of earlier standard monomials lies in the ideal
+            result.append(combo)
+            new_leads.add(m)
+            continue
+        pivot = next(iter(w))
+        inv = pow(w[pivot], -1, char) if char else Fraction(1) / w[pivot]
+        scale = (lambda c: c * inv % char) if char else (lambda c: c * inv)
+        rows.append((pivot, {k: scale(c) for k, c in w.items()}, {t: scale(c) for t, c in combo.items()}))
+        for i in range(nvars):
+            nm = m[:i] + (m[i] + 1,) + m[i + 1 :]
+            if nm not in seen:
+                seen.add(nm)
+                heapq.heappush(heap, (key(nm), nm, _apply(matrices[i], v, char)))
+    result.sort(key=lambda t: key(leading_monomial(t, key)), reverse=True)
+    return result
@@ -1,4 +1,4 @@
-from typing import List, Sequence, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 Number = Union[int, float, complex]
 
@@ -7,6 +7,7 @@ __all__ = [
     "quadratic_formula",
     "isclose",
     "Durand_Kerner",
+    "durand_kerner_roots",
 ]
 
 
@@ -15,7 +16,11 @@ def solve(polynomial) -> Union[str, Number, Sequence[Number]]:
 
     Returns:
         - "too many variables" for multivariate input
-        - Numeric root(s) or list of complex approximations for higher degree.
+        - Numeric root(s) or list of complex approximations for higher degree. Above degree 2 over
+          Q the polynomial is factored over Z first: linear and quadratic factors are solved in
+          closed form and Durand-Kerner only runs on the factors of higher degree; each root is
+          listed as often as its factor divides.
+        - Over F_p, the sorted list of the roots in F_p (as ints), found by factoring.
     """
     active_vars = polynomial.variables
     if len(active_vars) > 1:
@@ -30,6 +35,12 @@ def solve(polynomial) -> Union[str, Number, Sequence[Number]]:
                 return c0
         return 0
     var = active_vars[0]
+    char = polynomial.field_characteristic
+    if char:
+        from polynomials.factorization import roots_mod
+        from polynomials.univariate import to_dense
+
+        return roots_mod(to_dense(polynomial, var, char), char)
     # Build coefficient list from sparse terms: list of (coeff, exponent)
     coeff_rows: List[Tuple[Number, int]] = []
     for m, c in polynomial.terms.items():
@@ -68,7 +79,6 @@ def solve(polynomial) -> Union[str, Number, Sequence[Number]]:
         return root
 
     if degree == 2:
-        # Reconstruct minimal pseudo term_matrix for quadratic_formula compatibility
         a = b = c0 = 0
         for coeff, exp in coeff_rows:
             if exp == 2:
@@ -77,26 +87,63 @@ def solve(polynomial) -> Union[str, Number, Sequence[Number]]:
                 b = coeff
             elif exp == 0:
                 c0 = coeff
-        class _Wrapper:  # pragma: no cover - simple container
-            term_matrix = [["constant", var]] + [[a, 2], [b, 1], [c0, 0]]
-        return quadratic_formula(_Wrapper)  # type: ignore[arg-type]
+        return _quadratic(a, b, c0, var)
 
     if degree > 2:
-        # Wrapper for Durand-Kerner expecting degree() and __call__
-        class _Wrapper2:  # pragma: no cover - iterative numeric method
-            def degree(self):
-                return degree
-            def __call__(self, x):
-                res: Number = 0
-                for coeff, exp in coeff_rows:
-                    res += coeff * (x ** exp)  # type: ignore[operator]
-                return res
-        return Durand_Kerner(_Wrapper2())
+        roots = _factored_roots(polynomial, var)
+        if roots is not None:
+            return roots
+        return _durand_kerner(coeff_rows, degree)
 
     # Fallback (shouldn't reach here)
     return 0
 
 
+def _quadratic(a: Number, b: Number, c: Number, var: str) -> Union[Number, Tuple[Number, Number]]:
+    # Reconstruct minimal pseudo term_matrix for quadratic_formula compatibility
+    class _Wrapper:  # pragma: no cover - simple container
+        term_matrix = [["constant", var]] + [[a, 2], [b, 1], [c, 0]]
+
+    return quadratic_formula(_Wrapper)  # type: ignore[arg-type]
+
+
+def _durand_kerner(coeff_rows: List[Tuple[Number, int]], degree: int) -> List[complex]:
+    a: List[Number] = [0] * (degree + 1)
+    for coeff, exp in coeff_rows:
+        a[exp] += coeff
+    return _round_near_integers(durand_kerner_roots(a))
+
+
+def _factored_roots(polynomial, var: str) -> Optional[List[Number]]:
+    """
+    the roots from the irreducible factors over Z (polynomials.factorization), None when the
+    polynomial does not split or has complex coefficients
+    """
+    try:
+        _, factors = polynomial.factor()
+    except ValueError:
+        return None
+    if len(factors) == 1 and factors[0][1] == 1:
+        return None
+    from polynomials.univariate import to_dense
+
+    roots: List[Number] = []
+    for f, e in factors:
+        a = [int(c) for c in to_dense(f, var)]
+        found: Sequence[Number]
+        if len(a) == 2:
+            root = -a[0] / a[1]
+            found = [int(root) if root.is_integer() else root]
+        elif len(a) == 3:
+            pair = _quadratic(1, a[1] / a[2], a[0] / a[2], var)
+            found = pair if isinstance(pair, tuple) else [pair]
+        else:
+            # monic, as integer coefficients may not fit a float
+            found = _durand_kerner([(c / a[-1], k) for k, c in enumerate(a) if c], len(a) - 1)
+        roots.extend(list(found) * e)
+    return roots
+
+
 def quadratic_formula(polynomial) -> Union[Number, Tuple[Number, Number]]:
     """
     input is single-variable polynomial of degree 2
@@ -171,6 +218,11 @@ def Durand_Kerner(f) -> List[complex]:
 
     while diff > 0.00000001 and not isclose(diff_temp, diff):
         iterate()
+    return _round_near_integers(roots)
+
+
+def _round_near_integers(roots: List[complex]) -> List[complex]:
+    """rounds the real and imaginary parts that are close to integers"""
     for i in range(len(roots)):
         if isclose(roots[i].real, round(roots[i].real)):
             temp = round(roots[i].real)
@@ -183,5 +235,34 @@ def Durand_Kerner(f) -> List[complex]:
     return roots
 
 
+def durand_kerner_roots(a: Sequence[Number], max_iterations: int = 1000, tolerance: float = 1e-10) -> List[complex]:
+    """
+    input coefficients a_0, ..., a_d of a polynomial of degree d
+    returns numerical approximations of its d complex roots
+    the iteration starts on a circle of radius Fujiwara's bound on the moduli of the roots and
+    updates each root in place, until no root moves by more than tolerance (relative)
+    """
+    d = len(a) - 1
+    monic = [complex(c) / complex(a[-1]) for c in a]
+    radius = 2 * max(abs(c) ** (1 / (d - k)) for k, c in enumerate(monic[:-1]))
+    z = [radius * (0.4 + 0.9j) ** k for k in range(d)]
+    for _ in range(max_iterations):
+        worst = 0.0
+        for i in range(d):
+            q: complex = 1
+            for j in range(d):
+                if j != i:
+                    q *= z[i] - z[j]
+            value: complex = 0
+            for c in reversed(monic):
+                value = value * z[i] + c
+            step = value / q if q else 1e-3
+            z[i] -= step
+            worst = max(worst, abs(step) / (1 + abs(z[i])))
+        if worst < tolerance:
+            break
+    return z
+
+
 if __name__ == "__main__":
     pass
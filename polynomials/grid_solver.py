@@ -0,0 +1,137 @@
+"""
+Exhaustive solution search over small prime fields.
+
+Over F_p the solutions of a system in F_p^n can simply be enumerated: every generator is compiled
+into a ModularEvaluator (its exponent matrix and coefficients mod p) that evaluates it on a whole
+block of points with NumPy, and the grid F_p^n is streamed in chunks of chunk_size points, so the
+memory stays bounded whatever the size of the grid. Inside a chunk each generator is only
+evaluated on the points the previous ones vanish on. Chunks are independent and are handed to a
+process pool when there are several of them.
+
+The work is p^n evaluations, so this is meant for small p and few variables (max_points bounds
+the grid); only solutions with coordinates in F_p itself are found, not those in extensions.
+Needs numpy (the algebra extra).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from polynomials.groebner import Terms, exact_system
+from polynomials.polynomial import Polynomial
+
+__all__ = [
+    "ModularEvaluator",
+    "grid_solutions",
+]
+
+CHUNK_SIZE = 1 << 18
+MAX_POINTS = 10**9
+
+
+def _numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - numpy is an optional dependency
+        raise ImportError(
+            "solving over F_p requires numpy; install extras: pip install 'PolynomialCalculator[algebra]'"
+        )
+    return np
+
+
+def _power(x: Any, e: int, char: int) -> Any:
+    """x^e mod char elementwise, by repeated squaring"""
+    np = _numpy()
+    out = np.ones_like(x)
+    while e:
+        if e & 1:
+            out = out * x % char
+        e >>= 1
+        if e:
+            x = x * x % char
+    return out
+
+
+class ModularEvaluator:
+    """
+    a polynomial over F_p (as {exponent tuple: int mod p}, see groebner.to_exact) compiled for
+    evaluation on blocks of points, one point per row
+    """
+
+    def __init__(self, terms: Terms, char: int) -> None:
+        if char * char >= 2**63:
+            raise ValueError("characteristic %d is too large for 64-bit modular evaluation" % char)
+        self.char = char
+        self.terms = [(tuple((i, e) for i, e in enumerate(m) if e), c % char) for m, c in terms.items()]
+
+    def __call__(self, points: Any) -> Any:
+        """values mod p at the rows of points (an integer array with entries in [0, p))"""
+        np = _numpy()
+        char = self.char
+        powers: Dict[Tuple[int, int], Any] = {}
+        out = np.zeros(points.shape[0], dtype=np.int64)
+        for factors, c in self.terms:
+            value = np.full(points.shape[0], c, dtype=np.int64)
+            for i, e in factors:
+                if (i, e) not in powers:
+                    powers[(i, e)] = _power(points[:, i], e, char)
+                value = value * powers[(i, e)] % char
+            out = (out + value) % char
+        return out
+
+
+def _grid(start: int, stop: int, nvars: int, char: int) -> Any:
+    """the points start, ..., stop - 1 of F_p^n in lex order (first coordinate most significant)"""
+    np = _numpy()
+    index = np.arange(start, stop, dtype=np.int64)
+    points = np.empty((stop - start, nvars), dtype=np.int64)
+    for i in range(nvars - 1, -1, -1):
+        index, points[:, i] = np.divmod(index, char)
+    return points
+
+
+def _search(evaluators: Sequence[ModularEvaluator], nvars: int, char: int, start: int, stop: int) -> List[Any]:
+    """the common zeros among the grid points start, ..., stop - 1"""
+    points = _grid(start, stop, nvars, char)
+    for f in evaluators:
+        if not len(points):
+            break
+        points = points[f(points) == 0]
+    return points.tolist()
+
+
+def _work(args: Tuple[Sequence[ModularEvaluator], int, int, int, int]) -> List[Any]:
+    return _search(*args)
+
+
+def grid_solutions(
+    polynomials: Sequence[Polynomial],
+    variables: Optional[Sequence[str]] = None,
+    chunk_size: int = CHUNK_SIZE,
+    processes: Optional[int] = None,
+    max_points: int = MAX_POINTS,
+) -> List[Dict[str, int]]:
+    """
+    returns every common zero {variable: value in 0, ..., p - 1} in F_p^n of polynomials over F_p,
+    in lex order of the sorted variables; the grid is streamed in chunks of chunk_size points and
+    several chunks go to a pool of processes workers (all cores by default, 1 for no pool)
+    raises ValueError for characteristic 0 or a grid larger than max_points
+    """
+    names, char, exact = exact_system(polynomials, variables)
+    if not char:
+        raise ValueError("grid search needs polynomials over F_p")
+    nvars = len(names)
+    size = char**nvars
+    if size > max_points:
+        raise ValueError("grid search over F_%d^%d exceeds %d points" % (char, nvars, max_points))
+    # sparse generators first: they are cheap and rule out most points
+    evaluators = sorted((ModularEvaluator(f, char) for f in exact if f), key=lambda f: len(f.terms))
+    chunks = [(evaluators, nvars, char, k, min(k + chunk_size, size)) for k in range(0, size, chunk_size)]
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(min(processes, len(chunks))) as pool:
+            found = [point for points in pool.map(_work, chunks) for point in points]
+    else:
+        found = [point for chunk in chunks for point in _work(chunk)]
+    return [dict(zip(names, point)) for point in found]
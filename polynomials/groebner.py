@@ -0,0 +1,522 @@
+"""
+Reduced Groebner bases for a chosen monomial order, computed with exact coefficients.
+
+Ideal.groebner_basis() keeps the original implementation for its default output. This
+module is the engine behind Ideal.groebner_basis(order=...) and the system solvers:
+Buchberger's algorithm with the normal selection strategy and the Gebauer-Moeller
+criteria, on sparse {exponent tuple: coefficient} maps. Coefficients are Fractions over
+the rationals (floats are read through their repr, so 0.1 means 1/10) and ints modulo p
+over F_p, so no cancellation is ever lost to rounding. The result is the unique reduced
+basis: monic, sorted by decreasing leading monomial.
+
+Exponent tuples are taken over the sorted variable names, the first name being the
+largest variable, as in polynomials.orderings.
+"""
+
+import heapq
+from fractions import Fraction
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from polynomials.execution import ExecutionContext
+from polynomials.groebner_stats import GroebnerStats
+from polynomials.monomial_index import MonomialIndex
+from polynomials.monomials import coprime, divides, lcm, quotient, spoly
+from polynomials.orderings import MonomialOrder, monomial_key
+from polynomials.polynomial import Monomial, Polynomial
+from polynomials.primitives.polycalc_numbers import Integer, Rational
+
+__all__ = [
+    "GroebnerState",
+    "PreparedBasis",
+    "groebner_basis",
+    "exact_system",
+    "reduced_groebner_basis",
+    "normal_form",
+    "normal_forms",
+    "interreduce",
+    "divide_in_turn",
+    "to_exact",
+    "from_exact",
+    "common_variables",
+    "leading_monomial",
+]
+
+Exponents = Tuple[int, ...]
+Terms = Dict[Exponents, Any]
+OrderKey = Callable[[Exponents], Tuple[int, ...]]
+
+
+def _exact(c: Any) -> Fraction:
+    if isinstance(c, (Integer, Rational)):
+        return Fraction(int(c.numerator), int(c.denominator))
+    if isinstance(c, complex):
+        if c.imag != 0:
+            raise ValueError("exact Groebner bases need real coefficients")
+        c = c.real
+    if isinstance(c, float):
+        return Fraction(repr(c))
+    return Fraction(c)
+
+
+def _field(c: Any, char: int) -> Any:
+    if not char:
+        return _exact(c)
+    f = _exact(c)
+    return f.numerator * pow(f.denominator, -1, char) % char
+
+
+def common_variables(polynomials: Iterable[Polynomial]) -> Tuple[str, ...]:
+    names: Set[str] = set()
+    for p in polynomials:
+        names.update(p.variables)
+    return tuple(sorted(names))
+
+
+def to_exact(p: Polynomial, variables: Sequence[str], char: int = 0) -> Terms:
+    """
+    returns p as {exponent tuple over variables: Fraction, or int modulo char}
+    """
+    pos = {v: i for i, v in enumerate(variables)}
+    n = len(variables)
+    out: Terms = {}
+    for m, c in p.terms.items():
+        exps = [0] * n
+        for v, e in zip(m.vars, m.exps):
+            if e:
+                exps[pos[v]] = e
+        key = tuple(exps)
+        out[key] = out.get(key, 0) + _field(c, char)
+    if char:
+        return {m: c % char for m, c in out.items() if c % char}
+    return {m: c for m, c in out.items() if c != 0}
+
+
+def from_exact(terms: Terms, variables: Sequence[str], char: int = 0) -> Polynomial:
+    """
+    inverse of to_exact, with the float coefficients used by Polynomial
+    """
+    p = Polynomial(0, char)
+    p.vars = tuple(variables)
+    p.terms = {Monomial(p.vars, m): float(c) for m, c in terms.items()}
+    p._filter_zero_terms()
+    return p
+
+
+def leading_monomial(terms: Terms, key: OrderKey) -> Exponents:
+    return max(terms, key=key)
+
+
+def _inverse(c: Any, char: int) -> Any:
+    return pow(c, -1, char) if char else Fraction(1) / c
+
+
+def _monic(terms: Terms, key: OrderKey, char: int) -> Terms:
+    inv = _inverse(terms[leading_monomial(terms, key)], char)
+    if char:
+        return {m: c * inv % char for m, c in terms.items()}
+    return {m: c * inv for m, c in terms.items()}
+
+
+class PreparedBasis:
+    """
+    monic basis elements with their leading monomials indexed for reduction
+    """
+
+    def __init__(self, nvars: int, key: OrderKey, char: int) -> None:
+        self.key = key
+        self.char = char
+        self.polys: List[Terms] = []
+        self.leads: List[Exponents] = []
+        self.index = MonomialIndex(nvars)
+
+    def add(self, terms: Terms) -> int:
+        lead = leading_monomial(terms, self.key)
+        self.polys.append(terms)
+        self.leads.append(lead)
+        return self.index.add(lead, len(self.polys) - 1)
+
+    def reduce(self, terms: Terms, stats: Optional[GroebnerStats] = None) -> Terms:
+        """
+        full reduction by the indexed elements, returns the remainder
+        """
+        return _reduce(terms, self.index, self.polys, self.leads, self.key, self.char, stats)
+
+
+def _reduce(
+    terms: Terms,
+    index: MonomialIndex,
+    polys: Any,
+    leads: Any,
+    key: OrderKey,
+    char: int,
+    stats: Optional[GroebnerStats] = None,
+    eps: float = 0.0,
+) -> Terms:
+    """
+    full reduction by the polys[label] with leading monomials leads[label], for the labels in
+    index; a term is reduced by its divisor with the smallest label
+    with eps > 0 a float coefficient at most eps times its previous value counts as cancelled
+    """
+    work = dict(terms)
+    remainder: Terms = {}
+    heap = [tuple(-k for k in key(m)) + (m,) for m in work]
+    heapq.heapify(heap)
+    while heap:
+        m = heapq.heappop(heap)[-1]
+        c = work.pop(m, None)
+        if c is None:
+            continue
+        i = index.find_divisor(m)
+        if i is None:
+            remainder[m] = c
+            continue
+        if stats is not None:
+            stats.terms(len(work) + len(remainder) + len(polys[i]))
+        shift = tuple(a - b for a, b in zip(m, leads[i]))
+        lc = polys[i][leads[i]]
+        if lc != 1:
+            c = c * pow(lc, -1, char) % char if char else c / lc
+        for tm, tc in polys[i].items():
+            nm = tuple(a + b for a, b in zip(tm, shift))
+            if nm == m:
+                continue
+            old = work.get(nm)
+            new = (0 if old is None else old) - c * tc
+            if char:
+                new %= char
+            if new == 0 or (eps and old is not None and abs(new) <= eps * abs(old)):
+                if old is not None:
+                    del work[nm]
+                continue
+            if old is None:
+                heapq.heappush(heap, tuple(-k for k in key(nm)) + (nm,))
+            work[nm] = new
+    return remainder
+
+
+def _s_polynomial(f: Terms, lf: Exponents, g: Terms, lg: Exponents, char: int) -> Terms:
+    top = lcm(lf, lg)
+    return spoly(f, quotient(top, lf), 1, g, quotient(top, lg), 1, top, char)
+
+
+def _update(
+    basis: PreparedBasis,
+    active: Set[int],
+    pairs: Set[Tuple[int, int]],
+    h: int,
+    stats: Optional[GroebnerStats] = None,
+) -> None:
+    """
+    Gebauer-Moeller update of the active set and the critical pairs for the new element h
+    """
+    leads = basis.leads
+    mh = leads[h]
+    candidates = list(active)
+    kept: List[int] = []
+    while candidates:
+        g = candidates.pop()
+        lcm_hg = lcm(mh, leads[g])
+        if coprime(mh, leads[g]) or (
+            not any(divides(lcm(mh, leads[o]), lcm_hg) for o in candidates)
+            and not any(divides(lcm(mh, leads[o]), lcm_hg) for o in kept)
+        ):
+            kept.append(g)
+    new_pairs = {(g, h) for g in kept if not coprime(mh, leads[g])}
+    dropped = 0
+    for i, j in list(pairs):
+        lcm_ij = lcm(leads[i], leads[j])
+        if divides(mh, lcm_ij) and lcm(leads[i], mh) != lcm_ij and lcm(leads[j], mh) != lcm_ij:
+            pairs.discard((i, j))
+            dropped += 1
+    pairs.update(new_pairs)
+    if stats is not None:
+        stats.pairs_created += len(active)
+        stats.pruned_chain += len(active) - len(kept) + dropped
+        stats.pruned_product += len(kept) - len(new_pairs)
+    for g in list(active):
+        if divides(mh, leads[g]):
+            active.discard(g)
+            basis.index.remove(g)
+    active.add(h)
+
+
+class GroebnerState:
+    """
+    Buchberger's algorithm kept open: the basis found so far, its active elements and the
+    pending critical pairs. add() reduces new generators against the basis and queues only
+    their pairs, so extending an ideal by a few polynomials does not redo the earlier work.
+    """
+
+    def __init__(self, nvars: int, order: MonomialOrder = "grevlex", char: int = 0) -> None:
+        self.nvars = nvars
+        self.order = order
+        self.char = char
+        self.key = monomial_key(order)
+        self.prepared = PreparedBasis(nvars, self.key, char)
+        self.active: Set[int] = set()
+        self.pairs: Set[Tuple[int, int]] = set()
+        self.pairs_processed = 0
+        # set to a GroebnerStats to collect statistics (slower)
+        self.stats: Optional[GroebnerStats] = None
+        self._reduced: Optional[List[Terms]] = None
+
+    def copy(self) -> "GroebnerState":
+        """
+        returns an independent state with the same basis and pairs (elements are shared, never mutated)
+        """
+        return self.widened(list(range(self.nvars)), self.nvars)
+
+    def widened(self, positions: Sequence[int], nvars: int) -> "GroebnerState":
+        """
+        returns a copy over nvars variables, old variable k moved to position positions[k]
+        (a Groebner basis stays one when variables the ideal does not involve are added)
+        """
+        state = GroebnerState(nvars, self.order, self.char)
+
+        def move(m: Exponents) -> Exponents:
+            exps = [0] * nvars
+            for k, e in zip(positions, m):
+                exps[k] = e
+            return tuple(exps)
+
+        prepared = state.prepared
+        for k, g in enumerate(self.prepared.polys):
+            prepared.polys.append({move(m): c for m, c in g.items()} if nvars != self.nvars else g)
+            prepared.leads.append(move(self.prepared.leads[k]))
+        for k in self.active:
+            prepared.index.add(prepared.leads[k], k)
+        state.active = set(self.active)
+        state.pairs = set(self.pairs)
+        state.pairs_processed = self.pairs_processed
+        return state
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        returns the state as JSON-serializable data (Fractions as [numerator, denominator])
+        """
+
+        def encode(c: Any) -> Any:
+            return [c.numerator, c.denominator] if isinstance(c, Fraction) else c
+
+        return {
+            "nvars": self.nvars,
+            "order": self.order if isinstance(self.order, str) else [list(row) for row in self.order],
+            "char": self.char,
+            "polys": [[[list(m), encode(c)] for m, c in g.items()] for g in self.prepared.polys],
+            "active": sorted(self.active),
+            "pairs": sorted(list(ij) for ij in self.pairs),
+            "pairs_processed": self.pairs_processed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GroebnerState":
+        """
+        inverse of to_dict
+        """
+        char = data["char"]
+
+        def decode(c: Any) -> Any:
+            return Fraction(*c) if isinstance(c, list) else (c if char else Fraction(c))
+
+        state = cls(data["nvars"], data["order"], char)
+        prepared = state.prepared
+        for g in data["polys"]:
+            terms = {tuple(m): decode(c) for m, c in g}
+            prepared.polys.append(terms)
+            prepared.leads.append(leading_monomial(terms, state.key))
+        state.active = set(data["active"])
+        for k in sorted(state.active):
+            prepared.index.add(prepared.leads[k], k)
+        state.pairs = {(i, j) for i, j in data["pairs"]}
+        state.pairs_processed = data["pairs_processed"]
+        return state
+
+    def add(self, polys: Iterable[Terms]) -> None:
+        """
+        adds generators; their pairs are processed by complete()
+        """
+        key, stats = self.key, self.stats
+        self._reduced = None
+        # generators of small leading monomial first, each reduced by the ones before it
+        for p in sorted((p for p in polys if p), key=lambda p: key(leading_monomial(p, key))):
+            r = self.prepared.reduce(p, stats)
+            if r:
+                _update(self.prepared, self.active, self.pairs, self.prepared.add(_monic(r, key, self.char)), stats)
+
+    def complete(
+        self,
+        context: Optional[ExecutionContext] = None,
+        on_pair: Optional[Callable[["GroebnerState"], None]] = None,
+    ) -> None:
+        """
+        processes the pending pairs, leaving a Groebner basis of everything added
+        with a context, checks it before every pair; a stopped run keeps its state and resumes here
+        on_pair is called with the state after every pair (checkpoints, see polynomials.checkpoint)
+        """
+        basis, key, char = self.prepared, self.key, self.char
+        while self.pairs:
+            # normal strategy: the pair of smallest lcm first
+            i, j = min(self.pairs, key=lambda ij: key(lcm(basis.leads[ij[0]], basis.leads[ij[1]])))
+            if context is not None:
+                context.check(
+                    partial=lambda: [basis.polys[g] for g in sorted(self.active)],
+                    pairs_processed=1,
+                    basis_size=len(self.active),
+                    degree=sum(lcm(basis.leads[i], basis.leads[j])),
+                )
+            self.pairs.discard((i, j))
+            stats = self.stats
+            if stats is None:
+                s = _s_polynomial(basis.polys[i], basis.leads[i], basis.polys[j], basis.leads[j], char)
+                r = basis.reduce(s)
+            else:
+                with stats.timed("spoly"):
+                    s = _s_polynomial(basis.polys[i], basis.leads[i], basis.polys[j], basis.leads[j], char)
+                with stats.timed("reduction"):
+                    r = basis.reduce(s, stats)
+                stats.pairs_processed += 1
+                if not r:
+                    stats.reductions_to_zero += 1
+            if r:
+                _update(basis, self.active, self.pairs, basis.add(_monic(r, key, char)), stats)
+            self.pairs_processed += 1
+            if on_pair is not None:
+                on_pair(self)
+
+    def basis(
+        self,
+        context: Optional[ExecutionContext] = None,
+        on_pair: Optional[Callable[["GroebnerState"], None]] = None,
+    ) -> List[Terms]:
+        """
+        completes and returns the reduced Groebner basis
+        """
+        if self._reduced is None:
+            self.complete(context, on_pair)
+            if self.stats is None:
+                self._reduced = interreduce(
+                    [self.prepared.polys[g] for g in self.active], self.nvars, self.order, self.char
+                )
+            else:
+                with self.stats.timed("interreduction"):
+                    self._reduced = interreduce(
+                        [self.prepared.polys[g] for g in self.active], self.nvars, self.order, self.char
+                    )
+                self.stats.basis_size = len(self._reduced)
+        return self._reduced
+
+
+def reduced_groebner_basis(
+    polys: Iterable[Terms], nvars: int, order: MonomialOrder = "grevlex", char: int = 0
+) -> List[Terms]:
+    """
+    returns the reduced Groebner basis of the ideal generated by polys (exact sparse terms)
+    """
+    state = GroebnerState(nvars, order, char)
+    state.add(polys)
+    return state.basis()
+
+
+def interreduce(basis: Iterable[Terms], nvars: int, order: MonomialOrder = "grevlex", char: int = 0) -> List[Terms]:
+    """
+    returns the reduced Groebner basis from any Groebner basis of the ideal
+    """
+    key = monomial_key(order)
+    polys = sorted((_monic(g, key, char) for g in basis if g), key=lambda g: key(leading_monomial(g, key)))
+    minimal = PreparedBasis(nvars, key, char)
+    for g in polys:
+        # sorted by leading monomial, so a divisor of this one is already in
+        if minimal.index.find_divisor(leading_monomial(g, key)) is None:
+            minimal.add(g)
+    result: List[Terms] = []
+    for g, lead in zip(minimal.polys, minimal.leads):
+        reduced = minimal.reduce({m: c for m, c in g.items() if m != lead})
+        reduced[lead] = 1
+        result.append(reduced)
+    result.sort(key=lambda t: key(leading_monomial(t, key)), reverse=True)
+    return result
+
+
+def divide_in_turn(
+    polys: Sequence[Terms], nvars: int, order: MonomialOrder = "grevlex", char: int = 0, eps: float = 0.0
+) -> List[Terms]:
+    """
+    divides each polynomial in turn by the others: the ones after it and the nonzero remainders
+    before it, tried in that order with the last remainder first, as division_algorithm(h, *rest)
+    would; returns the nonzero remainders, the last one first
+    the coefficients are taken as they are (Fractions, ints modulo char or floats) and nothing
+    is made monic; eps > 0 drops float coefficients cancelled up to rounding (see _reduce)
+    """
+    key = monomial_key(order)
+    n = len(polys)
+    index = MonomialIndex(nvars)
+    # labels give the divisor order: the inputs count up from n, the remainders down from n - 1
+    divisors: Dict[int, Terms] = {}
+    leads: Dict[int, Exponents] = {}
+
+    def add(label: int, terms: Terms) -> None:
+        leads[label] = leading_monomial(terms, key)
+        divisors[label] = terms
+        index.add(leads[label], label)
+
+    for k, f in enumerate(polys):
+        if f:
+            add(n + k, f)
+    result: List[Terms] = []
+    for k, f in enumerate(polys):
+        if not f:
+            continue
+        index.remove(n + k)
+        del divisors[n + k], leads[n + k]
+        r = _reduce(f, index, divisors, leads, key, char, eps=eps)
+        if r:
+            add(n - 1 - k, r)
+            result.append(r)
+    result.reverse()
+    return result
+
+
+def normal_forms(
+    polys: Iterable[Terms], basis: Sequence[Terms], nvars: int, order: MonomialOrder = "grevlex", char: int = 0
+) -> List[Terms]:
+    """
+    returns the remainders of polys on division by the monic basis, prepared once
+    """
+    key = monomial_key(order)
+    prepared = PreparedBasis(nvars, key, char)
+    for g in basis:
+        prepared.add(g)
+    return [prepared.reduce(p) for p in polys]
+
+
+def normal_form(
+    terms: Terms, basis: Sequence[Terms], nvars: int, order: MonomialOrder = "grevlex", char: int = 0
+) -> Terms:
+    """
+    returns the remainder of terms on division by the monic basis
+    """
+    return normal_forms([terms], basis, nvars, order, char)[0]
+
+
+def exact_system(
+    polynomials: Sequence[Polynomial], variables: Optional[Sequence[str]] = None
+) -> Tuple[Tuple[str, ...], int, List[Terms]]:
+    """
+    returns (variable names, characteristic, exact terms of every polynomial)
+    the characteristic is the largest among the polynomials, as for Reducer
+    """
+    names = tuple(variables) if variables is not None else common_variables(polynomials)
+    chars = {p.field_characteristic for p in polynomials}
+    char = max(chars) if chars else 0
+    return names, char, [to_exact(p, names, char) for p in polynomials]
+
+
+def groebner_basis(
+    polynomials: Sequence[Polynomial], order: MonomialOrder = "grevlex", variables: Optional[Sequence[str]] = None
+) -> List[Polynomial]:
+    """
+    returns the reduced Groebner basis of the polynomials for the monomial order
+    ("lex", "grlex" or "grevlex" over the sorted variable names)
+    """
+    names, char, exact = exact_system(polynomials, variables)
+    return [from_exact(g, names, char) for g in reduced_groebner_basis(exact, len(names), order, char)]
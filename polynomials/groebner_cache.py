@@ -0,0 +1,260 @@
+"""
+Memoization of Groebner basis computations.
+
+Groebner bases are cached by a canonical fingerprint of the generators: the
+fingerprint is independent of how each generator happens to be stored (variable
+declaration order, internal term order, 1 vs 1.0 vs Integer(1) coefficients) but
+keeps the order of the generators and the monomial order, since both affect the
+basis the algorithm returns.
+
+The in-memory store is an LRU of configurable size. Optionally every entry is also
+written as JSON under a cache directory so repeated runs (or several processes)
+can share results. The directory defaults to the POLYCALC_GROEBNER_CACHE_DIR
+environment variable and the size to POLYCALC_GROEBNER_CACHE_SIZE.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from polynomials.polynomial import Monomial, Polynomial
+from polynomials.primitives.polycalc_numbers import Integer, Rational
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "CacheInfo",
+    "GroebnerCache",
+    "ideal_fingerprint",
+    "get_groebner_cache",
+    "configure_groebner_cache",
+]
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_DEFAULT_MAXSIZE = 128
+
+
+def _canonical_coeff(c: Any) -> Any:
+    """Coefficient as a JSON value that is equal for equal numbers of any supported type."""
+    if isinstance(c, Integer):
+        return int(c)
+    if isinstance(c, Rational):
+        if int(c.denominator) == 1:
+            return int(c.numerator)
+        return f"{int(c.numerator)}/{int(c.denominator)}"
+    if isinstance(c, complex):
+        if c.imag == 0:
+            return _canonical_coeff(c.real)
+        return [_canonical_coeff(c.real), _canonical_coeff(c.imag)]
+    if isinstance(c, float) and c.is_integer():
+        return int(c)
+    if isinstance(c, float):
+        return repr(c)
+    return c
+
+
+def _encode_coeff(c: Any) -> Any:
+    """Lossless JSON encoding of a coefficient (keeps float vs int vs exact types)."""
+    if isinstance(c, Integer):
+        return {"z": int(c)}
+    if isinstance(c, Rational):
+        return {"q": [int(c.numerator), int(c.denominator)]}
+    if isinstance(c, complex):
+        return {"c": [c.real, c.imag]}
+    return c
+
+
+def _decode_coeff(c: Any) -> Any:
+    if isinstance(c, dict):
+        if "z" in c:
+            return Integer(c["z"])
+        if "q" in c:
+            return Rational(*c["q"])
+        if "c" in c:
+            return complex(*c["c"])
+    return c
+
+
+def _active_variables(polynomials: Sequence[Polynomial]) -> Tuple[str, ...]:
+    names = set()
+    for p in polynomials:
+        names.update(p.variables)
+    return tuple(sorted(names))
+
+
+def _exponents(m: Monomial, target: Tuple[str, ...]) -> List[int]:
+    pos = {v: i for i, v in enumerate(target)}
+    exps = [0] * len(target)
+    for v, e in zip(m.vars, m.exps):
+        if e:
+            exps[pos[v]] = e
+    return exps
+
+
+def ideal_fingerprint(polynomials: Sequence[Polynomial], order: str = "grlex") -> str:
+    """
+    returns a hex digest identifying the generators (in sequence) and the monomial order
+    """
+    variables = _active_variables(polynomials)
+    generators = []
+    for p in polynomials:
+        terms = sorted(
+            ([_exponents(m, variables), _canonical_coeff(c)] for m, c in p.terms.items()),
+            key=lambda t: t[0],
+        )
+        generators.append({"char": p.field_characteristic, "terms": terms})
+    payload = {"order": order, "vars": list(variables), "generators": generators}
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _serialize_basis(basis: Sequence[Polynomial]) -> Dict[str, Any]:
+    return {
+        "basis": [
+            {
+                "vars": list(p.vars),
+                "char": p.field_characteristic,
+                "terms": [[list(m.exps), _encode_coeff(c)] for m, c in p.terms.items()],
+            }
+            for p in basis
+        ]
+    }
+
+
+def _deserialize_basis(data: Dict[str, Any]) -> List[Polynomial]:
+    basis: List[Polynomial] = []
+    for entry in data["basis"]:
+        p = Polynomial(0, entry["char"])
+        p.vars = tuple(entry["vars"])
+        p.terms = {Monomial(p.vars, tuple(exps)): _decode_coeff(c) for exps, c in entry["terms"]}
+        p._filter_zero_terms()
+        basis.append(p)
+    return basis
+
+
+class GroebnerCache:
+    """
+    LRU cache of Groebner bases keyed by ideal_fingerprint
+    maxsize = 0 disables the in-memory store; cache_dir adds a JSON store on disk
+    """
+
+    def __init__(self, maxsize: int = _DEFAULT_MAXSIZE, cache_dir: Optional[str] = None) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._store: "OrderedDict[str, List[Polynomial]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._store or (self._path(key) is not None and os.path.exists(self._path(key)))
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._store))
+
+    def clear(self) -> None:
+        """Empties the in-memory store and resets the counters (files on disk are kept)."""
+        self._store.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _remember(self, key: str, basis: List[Polynomial]) -> None:
+        if self.maxsize == 0:
+            return
+        self._store[key] = basis
+        self._store.move_to_end(key)
+        while len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[List[Polynomial]]:
+        path = self._path(key)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return _deserialize_basis(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("groebner cache: ignoring unreadable entry %s (%s)", path, e)
+            return None
+
+    def _dump(self, key: str, basis: List[Polynomial]) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)  # type: ignore[arg-type]
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(_serialize_basis(basis), f)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("groebner cache: could not write %s (%s)", path, e)
+
+    def get(self, key: str) -> Optional[List[Polynomial]]:
+        """
+        returns a copy of the cached basis or None, counting a hit or a miss; the polynomials are
+        copied as well, so that callers cannot change what later lookups see
+        """
+        basis = self._store.get(key)
+        if basis is not None:
+            self._store.move_to_end(key)
+        else:
+            basis = self._load(key)
+            if basis is not None:
+                self._remember(key, basis)
+        if basis is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return [p.copy() for p in basis]
+
+    def put(self, key: str, basis: Sequence[Polynomial]) -> None:
+        stored = [p.copy() for p in basis]
+        self._remember(key, stored)
+        self._dump(key, stored)
+
+    def get_or_compute(self, key: str, compute: Callable[[], List[Polynomial]]) -> List[Polynomial]:
+        basis = self.get(key)
+        if basis is None:
+            basis = compute()
+            self.put(key, basis)
+        return basis
+
+
+def _maxsize_from_env() -> int:
+    env = os.environ.get("POLYCALC_GROEBNER_CACHE_SIZE")
+    if env is None:
+        return _DEFAULT_MAXSIZE
+    try:
+        return max(0, int(env))
+    except ValueError:
+        return _DEFAULT_MAXSIZE
+
+
+_cache = GroebnerCache(_maxsize_from_env(), os.environ.get("POLYCALC_GROEBNER_CACHE_DIR") or None)
+
+
+def get_groebner_cache() -> GroebnerCache:
+    return _cache
+
+
+def configure_groebner_cache(maxsize: int = _DEFAULT_MAXSIZE, cache_dir: Optional[str] = None) -> GroebnerCache:
+    """
+    replaces the process-wide cache used by Ideal.groebner_basis and returns it
+    """
+    global _cache
+    _cache = GroebnerCache(maxsize, cache_dir)
+    return _cache
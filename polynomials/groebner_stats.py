@@ -0,0 +1,85 @@
+"""
+Statistics of a Groebner basis computation.
+
+Ideal.groebner_basis(order, stats=True) returns the basis together with a GroebnerStats report:
+how many critical pairs were created and how many each criterion pruned, how many
+S-polynomials reduced to zero, the largest intermediate polynomial, where the time went
+(S-polynomials, reduction, interreduction) and the peak memory traced while it ran. The CLI
+prints it as JSON with `polycalc groebner --stats`.
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from typing import Any, ContextManager, Dict, Iterator, Optional
+
+__all__ = [
+    "GroebnerStats",
+    "timed",
+]
+
+
+@dataclass
+class GroebnerStats:
+    """
+    counters and timings of one Buchberger run; times in seconds, memory in bytes
+    pruned_product: pairs with coprime leading monomials (Buchberger's first criterion)
+    pruned_chain: pairs dropped because a third leading monomial divides their lcm
+    (the chain criterion; Gebauer-Moeller's B_k/M/F steps or the original criterion())
+    """
+
+    engine: str = ""
+    order: str = ""
+    pairs_created: int = 0
+    pruned_product: int = 0
+    pruned_chain: int = 0
+    pairs_processed: int = 0
+    reductions_to_zero: int = 0
+    basis_size: int = 0
+    max_terms: int = 0
+    time_spoly: float = 0.0
+    time_reduction: float = 0.0
+    time_interreduction: float = 0.0
+    time_total: float = 0.0
+    peak_memory: int = 0
+
+    def terms(self, count: int) -> None:
+        """records an intermediate polynomial of count terms"""
+        if count > self.max_terms:
+            self.max_terms = count
+
+    @contextmanager
+    def timed(self, phase: str) -> Iterator[None]:
+        """adds the time spent in the block to time_<phase>"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            name = "time_" + phase
+            setattr(self, name, getattr(self, name) + time.perf_counter() - start)
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """sets time_total and peak_memory for the block (tracing memory slows it down)"""
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.time_total = time.perf_counter() - start
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def timed(stats: Optional[GroebnerStats], phase: str) -> ContextManager[None]:
+    """stats.timed(phase), or nothing without stats"""
+    return nullcontext() if stats is None else stats.timed(phase)
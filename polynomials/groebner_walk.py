@@ -0,0 +1,196 @@
+"""
+Groebner walk: change of monomial order for ideals of any dimension.
+
+The orders of polynomials.orderings are given by weight matrices (order_matrix); the
+first row of each is a weight vector. The walk moves a weight vector w along the
+segment from the start order's weight to the target's. At each stop w only the
+initial forms in_w(g) of the current basis matter: their (much smaller, weighted
+homogeneous) ideal gets a Groebner basis for the order "w, then the target", and
+every element of that basis is lifted back to the ideal through the division by the
+initial forms. The next stop is the first point of the segment where some leading
+term would be overtaken by another term of its polynomial (the next Groebner cone).
+At the target weight the basis is the reduced basis for the target order.
+
+Unlike FGLM this does not need finitely many solutions, so a cheap grevlex basis can be
+turned into an elimination (lex) basis for positive-dimensional ideals too.
+See Cox, Little, O'Shea, Using Algebraic Geometry, chapter 8 section 5.
+"""
+
+import heapq
+from fractions import Fraction
+from math import gcd
+from typing import List, Sequence, Tuple
+
+from polynomials.groebner import Exponents, PreparedBasis, Terms, interreduce, leading_monomial, reduced_groebner_basis
+from polynomials.orderings import MonomialOrder, WeightMatrix, matrix_key, order_matrix
+
+__all__ = [
+    "groebner_walk",
+    "initial_form",
+    "interior_weight",
+    "next_weight",
+]
+
+Weight = Tuple[int, ...]
+
+
+def _matrix(order: MonomialOrder, nvars: int) -> List[List[int]]:
+    if isinstance(order, str):
+        return order_matrix(order, nvars)
+    return [list(row) for row in order]
+
+
+def _dot(w: Sequence[int], exps: Exponents) -> int:
+    return sum(a * b for a, b in zip(w, exps))
+
+
+def initial_form(g: Terms, w: Sequence[int]) -> Terms:
+    """
+    returns the terms of g of largest w-weight
+    """
+    top = max(_dot(w, m) for m in g)
+    return {m: c for m, c in g.items() if _dot(w, m) == top}
+
+
+def next_weight(basis: Sequence[Terms], matrix: WeightMatrix, w: Weight, target: Weight) -> Weight:
+    """
+    returns the first weight on the segment from w to target (w excluded) where a leading
+    term of the basis for matrix ties with another of its terms, or target if there is none
+    """
+    key = matrix_key(matrix)
+    best = None
+    for g in basis:
+        lead = leading_monomial(g, key)
+        for m in g:
+            d = tuple(a - b for a, b in zip(lead, m))
+            a, b = _dot(w, d), _dot(target, d)
+            if b < 0 <= a:
+                s = Fraction(a, a - b)
+                if best is None or s < best:
+                    best = s
+    if best is None:
+        return tuple(target)
+    num, den = best.numerator, best.denominator
+    u = [(den - num) * x + num * y for x, y in zip(w, target)]
+    common = 0
+    for x in u:
+        common = gcd(common, x)
+    return tuple(x // common for x in u) if common > 1 else tuple(u)
+
+
+def _divide(h: Terms, divisors: Sequence[Terms], matrix: WeightMatrix, nvars: int, char: int) -> List[Terms]:
+    """
+    returns the quotients of h on division by monic divisors (the remainder must vanish)
+    """
+    key = matrix_key(matrix)
+    prepared = PreparedBasis(nvars, key, char)
+    for g in divisors:
+        prepared.add(g)
+    quotients: List[Terms] = [{} for _ in divisors]
+    work = dict(h)
+    heap = [tuple(-k for k in key(m)) + (m,) for m in work]
+    heapq.heapify(heap)
+    while heap:
+        m = heapq.heappop(heap)[-1]
+        c = work.pop(m, None)
+        if c is None:
+            continue
+        i = prepared.index.find_divisor(m)
+        if i is None:
+            raise ArithmeticError("initial form is not in the ideal of the initial forms")
+        shift = tuple(a - b for a, b in zip(m, prepared.leads[i]))
+        quotients[i][shift] = quotients[i].get(shift, 0) + c
+        for tm, tc in prepared.polys[i].items():
+            nm = tuple(a + b for a, b in zip(tm, shift))
+            if nm == m:
+                continue
+            old = work.get(nm)
+            v = (0 if old is None else old) - c * tc
+            if char:
+                v %= char
+            if v == 0:
+                work.pop(nm, None)
+                continue
+            if old is None:
+                heapq.heappush(heap, tuple(-k for k in key(nm)) + (nm,))
+            work[nm] = v
+    return quotients
+
+
+def _lift(quotients: List[Terms], basis: Sequence[Terms], char: int) -> Terms:
+    out: Terms = {}
+    for q, g in zip(quotients, basis):
+        for qm, qc in q.items():
+            for gm, gc in g.items():
+                m = tuple(a + b for a, b in zip(qm, gm))
+                v = out.get(m, 0) + qc * gc
+                if char:
+                    v %= char
+                if v == 0:
+                    out.pop(m, None)
+                else:
+                    out[m] = v
+    return out
+
+
+def _combined_weight(matrix: WeightMatrix, n: int) -> Weight:
+    """the rows of matrix weighted by n^(k-1), ..., n, 1: a single weight refining the first row"""
+    k = len(matrix)
+    return tuple(sum(row[j] * n ** (k - 1 - i) for i, row in enumerate(matrix)) for j in range(len(matrix[0])))
+
+
+def interior_weight(basis: Sequence[Terms], matrix: WeightMatrix) -> Weight:
+    """
+    returns a weight vector picking the same leading terms in basis as the order of matrix
+    (a point inside the Groebner cone, so the initial forms there are single terms)
+    """
+    key = matrix_key(matrix)
+    differences = []
+    for g in basis:
+        lead = leading_monomial(g, key)
+        differences.extend(tuple(a - b for a, b in zip(lead, m)) for m in g if m != lead)
+    n = 2
+    while True:
+        w = _combined_weight(matrix, n)
+        if all(_dot(w, d) > 0 for d in differences):
+            return w
+        n *= 2
+
+
+def _walk(
+    current: List[Terms], w: Weight, goal: Weight, old_matrix: WeightMatrix, target: List[List[int]], nvars, char
+):
+    """
+    walks the weight from w to goal, returns the reduced basis for the order (goal, target)
+    """
+    while True:
+        new_matrix = [list(w)] + target
+        initial = [initial_form(g, w) for g in current]
+        initial_basis = reduced_groebner_basis(initial, nvars, new_matrix, char)
+        lifted = [_lift(_divide(h, initial, old_matrix, nvars, char), current, char) for h in initial_basis]
+        current = interreduce(lifted, nvars, new_matrix, char)
+        if w == goal:
+            return current
+        w = next_weight(current, new_matrix, w, goal)
+        old_matrix = new_matrix
+
+
+def groebner_walk(
+    basis: Sequence[Terms], nvars: int, from_order: MonomialOrder, to_order: MonomialOrder = "lex", char: int = 0
+) -> List[Terms]:
+    """
+    converts the reduced Groebner basis for from_order into the reduced basis for to_order
+    """
+    start, target = _matrix(from_order, nvars), _matrix(to_order, nvars)
+    current = interreduce(basis, nvars, start, char)
+    # start and end inside the cones rather than at the orders' first rows (lex's (1, 0, ..., 0)
+    # lies on the boundary of many cones and would make the initial forms huge)
+    w = interior_weight(current, start)
+    old_matrix: WeightMatrix = [list(w)] + start
+    while True:
+        goal = interior_weight(current, target)
+        current = _walk(current, w, goal, old_matrix, target, nvars, char)
+        if interior_weight(current, target) == goal:
+            # goal orders the new basis like the target order, so it is the target basis
+            return interreduce(current, nvars, target, char)
+        w, old_matrix = goal, [list(goal)] + target
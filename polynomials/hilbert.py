@@ -0,0 +1,112 @@
+"""
+Hilbert series of monomial ideals.
+
+For a Groebner basis G of I (any degree compatible order), k[x]/I and k[x]/<LM(G)> have the
+same Hilbert function, so everything here works on leading monomials only. The series of
+k[x_1..x_n]/M is N(t) / (1 - t)^n; the numerator N is computed by divide and conquer on a
+pivot monomial p (Bigatti's algorithm):
+
+    N(M) = N(M + <p>) + t^deg(p) * N(M : p)
+
+with p a power of the variable occurring in most generators, until the generators are
+pairwise coprime and N is the product of the (1 - t^deg(m)). Cancelling the factors
+(1 - t) gives h(t) / (1 - t)^d: d is the dimension of the ideal and h(1) its degree, the
+number of solutions counted with multiplicity when d = 0.
+"""
+
+from collections import namedtuple
+from typing import Dict, List, Sequence, Tuple
+
+__all__ = [
+    "HilbertSeries",
+    "hilbert_numerator",
+    "hilbert_series",
+]
+
+Exponents = Tuple[int, ...]
+Poly = Dict[int, int]  # {power of t: coefficient}
+
+HilbertSeries = namedtuple("HilbertSeries", ["numerator", "dimension", "degree"])
+HilbertSeries.__doc__ = "numerator(t) / (1 - t)^dimension, numerator coefficients from t^0 up; degree = numerator(1)"
+
+
+def _mul(a: Poly, b: Poly) -> Poly:
+    out: Poly = {}
+    for i, x in a.items():
+        for j, y in b.items():
+            out[i + j] = out.get(i + j, 0) + x * y
+    return {k: v for k, v in out.items() if v}
+
+
+def _add(a: Poly, b: Poly, shift: int = 0) -> Poly:
+    out = dict(a)
+    for k, v in b.items():
+        out[k + shift] = out.get(k + shift, 0) + v
+    return {k: v for k, v in out.items() if v}
+
+
+def _minimal(monomials: Sequence[Exponents]) -> List[Exponents]:
+    out: List[Exponents] = []
+    for m in sorted(set(monomials), key=sum):
+        if not any(all(a <= b for a, b in zip(g, m)) for g in out):
+            out.append(m)
+    return out
+
+
+def _coprime_numerator(monomials: Sequence[Exponents]) -> Poly:
+    out: Poly = {0: 1}
+    for m in monomials:
+        out = _mul(out, {0: 1, sum(m): -1})
+    return out
+
+
+def _numerator(monomials: List[Exponents]) -> Poly:
+    if not monomials:
+        return {0: 1}
+    if not any(monomials[0]):
+        return {}  # the unit ideal, minimal generators sort the constant first
+    nvars = len(monomials[0])
+    counts = [sum(1 for m in monomials if m[i]) for i in range(nvars)]
+    i = max(range(nvars), key=lambda v: counts[v])
+    if counts[i] <= 1:
+        # no variable is shared, the generators are pairwise coprime
+        return _coprime_numerator(monomials)
+    # median exponent of x_i among the mixed generators: below any pure power of x_i (the
+    # generators are minimal), so x_i^e is not in M yet and both halves get smaller
+    exps = sorted(m[i] for m in monomials if m[i] and m[i] < sum(m))
+    e = exps[len(exps) // 2]
+    pivot = tuple(e if v == i else 0 for v in range(nvars))
+    plus = _minimal([m for m in monomials if m[i] < e] + [pivot])
+    quotient = _minimal([m[:i] + (max(m[i] - e, 0),) + m[i + 1 :] for m in monomials])
+    return _add(_numerator(plus), _numerator(quotient), e)
+
+
+def hilbert_numerator(monomials: Sequence[Exponents]) -> List[int]:
+    """
+    returns the coefficients of N(t), the numerator of the Hilbert series of k[x]/<monomials>
+    over (1 - t)^nvars
+    """
+    poly = _numerator(_minimal(monomials))
+    if not poly:
+        return []
+    return [poly.get(k, 0) for k in range(max(poly) + 1)]
+
+
+def hilbert_series(monomials: Sequence[Exponents], nvars: int) -> HilbertSeries:
+    """
+    returns the reduced Hilbert series of k[x_1..x_nvars]/<monomials>
+    (dimension -1 and degree 0 for the unit ideal)
+    """
+    numerator = hilbert_numerator(monomials) if monomials else [1]
+    if not numerator:
+        return HilbertSeries([], -1, 0)
+    dimension = nvars
+    # divide by (1 - t) while t = 1 is a root
+    while dimension > 0 and sum(numerator) == 0:
+        quotient, carry = [], 0
+        for c in numerator[:-1]:
+            carry += c
+            quotient.append(carry)
+        numerator = quotient
+        dimension -= 1
+    return HilbertSeries(numerator, dimension, sum(numerator))
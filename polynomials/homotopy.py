@@ -0,0 +1,327 @@
+"""
+Homotopy continuation for square polynomial systems.
+
+Groebner bases can blow up where numerical algebraic geometry does not: the isolated
+solutions of F = (f_1, ..., f_n) are the endpoints of the paths of
+
+    H(x, t) = (1 - t) * gamma * G(x) + t * F(x),    t from 0 to 1
+
+started at the solutions of the total-degree start system G = (x_i^d_i - 1), d_i = deg f_i.
+There are d_1 * ... * d_n paths (the Bezout bound); the random complex gamma keeps them
+away from singularities with probability one. Each path is followed by a predictor-corrector
+tracker: a fourth order Runge-Kutta step along dx/dt = -H_x^-1 H_t, then Newton steps on
+H(., t) with the Jacobian built from Polynomial.grad, halving the step when Newton fails and
+doubling it after a run of successes. Paths are tracked in NumPy batches (every array has
+one row per path) and the batches can be spread over a process pool.
+
+At a root of multiplicity > 1 the Jacobian of F is singular and the step size collapses just
+before t = 1. In the endgame (the last 1e-4 of t) such a path stops where it stalls, and
+Newton steps on F take it to the root, converging linearly; the endpoint is accepted when
+its residual on F is small relative to the coefficients of F, and the several paths ending
+at the same root are merged. Paths diverging to infinity are dropped, also when they reach
+t = 1. Paths that stall before the endgame and endpoints that are not solutions of F are
+lost: solve_numeric warns with their number.
+
+The work is fixed by the degrees, so the running time is predictable. Needs numpy (the
+algebra extra).
+"""
+
+import cmath
+import itertools
+import math
+import random
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from polynomials.polynomial import Polynomial
+
+__all__ = [
+    "PolynomialSystem",
+    "solve_numeric",
+    "total_degree_start",
+]
+
+
+def _numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - numpy is an optional dependency
+        raise ImportError(
+            "homotopy continuation requires numpy; install extras: pip install 'PolynomialCalculator[algebra]'"
+        )
+    return np
+
+
+def _complex(c: Any) -> complex:
+    try:
+        return complex(c)
+    except TypeError:
+        return complex(float(c))
+
+
+def _compile(p: Polynomial, variables: Sequence[str]) -> Tuple[Any, Any]:
+    """(exponent matrix, coefficient vector) of p over variables"""
+    np = _numpy()
+    pos = {v: i for i, v in enumerate(variables)}
+    exps = np.zeros((len(p.terms), len(variables)), dtype=np.int64)
+    coeffs = np.zeros(len(p.terms), dtype=np.complex128)
+    for k, (m, c) in enumerate(p.terms.items()):
+        for v, e in zip(m.vars, m.exps):
+            if e:
+                exps[k, pos[v]] = e
+        coeffs[k] = _complex(c)
+    return exps, coeffs
+
+
+def _evaluate(compiled: Tuple[Any, Any], x: Any) -> Any:
+    """values at the rows of x (one point per row)"""
+    np = _numpy()
+    exps, coeffs = compiled
+    if not len(coeffs):
+        return np.zeros(x.shape[0], dtype=np.complex128)
+    return np.prod(x[:, None, :] ** exps[None, :, :], axis=2) @ coeffs
+
+
+class PolynomialSystem:
+    """
+    n polynomials in n variables compiled for evaluation on batches of points, with their
+    Jacobian from Polynomial.grad
+    """
+
+    def __init__(self, polynomials: Sequence[Polynomial], variables: Sequence[str]) -> None:
+        if len(polynomials) != len(variables):
+            raise ValueError(
+                "homotopy continuation needs a square system: %d equations in %d variables"
+                % (len(polynomials), len(variables))
+            )
+        self.variables = tuple(variables)
+        self.degrees = [p.degree() for p in polynomials]
+        self.functions = [_compile(p, variables) for p in polynomials]
+        self.jacobian_entries: List[List[Optional[Tuple[Any, Any]]]] = []
+        for p in polynomials:
+            gradient = p.grad
+            partial = dict(zip(gradient.variables_in_order, gradient))
+            self.jacobian_entries.append([_compile(partial[v], variables) if v in partial else None for v in variables])
+
+    def __call__(self, x: Any) -> Any:
+        np = _numpy()
+        return np.stack([_evaluate(f, x) for f in self.functions], axis=1)
+
+    def jacobian(self, x: Any) -> Any:
+        np = _numpy()
+        n = len(self.variables)
+        out = np.zeros((x.shape[0], n, n), dtype=np.complex128)
+        for i, row in enumerate(self.jacobian_entries):
+            for j, entry in enumerate(row):
+                if entry is not None:
+                    out[:, i, j] = _evaluate(entry, x)
+        return out
+
+
+def total_degree_start(degrees: Sequence[int]) -> Any:
+    """the solutions of x_i^d_i = 1, one per row"""
+    np = _numpy()
+    roots = [[cmath.exp(2j * math.pi * k / d) for k in range(d)] for d in degrees]
+    return np.array(list(itertools.product(*roots)), dtype=np.complex128).reshape(-1, len(degrees))
+
+
+def _solve(a: Any, b: Any) -> Tuple[Any, Any]:
+    """solves a[k] y[k] = b[k] for every row k, returns (y, rows where a[k] is singular)"""
+    np = _numpy()
+    try:
+        return np.linalg.solve(a, b[..., None])[..., 0], np.zeros(len(b), dtype=bool)
+    except np.linalg.LinAlgError:
+        y = np.zeros_like(b)
+        singular = np.zeros(len(b), dtype=bool)
+        for k in range(len(b)):
+            try:
+                y[k] = np.linalg.solve(a[k], b[k])
+            except np.linalg.LinAlgError:
+                singular[k] = True
+        return y, singular
+
+
+class _Homotopy:
+    """H(x, t) = (1 - t) * gamma * G(x) + t * F(x) with the total-degree start system G"""
+
+    def __init__(self, system: PolynomialSystem, gamma: complex) -> None:
+        self.system = system
+        self.gamma = gamma
+        self.degrees = _numpy().array(system.degrees)
+
+    def start(self, x: Any) -> Tuple[Any, Any]:
+        np = _numpy()
+        d = self.degrees
+        return x**d - 1, np.einsum("ij,jk->ijk", d * x ** (d - 1), np.eye(len(d)))
+
+    def __call__(self, x: Any, t: Any) -> Any:
+        g, _ = self.start(x)
+        s = t[:, None]
+        return (1 - s) * self.gamma * g + s * self.system(x)
+
+    def velocity(self, x: Any, t: Any) -> Tuple[Any, Any]:
+        """dx/dt along the path and the rows where H_x is singular"""
+        g, jg = self.start(x)
+        s = t[:, None, None]
+        hx = (1 - s) * self.gamma * jg + s * self.system.jacobian(x)
+        ht = self.system(x) - self.gamma * g
+        dx, singular = _solve(hx, -ht)
+        return dx, singular
+
+    def newton(self, x: Any, t: Any, iterations: int, tol: float) -> Tuple[Any, Any]:
+        """Newton steps on H(., t), returns the points and the rows that converged"""
+        np = _numpy()
+        converged = np.zeros(len(x), dtype=bool)
+        for _ in range(iterations):
+            _, jg = self.start(x)
+            s = t[:, None, None]
+            hx = (1 - s) * self.gamma * jg + s * self.system.jacobian(x)
+            step, singular = _solve(hx, -self(x, t))
+            x = x + step
+            size = np.linalg.norm(step, axis=1)
+            converged = ~singular & (size <= tol * (1 + np.linalg.norm(x, axis=1)))
+            if converged.all():
+                break
+        return x, converged
+
+
+def _track_batch(
+    system: PolynomialSystem, gamma: complex, starts: Any, options: Dict[str, Any]
+) -> Tuple[Any, Any, Any]:
+    """
+    tracks the paths from the rows of starts to t = 1, returns (endpoints, rows that arrived,
+    rows that were lost); a path that stalls within options["endgame"] of t = 1 without
+    running off to infinity arrives at the point it stalled at, polished on F like the others
+    """
+    np = _numpy()
+    homotopy = _Homotopy(system, gamma)
+    x = starts.copy()
+    count = len(x)
+    t = np.zeros(count)
+    dt = np.full(count, options["initial_step"])
+    streak = np.zeros(count, dtype=int)
+    active = np.ones(count, dtype=bool)
+    arrived = np.zeros(count, dtype=bool)
+    far = np.zeros(count, dtype=bool)
+    # |x| where the path entered the endgame, nan before
+    entry = np.full(count, np.nan)
+    for _ in range(options["max_steps"]):
+        rows = np.flatnonzero(active)
+        if not len(rows):
+            break
+        xs, ts = x[rows], t[rows]
+        h = np.minimum(dt[rows], 1 - ts)
+        hh = h[:, None]
+        # Runge-Kutta predictor
+        k1, s1 = homotopy.velocity(xs, ts)
+        k2, s2 = homotopy.velocity(xs + hh / 2 * k1, ts + h / 2)
+        k3, s3 = homotopy.velocity(xs + hh / 2 * k2, ts + h / 2)
+        k4, s4 = homotopy.velocity(xs + hh * k3, ts + h)
+        predicted = xs + hh / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+        corrected, converged = homotopy.newton(predicted, ts + h, 3, options["tol"])
+        ok = converged & ~(s1 | s2 | s3 | s4) & np.isfinite(corrected).all(axis=1)
+        good, bad = rows[ok], rows[~ok]
+        x[good] = corrected[ok]
+        t[good] = ts[ok] + h[ok]
+        streak[good] += 1
+        grow = good[streak[good] >= 3]
+        dt[grow] = np.minimum(dt[grow] * 2, options["max_step"])
+        streak[grow] = 0
+        dt[bad] /= 2
+        streak[bad] = 0
+        entering = good[(t[good] >= 1 - options["endgame"]) & np.isnan(entry[good])]
+        entry[entering] = np.linalg.norm(x[entering], axis=1)
+        # paths running off to infinity, even if they reached t = 1 on this step
+        gone = rows[np.linalg.norm(x[rows], axis=1) > options["infinity"]]
+        far[gone] = True
+        active[gone] = False
+        finished = good[(t[good] >= 1) & ~far[good]]
+        arrived[finished] = True
+        active[finished] = False
+        stalled = bad[dt[bad] < options["min_step"]]
+        active[stalled] = False
+    # endgame: the Jacobian is singular at a multiple root, so its paths stall just before
+    # t = 1; those whose norm kept growing since they entered the endgame go to infinity
+    stopped = ~arrived & ~far
+    size = np.linalg.norm(x, axis=1)
+    diverging = stopped & (size > 2 * (1 + np.nan_to_num(entry, nan=np.inf)))
+    endgame = stopped & ~np.isnan(entry) & ~diverging & np.isfinite(x).all(axis=1)
+    arrived |= endgame
+    lost = stopped & ~endgame & ~diverging
+    # polish the endpoints on F itself, with linear convergence at a multiple root
+    rows = np.flatnonzero(arrived)
+    if len(rows):
+        x[rows], _ = homotopy.newton(x[rows], np.ones(len(rows)), options["polish"], 1e-14)
+    return x, arrived, lost
+
+
+_DEFAULTS = {
+    "initial_step": 0.05,
+    "min_step": 1e-9,
+    "max_step": 0.1,
+    "max_steps": 100000,
+    "tol": 1e-9,
+    "polish": 100,
+    "infinity": 1e8,
+    "endgame": 1e-4,
+}
+
+
+def _work(args: Tuple[PolynomialSystem, complex, Any, Dict[str, Any]]) -> Tuple[Any, Any, Any]:
+    return _track_batch(*args)
+
+
+def solve_numeric(
+    polynomials: Sequence[Polynomial],
+    variables: Sequence[str],
+    batch_size: int = 256,
+    processes: Optional[int] = None,
+    seed: int = 0,
+    tol: float = 1e-8,
+) -> List[Dict[str, Any]]:
+    """
+    returns the isolated solutions {variable: value} of the square system found by tracking
+    the total-degree homotopy (floats for real values, complex numbers otherwise); batches of
+    batch_size paths go to a pool of processes workers when processes > 1
+    warns (RuntimeWarning) with the number of lost paths, if any
+    """
+    np = _numpy()
+    system = PolynomialSystem(polynomials, variables)
+    rng = random.Random(seed)
+    gamma = cmath.exp(2j * math.pi * rng.random())
+    starts = total_degree_start(system.degrees)
+    batches = [starts[k : k + batch_size] for k in range(0, len(starts), batch_size)]
+    jobs = [(system, gamma, batch, _DEFAULTS) for batch in batches]
+    if processes is not None and processes > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(processes) as pool:
+            results = list(pool.map(_work, jobs))
+    else:
+        results = [_work(job) for job in jobs]
+    endpoints = [row for x, arrived, _ in results for row in x[arrived]]
+    lost = sum(int(lost.sum()) for _, _, lost in results)
+    # residuals are measured relative to the coefficients of each equation, so that a point
+    # far out (where every residual is large) is not accepted by a tolerance growing with it
+    norms = np.array([max(np.abs(coeffs).sum(), 1.0) for _, coeffs in system.functions])
+    points: List[Any] = []
+    for p in endpoints:
+        scale = 1 + np.linalg.norm(p)
+        residual = np.linalg.norm(system(p[None, :])[0] / norms)
+        if not np.isfinite(residual) or residual > tol * max(1, max(system.degrees)):
+            lost += 1  # not a solution of F: the path lost its way
+            continue
+        if any(np.linalg.norm(p - q) <= 1e-6 * scale for q in points):
+            continue  # a multiple root reached by several paths
+        points.append(p)
+    if lost:
+        warnings.warn(
+            "%d of %d homotopy paths were lost, solutions may be missing" % (lost, len(starts)), RuntimeWarning
+        )
+    out: List[Dict[str, Any]] = []
+    for p in points:
+        point: Dict[str, Any] = {}
+        for v, z in zip(variables, p):
+            z = complex(z)
+            point[v] = z.real if abs(z.imag) <= 1e-8 * (1 + abs(z)) else z
+        out.append(point)
+    return out
@@ -1,8 +1,22 @@
+from fractions import Fraction
 from itertools import combinations
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Any, Collection, Dict, Iterable, List, Optional, Set, Tuple, Union
 
-from polynomials.polynomial import Polynomial, division_algorithm, lcm
+from polynomials import groebner, homotopy, monomials
+from polynomials.checkpoint import Checkpointer, load_checkpoint
+from polynomials.execution import ExecutionContext, Incomplete
+from polynomials.fglm import NotZeroDimensional, fglm
+from polynomials.groebner_cache import get_groebner_cache, ideal_fingerprint
+from polynomials.groebner_stats import GroebnerStats, timed
+from polynomials.groebner_walk import groebner_walk
+from polynomials.hilbert import HilbertSeries, hilbert_series
+from polynomials.modular_solver import modular_solutions
+from polynomials.monomial_index import MonomialIndex
+from polynomials.orderings import monomial_key
+from polynomials.polynomial import Polynomial, division_algorithm
 from polynomials.primitives.polycalc_numbers import Integer, Rational
+from polynomials.reducer import _CANCEL_EPS, Reducer, from_sparse, to_sparse
+from polynomials.rur import RationalUnivariateRepresentation, rational_univariate_representation, rur_solutions
 
 # Numeric types used in solutions/coefficients
 NumberLike = Union[Integer, Rational, int, float]
@@ -13,10 +27,80 @@ __all__ = [
 ]
 
 
+# fingerprint tag of the bases computed by the original Buchberger implementation
+_LEGACY_ORDER = "legacy"
+
+
+def _common_variables(polynomials: Iterable[Polynomial]) -> Tuple[str, ...]:
+    names: Set[str] = set()
+    for p in polynomials:
+        names.update(p.variables)
+    return tuple(sorted(names))
+
+
+def _exponents(term: Polynomial, variables: Tuple[str, ...]) -> Tuple[int, ...]:
+    """exponent tuple over variables of the single monomial in term"""
+    (exps,) = to_sparse(term, variables)
+    return exps
+
+
+# (number of terms, leading exponents): equal polynomials have equal signatures
+Signature = Tuple[int, Optional[Tuple[int, ...]]]
+
+
+def _lead(p: Polynomial, variables: Tuple[str, ...]) -> Tuple[int, ...]:
+    """leading exponents of p as division_algorithm sees them (graded, over the sorted variables)"""
+    return max(to_sparse(p, variables), key=lambda e: (sum(e), e))
+
+
+def _signature(p: Polynomial, variables: Tuple[str, ...]) -> Signature:
+    return (len(p.terms), _lead(p, variables) if p.terms else None)
+
+
+def _same(p: Polynomial, p_signature: Signature, q: Polynomial, q_signature: Signature) -> bool:
+    """p == q, comparing the polynomials only when their signatures agree"""
+    return p is q or (p_signature == q_signature and p == q)
+
+
+def _position(
+    polys: List[Polynomial], signatures: List[Signature], p: Polynomial, signature: Signature
+) -> Optional[int]:
+    """index of the first element equal to p (the one list.remove(p) takes out), None if there is none"""
+    for k, q in enumerate(polys):
+        if _same(q, signatures[k], p, signature):
+            return k
+    return None
+
+
+def _product_criterion(f: Polynomial, g: Polynomial) -> bool:
+    """lcm(LM(f), LM(g)) == LM(f) * LM(g)"""
+    variables = tuple(sorted(set(f.vars) | set(g.vars)))
+    return monomials.coprime(_lead(f, variables), _lead(g, variables))
+
+
+def _solution_key(variables: List[str]) -> Any:
+    """sort key for solutions, by float value of the variables in order"""
+
+    def to_float(x: NumberLike) -> Tuple[float, float]:
+        # complex roots (from the quartic/cubic formulas) sort by real part, then imaginary
+        if isinstance(x, complex):
+            return (x.real, x.imag)
+        return (float(x), 0.0)
+
+    def key_fn(d: Dict[str, NumberLike]) -> Tuple[Tuple[float, float], ...]:
+        return tuple(to_float(d.get(k)) for k in variables)  # type: ignore[arg-type]
+
+    return key_fn
+
+
 class Ideal:
 
     def __init__(self, *polynomials: Polynomial) -> None:
         self.polynomials: Tuple[Polynomial, ...] = polynomials
+        self._reducer: Optional[Reducer] = None
+        self._lead_index: Optional[Tuple[Tuple[str, ...], MonomialIndex]] = None
+        # open Buchberger runs per monomial order, with the variable names they are taken over
+        self._states: Dict[str, Tuple[Tuple[str, ...], groebner.GroebnerState]] = {}
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -42,8 +126,21 @@ class Ideal:
         """
         S(f, g) = (x^gamma / LT(f)) * f - (x^gamma / LT(g)) * g
         x^gamma = least_common_multiple(leading_monomial(f), leading_monomial(g))
+        taken over the variables of f and g, with coefficient 1 on x^gamma
         """
-        return (lcm(f.LT(), g.LT()) / f.LT()) * f - (lcm(f.LT(), g.LT()) / g.LT()) * g
+        variables = tuple(sorted(set(f.vars) | set(g.vars)))
+        char = max(f.field_characteristic, g.field_characteristic)
+        f_terms, g_terms = to_sparse(f, variables, char), to_sparse(g, variables, char)
+        ef, eg = _lead(f, variables), _lead(g, variables)
+        m = monomials.lcm(ef, eg)
+        if char:
+            f_scale, g_scale = pow(f_terms[ef], -1, char), pow(g_terms[eg], -1, char)
+        else:
+            f_scale, g_scale = 1 / f_terms[ef], 1 / g_terms[eg]
+        terms = monomials.spoly(
+            f_terms, monomials.quotient(m, ef), f_scale, g_terms, monomials.quotient(m, eg), g_scale, m, char
+        )
+        return from_sparse(terms, variables, char)
 
     @staticmethod
     def minimize(G: Iterable[Polynomial]) -> List[Polynomial]:
@@ -52,16 +149,27 @@ class Ideal:
         For all p ∈ G, no monomial of p lies in <LT(G −{p})>
         """
         res = list(G)
-        extra: List[Polynomial] = list()
-        for p in res:
-            for term in p.terms():
-                for q in res:
-                    if p != q:
-                        if term % q.LT() == 0:
-                            extra.append(p)
-        for p in extra:
-            if p in res:
-                res.remove(p)
+        variables = _common_variables(res)
+        signatures = [_signature(p, variables) for p in res]
+        index = MonomialIndex(len(variables))
+        for k, q in enumerate(res):
+            if q.terms:
+                index.add(_exponents(q.LT(), variables), k)
+        extra: List[Tuple[Polynomial, Signature]] = list()
+        for k, p in enumerate(res):
+            # p goes if some LT(q), q != p, divides one of its monomials
+            if any(
+                not _same(res[d], signatures[d], p, signatures[k])
+                for m in to_sparse(p, variables)
+                for d in index.divisors(m)
+                if d != k
+            ):
+                extra.append((p, signatures[k]))
+        for p, signature in extra:
+            k = _position(res, signatures, p, signature)
+            if k is not None:
+                del res[k]
+                del signatures[k]
         return res
 
     @staticmethod
@@ -70,64 +178,371 @@ class Ideal:
         input minimum basis for G
         output reduced basis
         http://pi.math.cornell.edu/~dmehrle/notes/old/alggeo/15BuchbergersAlgorithm.pdf
+        each element is divided by the ones after it and the remainders before it, as with
+        division_algorithm(h, *rest), by groebner.divide_in_turn in the graded order of
+        division_algorithm (the leading monomials are indexed, and each term finds its divisor
+        without trying the others)
         """
         res = list(G)
-        for i in range(len(G)):
-            res.remove(G[i])
-            # Apply division algorithm against each polynomial in res
-            h = G[i]
-            if res:  # Only if there are polynomials to divide by
-                _, h = division_algorithm(h, *res)
-            if h != 0:
-                res = [h] + res
-        return res
+        variables = _common_variables(res)
+        chars = {p.field_characteristic for p in res}
+        char = max(chars) if chars else 0
+        terms = [to_sparse(p, variables, char) for p in res]
+        remainders = groebner.divide_in_turn(terms, len(variables), "grlex", char, _CANCEL_EPS)
+        return [from_sparse(r, variables, char) for r in remainders]
 
-    def groebner_basis(self) -> List[Polynomial]:
+    def groebner_basis(
+        self,
+        order: Optional[str] = None,
+        context: Optional[ExecutionContext] = None,
+        checkpoint: Optional[str] = None,
+        checkpoint_interval: float = 60.0,
+        resume_from: Optional[str] = None,
+        stats: bool = False,
+    ) -> Union[List[Polynomial], Tuple[List[Polynomial], GroebnerStats]]:
         """
         returns reduced groebner basis
+        order=None runs the original Buchberger implementation; "lex", "grlex" or "grevlex"
+        returns the monic reduced basis for that order, computed exactly (see polynomials.groebner)
+        results are memoized by the process-wide GroebnerCache (see polynomials.groebner_cache)
+        with a context (see polynomials.execution) the computation raises Incomplete, holding the
+        basis reached so far, when the deadline passes, it is cancelled or runs out of steps;
+        nothing is cached then, and for an order the next call resumes where it stopped
+        checkpoint=path saves the run of an order every checkpoint_interval seconds, when it is
+        stopped and when it finishes; resume_from=path continues a saved run (its order by default)
+        (see polynomials.checkpoint)
+        stats=True returns (basis, GroebnerStats), computed from scratch without the cache or the
+        open runs (see polynomials.groebner_stats)
+        """
+        if stats:
+            if checkpoint is not None or resume_from is not None:
+                raise ValueError("stats are collected from scratch, without checkpoints")
+            return self._with_stats(order, context)
+        if resume_from is not None:
+            order = self._resume(resume_from, order)
+        if order is None:
+            if checkpoint is not None:
+                raise ValueError("checkpoints need a monomial order")
+            return get_groebner_cache().get_or_compute(
+                ideal_fingerprint(self.polynomials, _LEGACY_ORDER), lambda: self._buchberger(context)
+            )
+        monomial_key(order)  # unknown orders fail before touching the cache
+        return get_groebner_cache().get_or_compute(
+            ideal_fingerprint(self.polynomials, order),
+            lambda: self._basis(order, context, checkpoint, checkpoint_interval),
+        )
+
+    def _with_stats(
+        self, order: Optional[str], context: Optional[ExecutionContext]
+    ) -> Tuple[List[Polynomial], GroebnerStats]:
+        report = GroebnerStats(engine="legacy" if order is None else "exact", order=order or _LEGACY_ORDER)
+        with report.measure():
+            if order is None:
+                basis = self._buchberger(context, report)
+            else:
+                names, char, exact = groebner.exact_system(self.polynomials)
+                state = groebner.GroebnerState(len(names), order, char)
+                state.stats = report
+                state.add(exact)
+                try:
+                    terms = state.basis(context)
+                except Incomplete as e:
+                    e.partial = [groebner.from_exact(g, names, char) for g in e.partial]
+                    raise
+                basis = [groebner.from_exact(g, names, char) for g in terms]
+        return basis, report
+
+    def _resume(self, path: str, order: Optional[str]) -> str:
+        """
+        loads the run saved at path as the open run of its order, returns the order
+        """
+        names, fingerprint, state = load_checkpoint(path)
+        if order is None and isinstance(state.order, str):
+            order = state.order
+        if (
+            state.order != order
+            or names != _common_variables(self.polynomials)
+            or fingerprint != ideal_fingerprint(self.polynomials, order)
+        ):
+            raise ValueError("checkpoint %s belongs to another ideal or monomial order" % path)
+        self._states[order] = (names, state)
+        return order
+
+    def add_generators(self, *polynomials: Polynomial) -> "Ideal":
+        """
+        returns the ideal with the extra generators
+        Groebner bases already computed here for an order are extended: the new ideal starts from
+        the current basis and pending pairs and only processes the pairs of the new generators
+        """
+        ideal = Ideal(*(self.polynomials + polynomials))
+        names = _common_variables(ideal.polynomials)
+        chars = {p.field_characteristic for p in polynomials}
+        for order, (old_names, state) in self._states.items():
+            char = max(chars | {state.char})
+            if char != state.char:
+                continue  # over another field, recomputed from scratch
+            extended = state.widened([names.index(v) for v in old_names], len(names))
+            extended.add(groebner.to_exact(p, names, char) for p in polynomials)
+            ideal._states[order] = (names, extended)
+        return ideal
+
+    def _exact_basis(
+        self,
+        order: str,
+        context: Optional[ExecutionContext] = None,
+        checkpoint: Optional[str] = None,
+        checkpoint_interval: float = 60.0,
+    ) -> Tuple[Tuple[str, ...], int, List[groebner.Terms]]:
+        """
+        returns (variable names, characteristic, exact reduced basis for order) from the open run for order
+        """
+        entry = self._states.get(order)
+        if entry is None:
+            names, char, exact = groebner.exact_system(self.polynomials)
+            state = groebner.GroebnerState(len(names), order, char)
+            state.add(exact)
+            entry = self._states[order] = (names, state)
+        names, state = entry
+        checkpointer = None
+        if checkpoint is not None:
+            fingerprint = ideal_fingerprint(self.polynomials, order)
+            checkpointer = Checkpointer(checkpoint, names, fingerprint, checkpoint_interval)
+        try:
+            basis = state.basis(context, checkpointer)
+        except Incomplete as e:
+            if checkpointer is not None:
+                checkpointer.save(state)
+            e.partial = [groebner.from_exact(g, names, state.char) for g in e.partial]
+            raise
+        if checkpointer is not None:
+            checkpointer.save(state)
+        return names, state.char, basis
+
+    def _basis(
+        self,
+        order: str,
+        context: Optional[ExecutionContext] = None,
+        checkpoint: Optional[str] = None,
+        checkpoint_interval: float = 60.0,
+    ) -> List[Polynomial]:
+        names, char, basis = self._exact_basis(order, context, checkpoint, checkpoint_interval)
+        return [groebner.from_exact(g, names, char) for g in basis]
+
+    def lex_basis(self, context: Optional[ExecutionContext] = None) -> List[Polynomial]:
+        """
+        returns the reduced lex Groebner basis of a zero-dimensional ideal
+        computed as the grevlex basis and converted with FGLM, which is much cheaper than lex Buchberger
+        raises NotZeroDimensional otherwise; the context bounds the grevlex computation
+        """
+        return get_groebner_cache().get_or_compute(
+            ideal_fingerprint(self.polynomials, "lex"), lambda: self._fglm_lex(context)
+        )
+
+    def walk_basis(self, order: str = "lex", start: str = "grevlex") -> List[Polynomial]:
+        """
+        returns the reduced Groebner basis for order, computed for the start order and converted
+        with the Groebner walk; unlike lex_basis this works for ideals of any dimension
+        """
+        monomial_key(order)
+        monomial_key(start)
+        return get_groebner_cache().get_or_compute(
+            ideal_fingerprint(self.polynomials, order), lambda: self._walk(order, start)
+        )
+
+    def _walk(self, order: str, start: str) -> List[Polynomial]:
+        names, char, basis = self._exact_basis(start)
+        return [groebner.from_exact(g, names, char) for g in groebner_walk(basis, len(names), start, order, char)]
+
+    def _fglm_lex(self, context: Optional[ExecutionContext] = None) -> List[Polynomial]:
+        names, char, grevlex = self._exact_basis("grevlex", context)
+        return [groebner.from_exact(g, names, char) for g in fglm(grevlex, len(names), "grevlex", "lex", char)]
+
+    def hilbert_series(self) -> HilbertSeries:
+        """
+        returns the Hilbert series of the quotient ring as numerator(t) / (1 - t)^dimension,
+        read off the leading monomials of the grevlex basis (see polynomials.hilbert)
         """
+        names, _, basis = self._exact_basis("grevlex")
+        key = monomial_key("grevlex")
+        leads = [groebner.leading_monomial(g, key) for g in basis]
+        return hilbert_series(leads, len(names))
+
+    def dimension(self) -> int:
+        """
+        returns the Krull dimension of the ideal: 0 for finitely many solutions, -1 for no solutions
+        """
+        return self.hilbert_series().dimension
+
+    def degree(self) -> int:
+        """
+        returns the degree of the ideal, for dimension 0 the number of solutions counted with multiplicity
+        """
+        return self.hilbert_series().degree
+
+    def rational_univariate_representation(self) -> RationalUnivariateRepresentation:
+        """
+        returns the rational univariate representation of a zero-dimensional ideal over Q:
+        one squarefree polynomial in a separating linear form and rational functions for the
+        variables, computed from the grevlex basis (see polynomials.rur)
+        raises NotZeroDimensional otherwise, ValueError for coefficients outside Q
+        """
+        names, char, basis = self._exact_basis("grevlex")
+        if char:
+            raise ValueError("rational univariate representations need characteristic 0")
+        return rational_univariate_representation(basis, names, "grevlex")
+
+    def _rur_solutions(self) -> List[Dict[str, NumberLike]]:
+        solutions: List[Dict[str, NumberLike]] = []
+        for point in rur_solutions(self.rational_univariate_representation()):
+            solutions.append(
+                {
+                    v: Rational(x.numerator, x.denominator) if isinstance(x, Fraction) else x  # type: ignore[misc]
+                    for v, x in point.items()
+                }
+            )
+        return solutions
+
+    def solve_numeric(
+        self, batch_size: int = 256, processes: Optional[int] = None, seed: int = 0
+    ) -> List[Dict[str, NumberLike]]:
+        """
+        returns the isolated solutions of a square system (as many equations as variables) by
+        homotopy continuation from the total-degree start system, as floats for real values and
+        complex numbers otherwise; seed picks the random path constant, batches of batch_size
+        paths are tracked together and spread over processes workers (see polynomials.homotopy)
+        raises ValueError for non-square systems and coefficients in F_p, ImportError without numpy
+        """
+        if any(p.field_characteristic for p in self.polynomials):
+            raise ValueError("numeric solving needs characteristic 0")
+        variables: Set[str] = set()
+        for p in self.polynomials:
+            variables = variables.union(p.variables)
+        variables_list = sorted(variables)
+        solutions = homotopy.solve_numeric(self.polynomials, variables_list, batch_size, processes, seed)
+        solutions.sort(key=_solution_key(variables_list))  # type: ignore[arg-type]
+        return solutions
+
+    def _buchberger(
+        self, context: Optional[ExecutionContext] = None, stats: Optional[GroebnerStats] = None
+    ) -> List[Polynomial]:
         B: Set[Tuple[int, int]] = set(combinations(range(len(self.polynomials)), 2))
-        G = Ideal.reduce(list(self.polynomials))
+        with timed(stats, "interreduction"):
+            G = Ideal.reduce(list(self.polynomials))
         F: List[Optional[Polynomial]] = list(self.polynomials)
     # polynomials are indexed 0..len(self.polynomials)-1
         t = 0
+        top = 0  # largest degree reached, for progress reports
+        if stats is not None:
+            stats.pairs_created = len(B)
         while B:
+            if context is not None:
+                context.check(partial=lambda: list(G), pairs_processed=1, basis_size=len(G), degree=top)
             (i, j) = B.pop()
-            if lcm(F[i].LT(), F[j].LT()) != F[i].LT() * F[j].LT() and not self.criterion(i, j, B):
+            coprime = _product_criterion(F[i], F[j])
+            if coprime or self.criterion(i, j, B):
+                if stats is not None:
+                    if coprime:
+                        stats.pruned_product += 1
+                    else:
+                        stats.pruned_chain += 1
+                continue
+            with timed(stats, "spoly"):
                 S_poly = Ideal.s_polynomial(F[i], F[j])
-                # Reduce S_poly by the polynomials in G using division algorithm
+            # Reduce S_poly by the polynomials in G using division algorithm
+            with timed(stats, "reduction"):
                 if G:  # Only if there are polynomials to divide by
                     _, S = division_algorithm(S_poly, *G)
                 else:
                     S = S_poly
-                if S != 0:
-                    t += 1
-                    # Extend F if necessary
-                    while len(F) <= t:
-                        F.append(None)
-                    F[t] = S
-                    G.append(F[t])
-                    # reduce G as we are adding to it
+            if stats is not None:
+                stats.pairs_processed += 1
+                stats.terms(len(S_poly.terms))
+                stats.terms(len(S.terms))
+                if S == 0:
+                    stats.reductions_to_zero += 1
+            if S != 0:
+                t += 1
+                top = max(top, S.degree())
+                # Extend F if necessary
+                while len(F) <= t:
+                    F.append(None)
+                F[t] = S
+                G.append(F[t])
+                # reduce G as we are adding to it
+                with timed(stats, "interreduction"):
                     G = Ideal.reduce(G)
                     G = Ideal.minimize(G)
-                    B = B.union(set(combinations(range(t - 1), 2)))
+                pending = len(B)
+                B = B.union(set(combinations(range(t - 1), 2)))
+                if stats is not None:
+                    stats.pairs_created += len(B) - pending
+        if stats is not None:
+            stats.basis_size = len(G)
         return G
 
+    def reducer(self) -> Reducer:
+        """
+        returns a Reducer prepared with the Groebner basis, built once per Ideal
+        """
+        if self._reducer is None:
+            self._reducer = Reducer(self.groebner_basis())
+        return self._reducer
+
+    def normal_form(self, p: Polynomial) -> Polynomial:
+        """
+        returns the remainder of p on division by the Groebner basis
+        """
+        return self.reducer().reduce(p)
+
+    def normal_forms(self, polys: Iterable[Polynomial]) -> List[Polynomial]:
+        """
+        normal_form for many polynomials, sharing one prepared basis
+        """
+        return self.reducer().reduce_many(polys)
+
+    def contains(self, p: Polynomial) -> bool:
+        """
+        ideal membership: p is in the ideal iff its normal form is zero
+        """
+        return self.reducer().is_zero(p)
+
     def criterion(self, i: int, j: int, B: Set[Tuple[int, int]]) -> bool:
         """
         # Criterion( fi, f j, B) is true provided that there is some k not in {i, j}
         # for which the pairs (i,k) and (j,k) are not in B and LT(fk) divides LCM(LT(fi), LT(fj)).
         """
         F = self.polynomials
+        multiples: Optional[Set[int]] = None
         for k in range(len(F)):
             if k == i or k == j:
                 continue
             elif (i, k) in B or (j, k) in B or (k, i) in B or (k, j) in B:
                 continue
-            elif F[k].LT() % lcm(F[i].LT(), F[j].LT()) == 0:
+            if multiples is None:
+                multiples = self._lead_multiples(F[i], F[j])
+            if k in multiples:
                 return True
         return False
 
+    def _lead_multiples(self, f: Polynomial, g: Polynomial) -> Set[int]:
+        """
+        returns the positions k of the generators with lcm(LT(f), LT(g)) dividing LT(F[k])
+        (a zero generator counts as a multiple of everything)
+        """
+        if self._lead_index is None:
+            variables = _common_variables(self.polynomials)
+            index = MonomialIndex(len(variables))
+            for k, p in enumerate(self.polynomials):
+                if p.terms:
+                    index.add(_exponents(p.LT(), variables), k)
+            self._lead_index = (variables, index)
+        variables, index = self._lead_index
+        zero = {k for k, p in enumerate(self.polynomials) if not p.terms}
+        if not f.terms or not g.terms:
+            return zero
+        a, b = _exponents(f.LT(), variables), _exponents(g.LT(), variables)
+        return zero.union(index.multiples(tuple(max(x, y) for x, y in zip(a, b))))
+
     # Solve multivariable polynomials via Groebner basis:
     # 1. Apply up with criteria to tell whether there are finitely many solutions
     #     Criteria: For I in k[x_1, x_2, ..., x_n], V(I) is a finite set if:
@@ -211,20 +626,45 @@ class Ideal:
                         Ideal.find_solutions(groebner_basis, zeroes, solution)
                     break
 
+    def _solving_basis(self, variables: List[str]) -> Optional[List[Polynomial]]:
+        """
+        returns the lex basis used for back substitution, None if there are not finitely many solutions
+        coefficients the exact engine cannot take (complex) fall back to the original basis
+        """
+        try:
+            # the Hilbert series only needs the grevlex basis, so infinite systems stop before FGLM
+            if self.dimension() > 0:
+                return None
+            return self.lex_basis()
+        except NotZeroDimensional:
+            return None
+        except ValueError:
+            basis = self.groebner_basis()
+            return basis if Ideal.solvability_criteria(basis, variables) else None
+
+    def _field_characteristic(self) -> int:
+        return max((p.field_characteristic for p in self.polynomials), default=0)
+
     def solve_system(self) -> str:
         """
         If finite solutions exist, output solutions
         Otherwise output "finite solutions don't exit"
+        Over F_p the solutions in F_p^n are found from a lex basis by root finding
+        (see polynomials.modular_solver)
         """
         variables: Set[str] = set()
         for p in self.polynomials:
             variables = variables.union(p.variables)
         variables_list = sorted(list(variables))  # lex ordering
-        groebner_basis = self.groebner_basis()
-        zeroes: Set[frozenset] = set()
-        if not Ideal.solvability_criteria(groebner_basis, variables_list):
-            return "finite solutions don't exit"
-        Ideal.find_solutions(groebner_basis, zeroes)
+        zeroes: Collection[frozenset]
+        if self._field_characteristic():
+            zeroes = [frozenset(point.items()) for point in modular_solutions(self.polynomials, variables_list)]
+        else:
+            groebner_basis = self._solving_basis(variables_list)
+            zeroes = set()
+            if groebner_basis is None:
+                return "finite solutions don't exit"
+            Ideal.find_solutions(groebner_basis, zeroes)
         output_string = str(len(zeroes)) + " solutions: \n"
         for zero in zeroes:
             zero_list = list(zero)
@@ -236,18 +676,39 @@ class Ideal:
         output_string = output_string[:-2]
         return output_string
 
-    def solve_system_structured(self) -> Optional[List[Dict[str, NumberLike]]]:
+    def solve_system_structured(self, method: str = "lex") -> Optional[List[Dict[str, NumberLike]]]:
         """Return solutions as a structured list of dictionaries.
         Each dict maps variable name (str) to a numeric value (Integer/Rational/int/float).
         If the system does not have finitely many solutions, return None.
+        method "lex" substitutes roots back into the lex basis; "rur" finds the roots of the
+        rational univariate representation in one go, with exact Integer/Rational values for
+        rational solutions and float/complex values otherwise
+        Over F_p both methods return the solutions in F_p^n as ints in 0, ..., p - 1, found from a
+        lex basis by root finding (see polynomials.modular_solver)
         """
+        if method not in ("lex", "rur"):
+            raise ValueError("unknown solving method: %s" % method)
         variables: Set[str] = set()
         for p in self.polynomials:
             variables = variables.union(p.variables)
         variables_list = sorted(list(variables))  # lex ordering
-        groebner_basis = self.groebner_basis()
+        if self._field_characteristic():
+            return modular_solutions(self.polynomials, variables_list)  # type: ignore[return-value]
+        if method == "rur":
+            try:
+                if self.dimension() > 0:
+                    return None
+                solutions = self._rur_solutions()
+            except NotZeroDimensional:
+                return None
+            except ValueError:
+                # complex or F_p coefficients: back substitution
+                return self.solve_system_structured("lex")
+            solutions.sort(key=_solution_key(variables_list))  # type: ignore[arg-type]
+            return solutions
+        groebner_basis = self._solving_basis(variables_list)
         zeroes: Set[frozenset] = set()
-        if not Ideal.solvability_criteria(groebner_basis, variables_list):
+        if groebner_basis is None:
             return None
         Ideal.find_solutions(groebner_basis, zeroes)
         solutions: List[Dict[str, NumberLike]] = []
@@ -261,13 +722,5 @@ class Ideal:
             solutions.append(clean)
 
         # Sort list of solutions deterministically using float as key only
-        def key_fn(d: Dict[str, NumberLike]):
-            def to_float(x: NumberLike) -> float:
-                if isinstance(x, (Integer, Rational)):
-                    return float(x)
-                return float(x)
-
-            return tuple(to_float(d.get(k)) for k in variables_list)
-
-        solutions.sort(key=key_fn)  # type: ignore[arg-type]
+        solutions.sort(key=_solution_key(variables_list))  # type: ignore[arg-type]
         return solutions
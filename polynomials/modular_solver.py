@@ -0,0 +1,88 @@
+"""
+Solutions over F_p by a lex Groebner basis and univariate root finding.
+
+Grid search (polynomials.grid_solver) evaluates the system at all p^n points. Here the reduced
+lex basis G over F_p is computed first, with x_1 > ... > x_n the sorted variables. The elements
+of G free of x_1, ..., x_(k-1) generate the elimination ideal in x_k, ..., x_n. So the values of
+x_k that extend a partial solution (a_(k+1), ..., a_n) are the common roots in F_p of those
+elements with the a substituted. They are the roots of one gcd, found by factoring
+(polynomials.factorization.roots_mod). Going from x_n up to x_1 then gives exactly the
+solutions in F_p^n, in O(degree) field operations per step instead of p.
+
+When every element of a level vanishes at a partial solution, which happens for systems of
+positive dimension, all of F_p is tried for that variable; max_points bounds the number of
+partial solutions that creates.
+
+Lex bases can be expensive where grids are not: over fields with at most grid_points points in
+F_p^n the grid is searched instead.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from polynomials.factorization import roots_mod
+from polynomials.grid_solver import grid_solutions
+from polynomials.groebner import Terms, exact_system, reduced_groebner_basis
+from polynomials.polynomial import Polynomial
+from polynomials.univariate import Dense, gcd_mod, trim
+
+__all__ = [
+    "GRID_POINTS",
+    "MAX_POINTS",
+    "modular_solutions",
+]
+
+GRID_POINTS = 10**5
+MAX_POINTS = 10**6
+
+
+def _image(g: Terms, k: int, tail: Tuple[int, ...], p: int) -> Dense:
+    """g with x_(k+1), ... replaced by the values in tail, dense in x_k"""
+    dense = [0] * (max(m[k] for m in g) + 1)
+    for m, c in g.items():
+        v = c
+        for e, a in zip(m[k + 1 :], tail):
+            if e:
+                v = v * pow(a, e, p) % p
+        dense[m[k]] = (dense[m[k]] + v) % p
+    return trim(dense)
+
+
+def modular_solutions(
+    polynomials: Sequence[Polynomial],
+    variables: Optional[Sequence[str]] = None,
+    max_points: int = MAX_POINTS,
+    grid_points: int = GRID_POINTS,
+) -> List[Dict[str, int]]:
+    """
+    returns every common zero {variable: value in 0, ..., p - 1} in F_p^n of polynomials over F_p,
+    in lex order of the sorted variables, as polynomials.grid_solver.grid_solutions
+    raises ValueError for characteristic 0 or more than max_points partial solutions
+    """
+    names, char, exact = exact_system(polynomials, variables)
+    if not char:
+        raise ValueError("modular solving needs polynomials over F_p")
+    nvars = len(names)
+    if char**nvars <= grid_points:
+        return grid_solutions(polynomials, names)
+    basis = reduced_groebner_basis([f for f in exact if f], nvars, "lex", char)
+    if {(0,) * nvars: 1} in basis:
+        return []
+    partial: List[Tuple[int, ...]] = [()]
+    for k in range(nvars - 1, -1, -1):
+        level = [g for g in basis if all(not any(m[:k]) for m in g)]
+        extended: List[Tuple[int, ...]] = []
+        for tail in partial:
+            constraint: Dense = []
+            for g in level:
+                constraint = gcd_mod(constraint, _image(g, k, tail, char), char)
+                if len(constraint) == 1:
+                    break
+            if constraint:
+                values = roots_mod(constraint, char)
+            else:
+                if (len(extended) + 1) * char > max_points:
+                    raise ValueError("more than %d partial solutions over F_%d" % (max_points, char))
+                values = list(range(char))
+            extended.extend((a,) + tail for a in values)
+        partial = extended
+    return [dict(zip(names, point)) for point in sorted(partial)]
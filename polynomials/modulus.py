@@ -0,0 +1,147 @@
+"""
+Arithmetic modulo one fixed univariate polynomial over F_p.
+
+Polynomial % h runs the general multivariate division_algorithm on every call. A Modulus does
+the work that only depends on h once: h is stored as a dense coefficient list and the power
+series inverse of its reversal is precomputed by Newton iteration. The remainder of a product
+of two reduced elements then costs two multiplications (Barrett reduction: the reversed
+quotient is a truncated product with the stored inverse, the remainder the low part of
+a - q h), see polynomials.univariate.fast_divmod_mod. Below NEWTON_DIVISION_LENGTH schoolbook
+division is cheaper and is used instead.
+
+The p-th power map a -> a^p mod h is F_p-linear. frobenius_dense applies it as the matrix of
+the powers x^(ip) mod h, i < deg h, computed on first use. Its rows are packed into integers as
+in Kronecker substitution, so one application is a single integer linear combination instead of
+the log p products of powmod. That pays off once it is applied about deg h / log p times, as in
+distinct-degree factorization (polynomials.factorization).
+
+Elements can be passed as Polynomials or, to skip the conversions in tight loops, as dense
+coefficient lists (the *_dense methods), constant term first with residues in [0, p).
+"""
+
+from typing import List, Optional
+
+from polynomials.polynomial import Polynomial
+from polynomials.univariate import (
+    NEWTON_DIVISION_LENGTH,
+    Dense,
+    divmod_mod,
+    fast_divmod_mod,
+    from_dense,
+    inverse_series_mod,
+    invmod_mod,
+    mul_mod,
+    to_dense,
+    trim,
+    window_power,
+)
+
+__all__ = [
+    "Modulus",
+]
+
+
+class Modulus:
+    """
+    a univariate polynomial h over F_p prepared for many reductions, products and powers mod h
+    """
+
+    def __init__(self, h: Polynomial, variable: Optional[str] = None) -> None:
+        names = h.variables
+        if len(names) > 1:
+            raise ValueError("Modulus needs a polynomial in one variable")
+        if not h.field_characteristic:
+            raise ValueError("Modulus works over F_p: the polynomial needs a field characteristic")
+        self.h = h
+        self.variable: str = variable or (names[0] if names else "x")
+        self.char: int = h.field_characteristic
+        self.dense: Dense = to_dense(h, self.variable, self.char)
+        if not self.dense:
+            raise ZeroDivisionError("modulus is the zero polynomial")
+        self.degree: int = len(self.dense) - 1
+        self._newton = self.degree >= NEWTON_DIVISION_LENGTH
+        # products of two reduced elements have quotients of at most deg h - 1 terms
+        self._inverse: Dense = inverse_series_mod(self.dense[::-1], max(self.degree - 1, 1), self.char)
+        self._frobenius: Optional[List[int]] = None
+        self._width = ((self.char - 1) ** 2 * max(self.degree, 1)).bit_length() // 8 + 1
+
+    def __repr__(self) -> str:
+        return f"Modulus({self.h})"
+
+    # dense coefficient lists
+
+    def to_dense(self, a: Polynomial) -> Dense:
+        return to_dense(a, self.variable, self.char)
+
+    def from_dense(self, a: Dense) -> Polynomial:
+        return from_dense(a, self.variable, self.char)
+
+    def reduce_dense(self, a: Dense) -> Dense:
+        if len(a) <= self.degree:
+            return a
+        if not self._newton:
+            return divmod_mod(a, self.dense, self.char)[1]
+        m = len(a) - self.degree
+        if m > len(self._inverse):
+            self._inverse = inverse_series_mod(self.dense[::-1], m, self.char)
+        return fast_divmod_mod(a, self.dense, self.char, self._inverse)[1]
+
+    def mulmod_dense(self, a: Dense, b: Dense) -> Dense:
+        return self.reduce_dense(mul_mod(a, b, self.char))
+
+    def sqrmod_dense(self, a: Dense) -> Dense:
+        return self.reduce_dense(mul_mod(a, a, self.char))
+
+    def powmod_dense(self, a: Dense, e: int) -> Dense:
+        """
+        a^e mod h by sliding window exponentiation; negative exponents invert a first
+        (ValueError if a is not invertible)
+        """
+        a = self.reduce_dense(a)
+        if e < 0:
+            inverse = invmod_mod(a, self.dense, self.char)
+            if inverse is None:
+                raise ValueError("polynomial is not invertible modulo h")
+            a, e = inverse, -e
+        if self.degree == 0:
+            return []
+        if e == 0 or not a:
+            return [1] if e == 0 else []
+        return window_power(a, e, self.mulmod_dense)
+
+    def frobenius_dense(self, a: Dense) -> Dense:
+        """a^p mod h, p the characteristic, by the packed Frobenius matrix"""
+        a = self.reduce_dense(a)
+        if not a:
+            return []
+        width = self._width
+        if self._frobenius is None:
+            x_p = self.powmod_dense([0, 1], self.char)
+            rows = [[1]]
+            for _ in range(self.degree - 1):
+                rows.append(self.mulmod_dense(rows[-1], x_p))
+            self._frobenius = [
+                int.from_bytes(b"".join(c.to_bytes(width, "little") for c in row), "little") for row in rows
+            ]
+        total = sum(c * row for c, row in zip(a, self._frobenius) if c)
+        data = total.to_bytes(self.degree * width, "little")
+        p = self.char
+        return trim([int.from_bytes(data[k : k + width], "little") % p for k in range(0, len(data), width)])
+
+    # Polynomials
+
+    def reduce(self, a: Polynomial) -> Polynomial:
+        """a mod h"""
+        return self.from_dense(self.reduce_dense(self.to_dense(a)))
+
+    def mulmod(self, a: Polynomial, b: Polynomial) -> Polynomial:
+        """a b mod h"""
+        return self.from_dense(self.mulmod_dense(self.to_dense(a), self.to_dense(b)))
+
+    def sqrmod(self, a: Polynomial) -> Polynomial:
+        """a^2 mod h"""
+        return self.from_dense(self.sqrmod_dense(self.to_dense(a)))
+
+    def powmod(self, a: Polynomial, e: int) -> Polynomial:
+        """a^e mod h"""
+        return self.from_dense(self.powmod_dense(self.to_dense(a), e))
@@ -0,0 +1,218 @@
+"""
+Divisibility index over monomials given as exponent tuples.
+
+Answers "which stored monomials divide m" and "which stored monomials are multiples of m"
+without scanning every entry. Monomials are kept in a trie with one level per variable
+(children sorted by exponent, so a query only descends into exponents <= or >= the
+query's). Every node also carries the AND and the OR of the divisor masks (divmasks) of
+the monomials below it: a divmask sets one bit per variable and exponent threshold, and
+a | b is only possible if mask(a) is a subset of mask(b), which prunes whole subtrees
+with a single integer test.
+
+Entries are identified by integer labels. find_divisor returns the smallest label among
+the divisors, so callers that store list positions get "first divisor in list order",
+the rule used by division_algorithm.
+"""
+
+from bisect import insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+__all__ = [
+    "MonomialIndex",
+    "divmask",
+]
+
+Exponents = Tuple[int, ...]
+
+_MASK_BITS = 64
+
+
+def _thresholds(nvars: int) -> List[int]:
+    per_var = max(1, _MASK_BITS // max(1, nvars))
+    return [1 << k for k in range(per_var)]  # exponent thresholds 1, 2, 4, 8, ...
+
+
+def divmask(exps: Exponents, thresholds: Optional[List[int]] = None) -> int:
+    """
+    bit (i * len(thresholds) + k) is set when exps[i] >= thresholds[k]
+    """
+    if thresholds is None:
+        thresholds = _thresholds(len(exps))
+    width = len(thresholds)
+    mask = 0
+    for i, e in enumerate(exps):
+        if e:
+            base = i * width
+            for k, t in enumerate(thresholds):
+                if e < t:
+                    break
+                mask |= 1 << (base + k)
+    return mask
+
+
+class _Node:
+    __slots__ = ("children", "exps", "labels", "min_label", "and_mask", "or_mask")
+
+    def __init__(self) -> None:
+        self.children: Dict[int, "_Node"] = {}
+        self.exps: List[int] = []  # sorted keys of children
+        self.labels: List[int] = []  # only used at leaves
+        self.min_label: Optional[int] = None
+        self.and_mask = -1
+        self.or_mask = 0
+
+
+class MonomialIndex:
+    """
+    set of labelled monomials in nvars variables supporting divisor and multiple queries
+    """
+
+    def __init__(self, nvars: int, monomials: Iterable[Exponents] = ()) -> None:
+        self.nvars = nvars
+        self._thresholds = _thresholds(nvars)
+        self._root = _Node()
+        self._entries: Dict[int, Tuple[Exponents, int]] = {}
+        for label, exps in enumerate(monomials):
+            self.add(exps, label)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, label: int) -> bool:
+        return label in self._entries
+
+    def monomial(self, label: int) -> Exponents:
+        return self._entries[label][0]
+
+    def labels(self) -> List[int]:
+        return sorted(self._entries)
+
+    def add(self, exps: Exponents, label: Optional[int] = None) -> int:
+        """
+        stores exps under label (default: one more than the largest label), returns the label
+        """
+        if len(exps) != self.nvars:
+            raise ValueError(f"expected {self.nvars} exponents, got {len(exps)}")
+        if label is None:
+            label = max(self._entries) + 1 if self._entries else 0
+        if label in self._entries:
+            raise KeyError(f"label {label} already in index")
+        mask = divmask(exps, self._thresholds)
+        self._entries[label] = (tuple(exps), mask)
+        node = self._root
+        path = [node]
+        for e in exps:
+            child = node.children.get(e)
+            if child is None:
+                child = _Node()
+                node.children[e] = child
+                insort(node.exps, e)
+            node = child
+            path.append(node)
+        node.labels.append(label)
+        for n in path:
+            n.and_mask &= mask
+            n.or_mask |= mask
+            if n.min_label is None or label < n.min_label:
+                n.min_label = label
+        return label
+
+    def remove(self, label: int) -> None:
+        exps, _ = self._entries.pop(label)
+        path = [self._root]
+        for e in exps:
+            path.append(path[-1].children[e])
+        leaf = path[-1]
+        leaf.labels.remove(label)
+        self._summarize(leaf, [self._entries[lab][1] for lab in leaf.labels], leaf.labels)
+        # recompute the summaries bottom-up, dropping emptied branches
+        for depth in range(len(exps) - 1, -1, -1):
+            node, e = path[depth], exps[depth]
+            if node.children[e].min_label is None:
+                del node.children[e]
+                node.exps.remove(e)
+            kids = node.children.values()
+            self._summarize(node, [k.and_mask for k in kids], [k.min_label for k in kids], [k.or_mask for k in kids])
+
+    @staticmethod
+    def _summarize(node: _Node, and_masks: List[int], labels: List[int], or_masks: Optional[List[int]] = None) -> None:
+        and_mask, or_mask = -1, 0
+        for m in and_masks:
+            and_mask &= m
+        for m in and_masks if or_masks is None else or_masks:
+            or_mask |= m
+        node.and_mask, node.or_mask = and_mask, or_mask
+        node.min_label = min(labels) if labels else None
+
+    def find_divisor(self, exps: Exponents) -> Optional[int]:
+        """
+        returns the smallest label whose monomial divides exps, or None
+        """
+        qmask = divmask(exps, self._thresholds)
+        best: List[Optional[int]] = [None]
+        last = self.nvars
+
+        def visit(node: _Node, depth: int) -> None:
+            if node.min_label is None or node.and_mask & ~qmask:
+                return
+            if best[0] is not None and node.min_label >= best[0]:
+                return
+            if depth == last:
+                best[0] = node.min_label
+                return
+            e = exps[depth]
+            for k in node.exps:
+                if k > e:
+                    break
+                visit(node.children[k], depth + 1)
+
+        visit(self._root, 0)
+        return best[0]
+
+    def divisors(self, exps: Exponents) -> List[int]:
+        """
+        returns the labels of all monomials dividing exps, in increasing order
+        """
+        qmask = divmask(exps, self._thresholds)
+        found: List[int] = []
+        last = self.nvars
+
+        def visit(node: _Node, depth: int) -> None:
+            if node.min_label is None or node.and_mask & ~qmask:
+                return
+            if depth == last:
+                found.extend(node.labels)
+                return
+            e = exps[depth]
+            for k in node.exps:
+                if k > e:
+                    break
+                visit(node.children[k], depth + 1)
+
+        visit(self._root, 0)
+        found.sort()
+        return found
+
+    def multiples(self, exps: Exponents) -> List[int]:
+        """
+        returns the labels of all monomials divisible by exps, in increasing order
+        """
+        qmask = divmask(exps, self._thresholds)
+        found: List[int] = []
+        last = self.nvars
+
+        def visit(node: _Node, depth: int) -> None:
+            if node.min_label is None or qmask & ~node.or_mask:
+                return
+            if depth == last:
+                found.extend(node.labels)
+                return
+            e = exps[depth]
+            for k in reversed(node.exps):
+                if k < e:
+                    break
+                visit(node.children[k], depth + 1)
+
+        visit(self._root, 0)
+        found.sort()
+        return found
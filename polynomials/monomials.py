@@ -0,0 +1,93 @@
+"""
+Monomial arithmetic on exponent tuples, and the S-polynomial kernel.
+
+An S-polynomial only needs the leading monomials of f and g: their lcm, the cofactors
+lcm / LM(f) and lcm / LM(g), and whether the two are coprime (Buchberger's first
+criterion). Going through Polynomial objects builds, multiplies and divides single-term
+polynomials for every critical pair; here those are tuple operations, and spoly() writes
+both shifted multiples straight into one sparse {exponent tuple: coefficient} map.
+
+All exponent tuples of one computation are taken over the same variables.
+"""
+
+from typing import Any, Dict, Tuple
+
+__all__ = [
+    "coprime",
+    "divides",
+    "gcd",
+    "lcm",
+    "product",
+    "quotient",
+    "spoly",
+]
+
+Exponents = Tuple[int, ...]
+Terms = Dict[Exponents, Any]
+
+
+def lcm(a: Exponents, b: Exponents) -> Exponents:
+    return tuple(x if x > y else y for x, y in zip(a, b))
+
+
+def gcd(a: Exponents, b: Exponents) -> Exponents:
+    return tuple(x if x < y else y for x, y in zip(a, b))
+
+
+def divides(a: Exponents, b: Exponents) -> bool:
+    """x^a | x^b"""
+    return all(x <= y for x, y in zip(a, b))
+
+
+def coprime(a: Exponents, b: Exponents) -> bool:
+    """gcd(x^a, x^b) = 1, i.e. lcm(x^a, x^b) = x^a * x^b"""
+    return all(not (x and y) for x, y in zip(a, b))
+
+
+def product(a: Exponents, b: Exponents) -> Exponents:
+    return tuple(x + y for x, y in zip(a, b))
+
+
+def quotient(a: Exponents, b: Exponents) -> Exponents:
+    """x^a / x^b, for x^b | x^a"""
+    return tuple(x - y for x, y in zip(a, b))
+
+
+def spoly(
+    f: Terms,
+    f_shift: Exponents,
+    f_scale: Any,
+    g: Terms,
+    g_shift: Exponents,
+    g_scale: Any,
+    top: Exponents,
+    char: int = 0,
+) -> Terms:
+    """
+    f_scale * x^f_shift * f - g_scale * x^g_shift * g without its x^top term, reduced mod char (if not 0)
+    with top = lcm(LM(f), LM(g)), shifts top / LM(f), top / LM(g) and scales making both leading
+    terms equal this is S(f, g); the x^top terms cancel by construction, so they are left out
+    rather than subtracted (with floats c * (1 / c) - 1 need not be 0)
+    """
+    out: Terms = {}
+    for m, c in f.items():
+        nm = tuple(a + b for a, b in zip(m, f_shift))
+        if nm == top:
+            continue
+        v = c if f_scale == 1 else c * f_scale
+        if char:
+            v %= char
+        if v != 0:
+            out[nm] = v
+    for m, c in g.items():
+        nm = tuple(a + b for a, b in zip(m, g_shift))
+        if nm == top:
+            continue
+        v = out.get(nm, 0) - (c if g_scale == 1 else c * g_scale)
+        if char:
+            v %= char
+        if v == 0:
+            out.pop(nm, None)
+        else:
+            out[nm] = v
+    return out
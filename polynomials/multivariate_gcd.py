@@ -0,0 +1,323 @@
+"""
+Greatest common divisors of multivariate polynomials (Brown's dense modular algorithm).
+
+Over Z the gcd is computed modulo large primes and the images are combined by Chinese
+remaindering: every image is the monic gcd mod p scaled by gamma = gcd(lc(a), lc(b)) (lc(gcd)
+divides gamma, so the scaled images are images of one integer polynomial). Images whose leading
+monomial is larger than the smallest one seen come from unlucky primes and are dropped. Once
+another prime no longer changes the combination, its primitive part is checked by trial division
+of both inputs; dividing them exactly, it is the gcd.
+
+Modulo p the last variable is evaluated away: a and b are seen as polynomials in the first n - 1
+variables over F_p[x_n], their contents in F_p[x_n] are split off, and the gcds of the images at
+x_n = alpha (recursively, down to univariate Euclid) are interpolated coefficientwise, with the
+same leading monomial filter and trial division. Fields too small to provide the evaluation
+points fall back to the lcm from the elimination ideal <t a, (1 - t) b> and gcd = a / (lcm / b).
+
+Polynomials are exact sparse maps {exponent tuple: coefficient} as in polynomials.groebner,
+with variables in lex order (the first one largest).
+"""
+
+import heapq
+import math
+from typing import Dict, Optional, Tuple
+
+from polynomials.groebner import Terms, from_exact, reduced_groebner_basis, to_exact
+from polynomials.polynomial import Polynomial
+from polynomials.univariate import Dense, divmod_mod, evaluate_mod, gcd_mod, mul_mod, primes, scale_mod, trim
+
+__all__ = [
+    "exact_divide",
+    "gcd_integer",
+    "gcd_mod_p",
+    "gcd_multivariate",
+]
+
+Recursive = Dict[Tuple[int, ...], Dense]  # polynomials in x_1..x_n-1 over F_p[x_n]
+
+
+# sparse multivariate arithmetic
+
+
+def _leading(a: Terms) -> Tuple[int, ...]:
+    return max(a)
+
+
+def _monic(a: Terms, p: int) -> Terms:
+    inv = pow(a[_leading(a)], -1, p)
+    return {m: c * inv % p for m, c in a.items()}
+
+
+def exact_divide(a: Terms, b: Terms, p: int = 0) -> Optional[Terms]:
+    """
+    returns a / b if b divides a (over F_p, or over Z for p = 0 with integer coefficients), else None
+    """
+    if not b:
+        return None
+    if not a:
+        return {}
+    lb = _leading(b)
+    cb = b[lb]
+    # the quotient has no monomial below min(a) - min(b)
+    low = tuple(x - y for x, y in zip(min(a), min(b)))
+    if any(e < 0 for e in low):
+        return None
+    inv = pow(cb, -1, p) if p else None
+    rest = dict(a)
+    heap = [tuple(-e for e in m) for m in rest]
+    heapq.heapify(heap)
+    q: Terms = {}
+    while heap:
+        m = tuple(-e for e in heapq.heappop(heap))
+        c = rest.pop(m, 0)
+        if c == 0:
+            continue
+        shift = tuple(x - y for x, y in zip(m, lb))
+        if shift < low or any(e < 0 for e in shift):
+            return None
+        if p:
+            f = c * inv % p
+        else:
+            f, r = divmod(c, cb)
+            if r:
+                return None
+        q[shift] = f
+        for mb, d in b.items():
+            if mb == lb:
+                continue
+            nm = tuple(x + y for x, y in zip(mb, shift))
+            if nm not in rest:
+                heapq.heappush(heap, tuple(-e for e in nm))
+                v = -f * d
+            else:
+                v = rest[nm] - f * d
+            rest[nm] = v % p if p else v
+    return q
+
+
+# gcd over F_p
+
+
+def _recursive(a: Terms) -> Recursive:
+    out: Recursive = {}
+    for m, c in a.items():
+        dense = out.setdefault(m[:-1], [])
+        if len(dense) <= m[-1]:
+            dense.extend([0] * (m[-1] + 1 - len(dense)))
+        dense[m[-1]] = c
+    return out
+
+
+def _flatten(a: Recursive) -> Terms:
+    return {head + (k,): c for head, dense in a.items() for k, c in enumerate(dense) if c}
+
+
+def _content(a: Recursive, p: int) -> Dense:
+    g: Dense = []
+    for dense in a.values():
+        g = gcd_mod(g, dense, p) if g else gcd_mod(dense, [], p)
+        if len(g) == 1:
+            break
+    return g
+
+
+def _primitive(a: Recursive, content: Dense, p: int) -> Recursive:
+    if len(content) == 1:
+        return a
+    return {head: divmod_mod(dense, content, p)[0] for head, dense in a.items()}
+
+
+def gcd_mod_p(a: Terms, b: Terms, nvars: int, p: int) -> Optional[Terms]:
+    """
+    returns the monic gcd of a and b over F_p, None if F_p has too few elements to interpolate
+    """
+    if not a:
+        return _monic(b, p) if b else {}
+    if not b:
+        return _monic(a, p)
+    if nvars == 0:
+        return {(): 1}
+    if nvars == 1:
+        dense = gcd_mod(_recursive(a)[()], _recursive(b)[()], p)
+        return _flatten({(): dense})
+    ra, rb = _recursive(a), _recursive(b)
+    ca, cb = _content(ra, p), _content(rb, p)
+    content = gcd_mod(ca, cb, p)
+    ra, rb = _primitive(ra, ca, p), _primitive(rb, cb, p)
+    pa, pb = _flatten(ra), _flatten(rb)
+    gamma = gcd_mod(ra[max(ra)], rb[max(rb)], p)
+    bound = min(max(len(d) for d in ra.values()), max(len(d) for d in rb.values())) - 1 + len(gamma) - 1
+    interpolant: Recursive = {}
+    modulus: Dense = [1]
+    lead: Optional[Tuple[int, ...]] = None
+    points = 0
+    for alpha in range(p):
+        g_alpha = evaluate_mod(gamma, alpha, p)
+        if not g_alpha:
+            continue
+        ea = {h: v for h, v in ((h, evaluate_mod(d, alpha, p)) for h, d in ra.items()) if v}
+        eb = {h: v for h, v in ((h, evaluate_mod(d, alpha, p)) for h, d in rb.items()) if v}
+        image = gcd_mod_p(ea, eb, nvars - 1, p)
+        if image is None:
+            return None
+        m = _leading(image)
+        if not any(m):
+            # the primitive parts are coprime
+            return _monic(_flatten({(0,) * (nvars - 1): content}), p)
+        if lead is None or m < lead:
+            lead, interpolant, modulus, points = m, {}, [1], 0
+        elif m > lead:
+            continue  # unlucky evaluation point
+        changed = False
+        inv = pow(evaluate_mod(modulus, alpha, p), -1, p)
+        for head in set(interpolant) | set(image):
+            current = interpolant.get(head, [])
+            v = (image.get(head, 0) * g_alpha - evaluate_mod(current, alpha, p)) * inv % p
+            if v:
+                changed = True
+                step = scale_mod(modulus, v, p)
+                merged = [
+                    ((current[k] if k < len(current) else 0) + (step[k] if k < len(step) else 0)) % p
+                    for k in range(max(len(current), len(step)))
+                ]
+                interpolant[head] = trim(merged)
+        interpolant = {h: d for h, d in interpolant.items() if d}
+        modulus = mul_mod(modulus, [-alpha % p, 1], p)
+        points += 1
+        if (points > 1 and not changed) or points > bound:
+            candidate = _flatten(_primitive(interpolant, _content(interpolant, p), p))
+            if exact_divide(pa, candidate, p) is not None and exact_divide(pb, candidate, p) is not None:
+                return _monic(_multiply(candidate, content, p), p)
+    return None
+
+
+def _multiply(a: Terms, content: Dense, p: int) -> Terms:
+    """a times a univariate polynomial in the last variable"""
+    out: Terms = {}
+    for m, c in a.items():
+        for k, d in enumerate(content):
+            if d:
+                nm = m[:-1] + (m[-1] + k,)
+                out[nm] = (out.get(nm, 0) + c * d) % p
+    return {m: c for m, c in out.items() if c}
+
+
+# gcd over Z
+
+
+def _integer_content(a: Terms) -> int:
+    g = 0
+    for c in a.values():
+        g = math.gcd(g, c)
+        if g == 1:
+            break
+    return g
+
+
+def _primitive_part(a: Terms) -> Terms:
+    """a divided by its content, with a positive leading coefficient"""
+    g = _integer_content(a)
+    if a[_leading(a)] < 0:
+        g = -g
+    return {m: c // g for m, c in a.items()}
+
+
+def gcd_integer(a: Terms, b: Terms, nvars: int) -> Terms:
+    """
+    returns the gcd of a and b over Z (integer coefficients): the gcd of the contents times
+    the primitive gcd with a positive leading coefficient
+    """
+    if not a or not b:
+        rest = a or b
+        return {m: -c for m, c in rest.items()} if rest and rest[_leading(rest)] < 0 else rest
+    content = math.gcd(_integer_content(a), _integer_content(b))
+    a, b = _primitive_part(a), _primitive_part(b)
+    one = {(0,) * nvars: content}
+    # cheap trial division first: one input often divides the other
+    small, large = (a, b) if len(a) <= len(b) else (b, a)
+    if exact_divide(large, small) is not None:
+        return {m: c * content for m, c in small.items()}
+    la, lb = a[_leading(a)], b[_leading(b)]
+    gamma = math.gcd(la, lb)
+    combined: Terms = {}
+    modulus = 1
+    lead: Optional[Tuple[int, ...]] = None
+    for p in primes():
+        if la % p == 0 or lb % p == 0:
+            continue
+        image = gcd_mod_p({m: c % p for m, c in a.items()}, {m: c % p for m, c in b.items()}, nvars, p)
+        if image is None:  # pragma: no cover - the primes are large
+            continue
+        m = _leading(image)
+        if not any(m):
+            return one
+        if lead is None or m < lead:
+            lead, combined, modulus = m, {}, 1
+        elif m > lead:
+            continue  # unlucky prime
+        changed = False
+        inv = pow(modulus, -1, p)
+        new_modulus = modulus * p
+        half = new_modulus // 2
+        for key in set(combined) | set(image):
+            c = combined.get(key, 0)
+            t = (image.get(key, 0) * gamma - c) * inv % p
+            if t:
+                changed = True
+                c += modulus * t
+                if c > half:
+                    c -= new_modulus
+                elif c < -half:
+                    c += new_modulus
+                combined[key] = c
+        combined = {key: c for key, c in combined.items() if c}
+        first = modulus == 1
+        modulus = new_modulus
+        if not first and not changed:
+            candidate = _primitive_part(combined)
+            if exact_divide(a, candidate) is not None and exact_divide(b, candidate) is not None:
+                return {key: c * content for key, c in candidate.items()}
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+# fallback for small fields
+
+
+def _gcd_by_elimination(a: Terms, b: Terms, nvars: int, p: int) -> Terms:
+    """gcd = a / (lcm / b), the lcm generating <t a, (1 - t) b> restricted to t = 0"""
+    generators = [
+        {(1,) + m: c for m, c in a.items()},
+        {**{(0,) + m: c for m, c in b.items()}, **{(1,) + m: -c % p for m, c in b.items()}},
+    ]
+    basis = reduced_groebner_basis(generators, nvars + 1, "lex", p)
+    lcm = next(g for g in basis if all(m[0] == 0 for m in g))
+    cofactor = exact_divide({m[1:]: c for m, c in lcm.items()}, b, p)
+    return _monic(exact_divide(a, cofactor, p), p)  # type: ignore[arg-type]
+
+
+def gcd_multivariate(a: Polynomial, b: Polynomial) -> Polynomial:
+    """
+    returns the gcd of two polynomials: monic over F_p; over Q the integer gcd of inputs with
+    integer coefficients, the primitive gcd with a positive leading coefficient otherwise
+    """
+    char = max(a.field_characteristic, b.field_characteristic)
+    names = tuple(sorted(set(a.variables) | set(b.variables)))
+    ea, eb = to_exact(a, names, char), to_exact(b, names, char)
+    if char:
+        g = gcd_mod_p(ea, eb, len(names), char)
+        if g is None:
+            g = _gcd_by_elimination(ea, eb, len(names), char)
+        return from_exact(g, names, char)
+    integral = all(c.denominator == 1 for c in list(ea.values()) + list(eb.values()))
+    ia, ib = _clear_denominators(ea), _clear_denominators(eb)
+    g = gcd_integer(ia, ib, len(names))
+    if not integral and g:
+        g = _primitive_part(g)
+    return from_exact(g, names)
+
+
+def _clear_denominators(a: Terms) -> Terms:
+    d = 1
+    for c in a.values():
+        d = d * c.denominator // math.gcd(d, c.denominator)
+    return {m: int(c * d) for m, c in a.items()}
@@ -1,4 +1,5 @@
-from typing import List, Union
+from functools import lru_cache
+from typing import Callable, Dict, List, Sequence, Tuple, Union
 
 Term = List[Union[int, float, complex]]
 TermMatrix = List[List[Union[str, int, float, complex]]]
@@ -191,5 +192,78 @@ def grev_lex(term_matrix: TermMatrix) -> TermMatrix:
     return res
 
 
+# ----- Monomial order keys -----
+# The functions below compare monomials given as exponent tuples over variables sorted so that
+# x_1 > x_2 > ... > x_n; a larger key means a larger monomial.
+
+Exponents = Tuple[int, ...]
+
+
+def lex_key(exps: Exponents) -> Tuple[int, ...]:
+    return tuple(exps)
+
+
+def grlex_key(exps: Exponents) -> Tuple[int, ...]:
+    """
+    total degree, ties broken lexicographically (the order used by Polynomial.leading_term)
+    """
+    return (sum(exps),) + tuple(exps)
+
+
+def grevlex_key(exps: Exponents) -> Tuple[int, ...]:
+    """
+    total degree, ties broken by the smaller exponent of the last variable
+    """
+    return (sum(exps),) + tuple(-e for e in reversed(exps))
+
+
+MONOMIAL_ORDERS: Dict[str, Callable[[Exponents], Tuple[int, ...]]] = {
+    "lex": lex_key,
+    "grlex": grlex_key,
+    "grevlex": grevlex_key,
+}
+
+
+WeightMatrix = Sequence[Sequence[int]]
+MonomialOrder = Union[str, WeightMatrix]
+
+
+def order_matrix(order: str, nvars: int) -> List[List[int]]:
+    """
+    returns the weight matrix of the named order: monomials compare by the rows' weights in turn
+    (the first row is the weight vector a Groebner walk moves along)
+    """
+    unit = [[1 if i == j else 0 for j in range(nvars)] for i in range(nvars)]
+    if order == "lex":
+        return unit
+    if order == "grlex":
+        return [[1] * nvars] + unit[: nvars - 1]
+    if order == "grevlex":
+        return [[1] * nvars] + [[-e for e in row] for row in reversed(unit[1:])]
+    raise ValueError(f"unknown monomial order {order!r}, expected one of {sorted(MONOMIAL_ORDERS)}")
+
+
+def matrix_key(matrix: WeightMatrix) -> Callable[[Exponents], Tuple[int, ...]]:
+    rows = [tuple(row) for row in matrix]
+
+    @lru_cache(maxsize=1 << 16)
+    def key(exps: Exponents) -> Tuple[int, ...]:
+        return tuple(sum(w * e for w, e in zip(row, exps)) for row in rows)
+
+    return key
+
+
+def monomial_key(order: MonomialOrder) -> Callable[[Exponents], Tuple[int, ...]]:
+    """
+    returns the sort key of the named monomial order, or of a weight matrix
+    """
+    if not isinstance(order, str):
+        return matrix_key(order)
+    try:
+        return MONOMIAL_ORDERS[order]
+    except KeyError:
+        raise ValueError(f"unknown monomial order {order!r}, expected one of {sorted(MONOMIAL_ORDERS)}") from None
+
+
 if __name__ == "__main__":
     pass
@@ -5,7 +5,9 @@ from numbers import Integral
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from polynomials.display import format_number
+from polynomials.execution import STALLED, ExecutionContext
 from polynomials.formulas import solve
+from polynomials.monomial_index import MonomialIndex
 from polynomials.poly_parser import (
     InputError,
     construct_expression_tree,
@@ -28,6 +30,10 @@ except Exception:
 
 logger = logging.getLogger(__name__)
 _DEBUG = os.environ.get("POLYCALC_DEBUG") in {"1", "true", "True"}
+# division_algorithm switches from a linear divisor scan to a MonomialIndex at this many divisors
+_INDEX_MIN_DIVISORS = 8
+# step budget of division_algorithm and floating point Euclid when no context is given
+_DEFAULT_MAX_STEPS = 1000
 
 # Public exports from this module
 __all__ = [
@@ -35,12 +41,16 @@ __all__ = [
     "Monomial",
     "TermsView",
     "NonFactor",
+    "divexact",
     "divides",
     "monomial_divide",
     "division_algorithm",
     "division_string",
     "gcd",
+    "invmod",
     "lcm",
+    "powmod",
+    "xgcd",
 ]
 
 NumberLike: TypeAlias = Union[int, float, complex, Integer, Rational]
@@ -474,6 +484,11 @@ class Polynomial:
             other = Polynomial(other, self.field_characteristic)
         elif other == 0:
             raise ZeroDivisionError("division by zero")
+        fast = _univariate_divmod(self, other)
+        if fast is not None:
+            if fast[1] != Polynomial(0):
+                raise NonFactor(other, self)
+            return fast[0]
         q, r = division_algorithm(self, other)
         if r != Polynomial(0):
             raise NonFactor(other, self)
@@ -492,6 +507,9 @@ class Polynomial:
     def __mod__(self, other: Union["Polynomial", int, float, complex]) -> "Polynomial":
         if not isinstance(other, Polynomial):
             other = Polynomial(other, self.field_characteristic)
+        fast = _univariate_divmod(self, other)
+        if fast is not None:
+            return fast[1]
         _, r = division_algorithm(self, other)
         r._filter_zero_terms()
         return r
@@ -870,6 +888,52 @@ class Polynomial:
     def solve(self) -> Any:
         return solve(self)
 
+    def factor(self) -> Tuple[Any, List[Tuple["Polynomial", int]]]:
+        """
+        factorization of a univariate polynomial into irreducibles: over Q, (c, [(f, e), ...]) with
+        self = c * product of f^e, c a Fraction and the f distinct primitive integer polynomials with
+        positive leading coefficients, sorted by degree (see polynomials.factorization); over F_p
+        as factor_mod_p
+        raises ValueError for several variables, complex coefficients or 0
+        """
+        if self.field_characteristic:
+            return self.factor_mod_p()
+        names = self.variables
+        if len(names) > 1:
+            raise ValueError("factor factors polynomials in one variable")
+        from fractions import Fraction
+
+        from polynomials.factorization import factor_integer
+        from polynomials.univariate import from_dense, integral, to_dense
+
+        var = names[0] if names else "x"
+        dense = to_dense(self, var)
+        numerators = integral(dense)
+        c, factors = factor_integer(numerators)
+        return Fraction(c) * dense[-1] / numerators[-1], [(from_dense(f, var), e) for f, e in factors]
+
+    def factor_mod_p(self, p: Optional[int] = None) -> Tuple[int, List[Tuple["Polynomial", int]]]:
+        """
+        factorization of a univariate polynomial over F_p, p the field characteristic unless given:
+        (lc, [(f, e), ...]) with self = lc * product of f^e and the f distinct monic irreducibles,
+        sorted by degree (see polynomials.factorization)
+        raises ValueError without a prime, for another characteristic, several variables or 0
+        """
+        char = p or self.field_characteristic
+        if not char:
+            raise ValueError("factor_mod_p needs a prime: the polynomial has characteristic 0")
+        if self.field_characteristic and self.field_characteristic != char:
+            raise ValueError("the polynomial is over F_%d, not F_%d" % (self.field_characteristic, char))
+        names = self.variables
+        if len(names) > 1:
+            raise ValueError("factor_mod_p factors polynomials in one variable")
+        from polynomials.factorization import factor_mod
+        from polynomials.univariate import from_dense, to_dense
+
+        var = names[0] if names else "x"
+        lc, factors = factor_mod(to_dense(self, var, char), char)
+        return lc, [(from_dense(f, var, char), e) for f, e in factors]
+
     def __init__(self, poly: Any, char: int = 0):
         self.field_characteristic = char
         self._lt_cache = None
@@ -908,7 +972,19 @@ class Polynomial:
 
 # Standalone helpers
 
-def divides(a: "Polynomial", b: "Polynomial") -> bool:
+def divides(a: "Polynomial", b: "Polynomial", exact: bool = False) -> bool:
+    """
+    whether the leading term of a divides the leading term of b, or with exact=True whether a
+    divides b (see divexact)
+    """
+    if exact:
+        if a == 0:
+            return b == 0
+        try:
+            divexact(b, a)
+        except NonFactor:
+            return False
+        return True
     lt_a = a.leading_term()
     lt_b = b.leading_term()
     if lt_a is None or lt_b is None:
@@ -949,8 +1025,14 @@ def monomial_divide(a: "Polynomial", b: "Polynomial") -> "Polynomial":
 
 
 def division_algorithm(
-    input_poly: "Polynomial", *others: "Polynomial"
+    input_poly: "Polynomial", *others: "Polynomial", context: Optional[ExecutionContext] = None
 ) -> Tuple[List["Polynomial"], "Polynomial"]:
+    """
+    returns the quotients and remainder of input_poly on division by others
+    stopping raises Incomplete holding (quotients, remainder, rest still to divide): after
+    _DEFAULT_MAX_STEPS steps without a context, at the context's limits with one (see
+    polynomials.execution)
+    """
     char = input_poly.field_characteristic
     polys = [input_poly] + list(others)
     aligned = align_polynomials(polys)
@@ -972,21 +1054,24 @@ def division_algorithm(
         return qs, r
 
     precomp_others_lt = [d.leading_term() for d in divisors]
-    max_steps = 1000
-    steps = 0
+    index = None
+    if len(divisors) >= _INDEX_MIN_DIVISORS:
+        index = MonomialIndex(len(unified_vars))
+        for k, lt_d in enumerate(precomp_others_lt):
+            if lt_d is not None:
+                index.add(lt_d[0].exps, k)
+    limits = context if context is not None else ExecutionContext(max_steps=_DEFAULT_MAX_STEPS)
 
     while not is_zero(p_work):
-        if steps > max_steps:
-            if _DEBUG:
-                logger.debug(
-                    "division_algorithm: exceeded max steps, possible infinite loop. p=%s",
-                    str(p_work),
-                )
-            break
+        limits.check(partial=lambda: ([q.copy() for q in quotients], remainder.copy(), p_work.copy()))
         prev_p_work = p_work.copy()
         i = 0
         division_occurred = False
         lt_p = p_work.leading_term()
+        if index is not None:
+            # first divisor (in argument order) whose leading monomial divides LT(p)
+            found = index.find_divisor(lt_p[0].exps) if lt_p is not None else None
+            i = len(divisors) if found is None else found
         while i < len(divisors) and not division_occurred:
             lt_d = precomp_others_lt[i]
             if lt_p is None or lt_d is None:
@@ -1023,13 +1108,14 @@ def division_algorithm(
             remainder = remainder.add(mono)
             p_work = p_work.sub(mono)
         if p_work.terms == prev_p_work.terms:
+            if context is not None:
+                context.stop(STALLED, ([q.copy() for q in quotients], remainder.copy(), p_work.copy()))
             if _DEBUG:
                 logger.debug(
                     "division_algorithm: no progress, breaking to avoid infinite loop. p=%s",
                     str(p_work),
                 )
             break
-        steps += 1
     a: List[Polynomial] = [q.copy() for q in quotients]
     r = remainder.copy()
     for poly in a:
@@ -1038,6 +1124,62 @@ def division_algorithm(
     return a, r
 
 
+def _univariate_divmod(a: "Polynomial", b: "Polynomial") -> Optional[Tuple["Polynomial", "Polynomial"]]:
+    """
+    quotient and remainder for polynomials in one common variable, b not constant, on dense
+    coefficients (polynomials.univariate): Newton division over F_p and over Z for divisors with
+    leading coefficient 1 or -1, exact schoolbook division over Q otherwise
+    None when division_algorithm is needed instead (several variables, complex coefficients,
+    results out of float range)
+    """
+    names = set(a.variables) | set(b.variables)
+    if len(names) != 1 or not b.variables:
+        return None
+    from polynomials.univariate import divmod_rational, fast_divmod, fast_divmod_mod, from_dense, to_dense
+
+    var = names.pop()
+    char = max(a.field_characteristic, b.field_characteristic)
+    try:
+        da, db = to_dense(a, var, char), to_dense(b, var, char)
+    except ValueError:
+        return None
+    if char:
+        q, r = fast_divmod_mod(da, db, char)
+    elif db[-1] in (1, -1) and all(c.denominator == 1 for c in da + db):
+        q, r = fast_divmod([int(c) for c in da], [int(c) for c in db])
+    else:
+        q, r = divmod_rational(da, db)
+    try:
+        return from_dense(q, var, char), from_dense(r, var, char)
+    except OverflowError:
+        return None
+
+
+def divexact(a: "Polynomial", b: "Polynomial") -> "Polynomial":
+    """
+    a / b when b is expected to divide a: exact arithmetic that stops at the first sign that b
+    does not (NonFactor), after cheap checks of degrees and of images at a random point
+    (polynomials.divisibility); complex coefficients go through a / b
+    """
+    if b == 0:
+        raise ZeroDivisionError("division by zero")
+    from polynomials.divisibility import divide_exact
+    from polynomials.groebner import common_variables, from_exact, to_exact
+
+    names = common_variables((a, b))
+    char = max(a.field_characteristic, b.field_characteristic)
+    try:
+        ta, tb = to_exact(a, names, char), to_exact(b, names, char)
+    except ValueError:
+        result = a / b
+        assert isinstance(result, Polynomial)
+        return result
+    q = divide_exact(ta, tb, len(names), char)
+    if q is None:
+        raise NonFactor(b, a)
+    return from_exact(q, names, char)
+
+
 def division_string(p: "Polynomial", *others: "Polynomial") -> str:
     from polynomials.display import display_mode
 
@@ -1052,7 +1194,7 @@ def division_string(p: "Polynomial", *others: "Polynomial") -> str:
         return res
 
 
-def gcd(a: "Polynomial", b: "Polynomial") -> "Polynomial":
+def gcd(a: "Polynomial", b: "Polynomial", context: Optional[ExecutionContext] = None) -> "Polynomial":
     a = a.copy()
     b = b.copy()
     import math
@@ -1070,18 +1212,18 @@ def gcd(a: "Polynomial", b: "Polynomial") -> "Polynomial":
         result._filter_zero_terms()
         return result
     if len(set(a.variables).union(set(b.variables))) <= 1:
-        g = gcd_singlevariate(a, b)
+        g = gcd_singlevariate(a, b, context)
         if not g.terms:
             return Polynomial.from_constant(0.0, a.vars, a.field_characteristic)
         if len(g.terms) == 1:
-            (m_g, c_g), = g.terms.items()
+            ((m_g, c_g),) = g.terms.items()
             if all(e == 0 for e in m_g.exps):
                 return Polynomial.from_constant(float(c_g), (), a.field_characteristic)
         return g
     if (len(a.terms) > 1) or (len(b.terms) > 1):
-        raise NotImplementedError(
-            "gcd for multivariate polynomials with more than one term is not implemented"
-        )
+        from polynomials.multivariate_gcd import gcd_multivariate
+
+        return gcd_multivariate(a, b)
     if (not a.terms) or (not b.terms):
         return Polynomial.from_constant(0.0)
     (_, c_a), = a.terms.items()
@@ -1096,42 +1238,141 @@ def gcd(a: "Polynomial", b: "Polynomial") -> "Polynomial":
     return res
 
 
-def gcd_singlevariate(a: "Polynomial", b: "Polynomial") -> "Polynomial":
+def gcd_singlevariate(a: "Polynomial", b: "Polynomial", context: Optional[ExecutionContext] = None) -> "Polynomial":
+    """
+    exact gcd of polynomials in one variable (polynomials.univariate): monic over F_p; over Q the
+    integer gcd of inputs with integer coefficients and the primitive gcd otherwise, from the
+    subresultant sequence for small inputs and from gcds modulo primes combined by CRT for large ones
+    with a context the context's limits apply and stopping raises Incomplete holding the last two
+    polynomials of the sequence (the inputs for the modular algorithm)
+    coefficients outside Q go through Euclid's algorithm in floating point instead
+    """
+    from polynomials.univariate import from_dense, gcd_integer, gcd_mod, integral, primitive, to_dense
+
+    names = sorted(set(a.variables) | set(b.variables))
+    var = names[0] if names else "x"
+    char = max(a.field_characteristic, b.field_characteristic)
+    try:
+        da, db = to_dense(a, var, char), to_dense(b, var, char)
+    except ValueError:
+        return _gcd_euclid(a, b, context)
+    check = None
+    if context is not None:
+
+        def check(u: List[Any], v: List[Any]) -> None:
+            context.check(partial=lambda: (from_dense(u, var, char), from_dense(v, var, char)), degree=len(v) - 1)
+
+    if char:
+        return from_dense(gcd_mod(da, db, char, check), var, char)
+    over_z = all(c.denominator == 1 for c in da + db)
+    g = gcd_integer(integral(da), integral(db), check)
+    if not over_z and g:
+        g = primitive(g)
+    return from_dense(g, var)
+
+
+def _gcd_euclid(a: "Polynomial", b: "Polynomial", context: Optional[ExecutionContext] = None) -> "Polynomial":
+    """
+    Euclid's algorithm in floating point; without a context it raises Incomplete holding the
+    last two polynomials after _DEFAULT_MAX_STEPS remainders
+    """
     a = a.copy()
     b = b.copy()
-    if a.degree() >= b.degree():
-        r = a % b
-        max_steps = 1000
-        steps = 0
-        if b == Polynomial(0):
+    if a.degree() < b.degree():
+        a, b = b, a
+    r = a % b
+    limits = context if context is not None else ExecutionContext(max_steps=_DEFAULT_MAX_STEPS)
+    if b == Polynomial(0):
+        return a
+    while r != 0:
+        limits.check(partial=(b, r), degree=b.degree())
+        a = b
+        b = r
+        if not b.terms:
             return a
-        while r != 0:
-            if steps > max_steps:
-                if _DEBUG:
-                    logger.debug(
-                        "gcd_singlevariate: exceeded max steps, possible infinite loop. a=%s b=%s r=%s",
-                        a,
-                        b,
-                        r,
-                    )
-                break
-            a = b
-            b = r
-            if not b.terms:
-                return a
-            if len(b.terms) == 1:
-                (m_b, c_b), = b.terms.items()
-                if all(e == 0 for e in m_b.exps):
-                    return Polynomial(1, a.field_characteristic)
-            r = a % b
-            steps += 1
-        return b
+        if len(b.terms) == 1:
+            ((m_b, c_b),) = b.terms.items()
+            if all(e == 0 for e in m_b.exps):
+                return Polynomial(1, a.field_characteristic)
+        r = a % b
+    return b
+
+
+def _dense_pair(a: "Polynomial", b: "Polynomial") -> Tuple[List[Any], List[Any], str, int]:
+    from polynomials.univariate import to_dense
+
+    names = sorted(set(a.variables) | set(b.variables))
+    if len(names) > 1:
+        raise ValueError("polynomials in one variable expected")
+    var = names[0] if names else "x"
+    char = max(a.field_characteristic, b.field_characteristic)
+    return to_dense(a, var, char), to_dense(b, var, char), var, char
+
+
+def xgcd(a: "Polynomial", b: "Polynomial") -> Tuple["Polynomial", "Polynomial", "Polynomial"]:
+    """
+    (g, s, t) with g the monic gcd of polynomials in one variable and s a + t b = g, the cofactors
+    of least degree; over F_p from the half-gcd matrices, over Q by the extended Euclidean
+    algorithm on exact rationals
+    """
+    from polynomials.univariate import from_dense, xgcd_mod, xgcd_rational
+
+    da, db, var, char = _dense_pair(a, b)
+    g, s, t = xgcd_mod(da, db, char) if char else xgcd_rational(da, db)
+    return from_dense(g, var, char), from_dense(s, var, char), from_dense(t, var, char)
+
+
+def invmod(a: "Polynomial", h: "Polynomial") -> "Polynomial":
+    """
+    the inverse of a modulo h (polynomials in one variable), of degree below deg h; raises
+    ValueError if a and h are not coprime
+    """
+    from polynomials.univariate import divmod_rational, from_dense, invmod_mod, xgcd_rational
+
+    da, dh, var, char = _dense_pair(a, h)
+    if not dh:
+        raise ZeroDivisionError("inverse modulo the zero polynomial")
+    if char:
+        s = invmod_mod(da, dh, char)
     else:
-        return gcd(b, a)
+        g, s, _ = xgcd_rational(divmod_rational(da, dh)[1], dh)
+        if g != [1]:
+            s = None
+    if s is None:
+        raise ValueError("polynomial is not invertible modulo h")
+    return from_dense(s, var, char)
+
+
+def powmod(base: "Polynomial", e: int, modulus: "Polynomial") -> "Polynomial":
+    """
+    base^e mod modulus without forming base^e: univariate polynomials over F_p go through sliding
+    window exponentiation on dense coefficients with Newton reductions (polynomials.univariate),
+    anything else through square-and-multiply with a division after every step
+    negative exponents invert base modulo the modulus first
+    """
+    if e < 0:
+        return powmod(invmod(base, modulus), -e, modulus)
+    char = max(base.field_characteristic, modulus.field_characteristic)
+    if char and len(set(base.variables) | set(modulus.variables)) <= 1:
+        from polynomials.univariate import from_dense, powmod_mod
+
+        db, dm, var, _ = _dense_pair(base, modulus)
+        if not dm:
+            raise ZeroDivisionError("powmod modulo the zero polynomial")
+        return from_dense(powmod_mod(db, e, dm, char), var, char)
+    result = Polynomial(1, char) % modulus
+    square = base % modulus
+    while e:
+        if e & 1:
+            result = result * square % modulus
+        e >>= 1
+        if e:
+            square = square * square % modulus
+    return result
 
 
 def lcm(a: "Polynomial", b: "Polynomial") -> Union["Polynomial", List["Polynomial"]]:
-    lcm_poly = a * b / gcd(a, b)
+    lcm_poly = divexact(a, gcd(a, b)) * b
     if isinstance(lcm_poly, Polynomial):
         if not lcm_poly.terms:
             lcm_poly = Polynomial.from_constant(0.0, a.vars, a.field_characteristic)
@@ -0,0 +1,209 @@
+"""
+Reduction of many polynomials modulo one fixed basis.
+
+division_algorithm(p, *G) re-aligns, copies and re-inspects every divisor on each call.
+A Reducer does that work once: the basis is aligned to a common variable tuple, stored as
+plain {exponent tuple: coefficient} maps sorted by leading monomial, and the leading
+monomial, the inverse leading coefficient and the tail of every element are precomputed.
+The leading monomials are kept in a MonomialIndex, so finding a divisor is not a scan.
+Reducing a polynomial then only touches exponent tuples and coefficients.
+
+Coefficients over F_p are handled as Python ints modulo p (leading coefficients are
+inverted, not divided as floats); results are converted back to the float coefficients
+used by Polynomial.
+"""
+
+import heapq
+from fractions import Fraction
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from polynomials.monomial_index import MonomialIndex
+from polynomials.polynomial import Monomial, Polynomial
+from polynomials.primitives.polycalc_numbers import Rational
+
+__all__ = [
+    "Reducer",
+    "to_sparse",
+    "from_sparse",
+]
+
+Exponents = Tuple[int, ...]
+SparseTerms = Dict[Exponents, Any]
+
+# relative size below which a float coefficient is treated as cancelled
+_CANCEL_EPS = 1e-12
+
+
+def _order_key(exps: Exponents) -> Tuple[int, ...]:
+    # same graded order as Polynomial.leading_term: total degree, then exponents
+    return (sum(exps),) + exps
+
+
+def _heap_key(exps: Exponents) -> Tuple[int, ...]:
+    return tuple(-k for k in _order_key(exps))
+
+
+def _to_field(c: Any, char: int) -> int:
+    """coefficient as an int modulo char (non-integral values are read as fractions)"""
+    if isinstance(c, Rational):
+        return int(c.numerator) * pow(int(c.denominator), -1, char) % char
+    if isinstance(c, float) and not c.is_integer():
+        f = Fraction(c)
+        return f.numerator * pow(f.denominator, -1, char) % char
+    return int(c) % char
+
+
+def to_sparse(p: Polynomial, variables: Sequence[str], char: int = 0) -> SparseTerms:
+    """
+    returns the terms of p as {exponent tuple over variables: coefficient}
+    over F_p coefficients become ints modulo p
+    """
+    pos = {v: i for i, v in enumerate(variables)}
+    n = len(variables)
+    out: SparseTerms = {}
+    for m, c in p.terms.items():
+        exps = [0] * n
+        for v, e in zip(m.vars, m.exps):
+            if e:
+                exps[pos[v]] = e
+        key = tuple(exps)
+        out[key] = out.get(key, 0) + (_to_field(c, char) if char else c)
+    if char:
+        return {m: c % char for m, c in out.items() if c % char}
+    return {m: c for m, c in out.items() if c != 0}
+
+
+def from_sparse(terms: SparseTerms, variables: Sequence[str], char: int = 0) -> Polynomial:
+    """
+    inverse of to_sparse
+    """
+    p = Polynomial(0, char)
+    p.vars = tuple(variables)
+    if char:
+        p.terms = {Monomial(p.vars, m): float(c) for m, c in terms.items()}
+    else:
+        p.terms = {Monomial(p.vars, m): c for m, c in terms.items()}
+    p._filter_zero_terms()
+    return p
+
+
+def _cancelled(new: Any, old: Any) -> bool:
+    if new == 0:
+        return True
+    if isinstance(new, (float, complex)):
+        return abs(new) <= _CANCEL_EPS * abs(old)
+    return False
+
+
+class Reducer:
+    """
+    prepared basis for computing remainders (normal forms) of many polynomials
+    """
+
+    def __init__(self, basis: Iterable[Polynomial], variables: Optional[Sequence[str]] = None) -> None:
+        self.basis: List[Polynomial] = [g for g in basis if g.terms]
+        chars = {g.field_characteristic for g in self.basis}
+        self.char: int = max(chars) if chars else 0
+        names = set(variables or ())
+        for g in self.basis:
+            names.update(g.variables)
+        self._prepare(tuple(sorted(names)))
+
+    def _prepare(self, variables: Tuple[str, ...]) -> None:
+        self.vars = variables
+        char = self.char
+        rows = []
+        for g in self.basis:
+            terms = to_sparse(g, variables, char)
+            if not terms:
+                continue
+            lead = max(terms, key=_order_key)
+            lc = terms[lead]
+            inv = pow(lc, -1, char) if char else 1 / lc
+            tail = [(m, c) for m, c in terms.items() if m != lead]
+            rows.append((lead, inv, tail))
+        rows.sort(key=lambda row: _order_key(row[0]))
+        self._leads: List[Exponents] = [row[0] for row in rows]
+        self._inverses: List[Any] = [row[1] for row in rows]
+        self._tails: List[List[Tuple[Exponents, Any]]] = [row[2] for row in rows]
+        self._index = MonomialIndex(len(variables), self._leads)
+
+    def __len__(self) -> int:
+        return len(self._leads)
+
+    def _ensure_variables(self, p: Polynomial) -> None:
+        missing = [v for v in p.variables if v not in self.vars]
+        if missing:
+            self._prepare(tuple(sorted(set(self.vars).union(missing))))
+
+    def find_divisor(self, exps: Exponents) -> Optional[int]:
+        """
+        returns the index of the first basis element whose leading monomial divides exps
+        """
+        return self._index.find_divisor(exps)
+
+    def reduce_terms(self, work: SparseTerms) -> SparseTerms:
+        """
+        fully reduces aligned sparse terms, returns the remainder terms
+        work is consumed
+        """
+        char = self.char
+        remainder: SparseTerms = {}
+        heap = [(_heap_key(m), m) for m in work]
+        heapq.heapify(heap)
+        while heap:
+            _, m = heapq.heappop(heap)
+            c = work.pop(m, None)
+            if c is None:
+                continue
+            i = self.find_divisor(m)
+            if i is None:
+                remainder[m] = c
+                continue
+            q = c * self._inverses[i]
+            if char:
+                q %= char
+            lead = self._leads[i]
+            shift = tuple(a - b for a, b in zip(m, lead))
+            for tm, tc in self._tails[i]:
+                nm = tuple(a + b for a, b in zip(tm, shift))
+                old = work.get(nm)
+                if old is None:
+                    new = -q * tc
+                    if char:
+                        new %= char
+                    if new != 0:
+                        work[nm] = new
+                        heapq.heappush(heap, (_heap_key(nm), nm))
+                    continue
+                new = old - q * tc
+                if char:
+                    new %= char
+                if _cancelled(new, old):
+                    del work[nm]
+                else:
+                    work[nm] = new
+        return remainder
+
+    def reduce(self, p: Polynomial) -> Polynomial:
+        """
+        returns the remainder of p on division by the basis
+        """
+        if not p.terms:
+            return Polynomial(0, self.char or p.field_characteristic)
+        self._ensure_variables(p)
+        char = self.char or p.field_characteristic
+        remainder = self.reduce_terms(to_sparse(p, self.vars, self.char))
+        return from_sparse(remainder, self.vars, char)
+
+    def reduce_many(self, polys: Iterable[Polynomial]) -> List[Polynomial]:
+        return [self.reduce(p) for p in polys]
+
+    def is_zero(self, p: Polynomial) -> bool:
+        """
+        returns whether p reduces to zero
+        """
+        if not p.terms:
+            return True
+        self._ensure_variables(p)
+        return not self.reduce_terms(to_sparse(p, self.vars, self.char))
@@ -0,0 +1,344 @@
+"""
+Rational univariate representations of zero-dimensional ideals.
+
+Back substitution into a lex basis branches on every root of every univariate polynomial
+it meets. A rational univariate representation (Rouillier) describes all solutions at once:
+for a linear form t = sum(l_i * x_i) taking distinct values on the solutions,
+
+    f(T) = 0,    x_i = g_i(T) / g(T)
+
+where f is the squarefree polynomial whose roots are the values of t, and g, g_i have
+degree below deg f. Everything is computed in the quotient ring k[x]/I from the reduced
+basis, through the multiplication matrices of polynomials.fglm and the trace form
+Tr(h) = trace of multiplication by h:
+
+    f         the squarefree part of the characteristic polynomial of t (Newton identities
+              on the traces of t^k)
+    g_i(T)    sum over k < deg f of Tr(x_i * t^k) * H_(deg f - 1 - k)(T), H_j the Horner
+              polynomials of f; g is the same with x_i = 1
+
+t separates the solutions when deg f equals the rank of the Hermite form Tr(b * b'), the
+number of distinct solutions. Solving is then a single root-finding job on f followed by
+one evaluation pass, and roots that are rational give exact solutions.
+
+Coefficients are Fractions, so this needs characteristic 0. The trace computations take
+about D^4 field operations for D standard monomials. The parametrizations are evaluated at
+the irrational roots with numpy (the algebra extra).
+"""
+
+import random
+from collections import namedtuple
+from fractions import Fraction
+from math import gcd
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from polynomials.fglm import multiplication_matrices
+from polynomials.formulas import durand_kerner_roots
+from polynomials.groebner import Exponents, Terms
+
+__all__ = [
+    "RationalUnivariateRepresentation",
+    "rational_univariate_representation",
+    "rur_solutions",
+]
+
+Vector = Dict[int, Any]
+Coefficients = List[Fraction]  # univariate polynomial, constant term first
+
+RationalUnivariateRepresentation = namedtuple(
+    "RationalUnivariateRepresentation", ["variables", "separating", "polynomial", "denominator", "numerators"]
+)
+RationalUnivariateRepresentation.__doc__ = (
+    "solutions x_i = numerators[i](T) / denominator(T) for the roots T of polynomial (squarefree, monic), "
+    "T = sum(separating[i] * x_i); coefficient lists start with the constant term"
+)
+
+
+def _trim(a: Coefficients) -> Coefficients:
+    while a and a[-1] == 0:
+        a.pop()
+    return a
+
+
+def _divmod(a: Coefficients, b: Coefficients) -> Tuple[Coefficients, Coefficients]:
+    r = list(a)
+    q = [Fraction(0)] * max(len(a) - len(b) + 1, 0)
+    inv = 1 / Fraction(b[-1])
+    for k in range(len(a) - len(b), -1, -1):
+        c = r[k + len(b) - 1] * inv
+        q[k] = c
+        if c:
+            for j, bj in enumerate(b):
+                r[k + j] -= c * bj
+    return _trim(q), _trim(r[: len(b) - 1])
+
+
+def _monic(a: Coefficients) -> Coefficients:
+    inv = 1 / Fraction(a[-1])
+    return [c * inv for c in a]
+
+
+def _gcd(a: Coefficients, b: Coefficients) -> Coefficients:
+    while b:
+        a, b = b, _divmod(a, b)[1]
+    return _monic(a)
+
+
+def _squarefree(a: Coefficients) -> Coefficients:
+    derivative = _trim([k * c for k, c in enumerate(a)][1:])
+    if not derivative:
+        return _monic(a)
+    return _monic(_divmod(a, _gcd(a, derivative))[0])
+
+
+def _evaluate(a: Sequence[Any], x: Any) -> Any:
+    value: Any = 0
+    for c in reversed(a):
+        value = value * x + c
+    return value
+
+
+def _rank(rows: List[List[Fraction]]) -> int:
+    rows = [list(r) for r in rows]
+    rank = 0
+    for col in range(len(rows[0]) if rows else 0):
+        pivot = next((r for r in range(rank, len(rows)) if rows[r][col] != 0), None)
+        if pivot is None:
+            continue
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        inv = 1 / rows[rank][col]
+        for r in range(rank + 1, len(rows)):
+            factor = rows[r][col] * inv
+            if factor:
+                rows[r] = [x - factor * y for x, y in zip(rows[r], rows[rank])]
+        rank += 1
+    return rank
+
+
+def _apply(columns: List[Vector], v: Vector) -> Vector:
+    out: Vector = {}
+    for k, c in v.items():
+        for r, a in columns[k].items():
+            out[r] = out.get(r, 0) + c * a
+    return {r: a for r, a in out.items() if a != 0}
+
+
+def _combine(matrices: List[List[Vector]], weights: Sequence[int]) -> List[Vector]:
+    """columns of sum(weights[i] * matrices[i])"""
+    columns: List[Vector] = []
+    for k in range(len(matrices[0])):
+        out: Vector = {}
+        for w, matrix in zip(weights, matrices):
+            if w:
+                for r, a in matrix[k].items():
+                    out[r] = out.get(r, 0) + w * a
+        columns.append({r: a for r, a in out.items() if a != 0})
+    return columns
+
+
+class _QuotientRing:
+    """normal forms of monomials and the trace form of k[x]/I, from the multiplication matrices"""
+
+    def __init__(self, staircase: List[Exponents], matrices: List[List[Vector]]) -> None:
+        self.staircase = staircase
+        self.matrices = matrices
+        self.forms: Dict[Exponents, Vector] = {b: {k: Fraction(1)} for k, b in enumerate(staircase)}
+        self.traces = [
+            sum(self.normal_form(_product(b, c)).get(k, 0) for k, c in enumerate(staircase)) for b in staircase
+        ]
+
+    def normal_form(self, m: Exponents) -> Vector:
+        form = self.forms.get(m)
+        if form is None:
+            i = next(i for i, e in enumerate(m) if e)
+            form = _apply(self.matrices[i], self.normal_form(m[:i] + (m[i] - 1,) + m[i + 1 :]))
+            self.forms[m] = form
+        return form
+
+    def trace(self, v: Vector) -> Fraction:
+        return sum((c * self.traces[k] for k, c in v.items()), Fraction(0))
+
+    def hermite_rank(self) -> int:
+        """number of distinct solutions"""
+        rows = [[self.trace(self.normal_form(_product(b, c))) for c in self.staircase] for b in self.staircase]
+        return _rank(rows)
+
+
+def _product(a: Exponents, b: Exponents) -> Exponents:
+    return tuple(x + y for x, y in zip(a, b))
+
+
+def _characteristic(power_sums: List[Fraction]) -> Coefficients:
+    """monic polynomial of degree len(power_sums) - 1 with the given sums of k-th powers of its roots"""
+    degree = len(power_sums) - 1
+    e = [Fraction(1)]
+    for k in range(1, degree + 1):
+        e.append(sum(((-1) ** (i - 1) * e[k - i] * power_sums[i] for i in range(1, k + 1)), Fraction(0)) / k)
+    return [(-1) ** (degree - j) * e[degree - j] for j in range(degree + 1)]
+
+
+def _separating_forms(nvars: int, spread: int) -> Iterator[Tuple[int, ...]]:
+    """t = the last variable, then sum(l_i * x_i) with small weights, drawn reproducibly from [-spread, spread]"""
+    yield tuple(1 if i == nvars - 1 else 0 for i in range(nvars))
+    rng = random.Random(spread)
+    while True:
+        yield tuple(rng.randint(-spread, spread) or 1 for _ in range(nvars))
+
+
+def rational_univariate_representation(
+    basis: Sequence[Terms], variables: Sequence[str], order: str = "grevlex", max_tries: int = 100
+) -> RationalUnivariateRepresentation:
+    """
+    returns the rational univariate representation of the zero-dimensional ideal with the
+    reduced Groebner basis basis (exact terms over Q for order, exponents over variables)
+    raises NotZeroDimensional for infinitely many solutions
+    """
+    nvars = len(variables)
+    staircase, matrices = multiplication_matrices(basis, nvars, order)
+    degree = len(staircase)
+    if degree == 0:  # the unit ideal: no solutions
+        return RationalUnivariateRepresentation(
+            tuple(variables), (1,) * nvars, [Fraction(1)], [], [[] for _ in variables]
+        )
+    ring = _QuotientRing(staircase, matrices)
+    solutions: Optional[int] = None
+    # a form fails to separate two solutions for at most one value of each weight, so with
+    # D^2 values to draw from most forms separate
+    for tries, weights in enumerate(_separating_forms(nvars, degree * degree)):
+        if tries >= max_tries:
+            raise ValueError("no separating linear form found")
+        t = _combine(matrices, weights)
+        powers = [ring.normal_form(tuple([0] * nvars))]
+        for _ in range(degree):
+            powers.append(_apply(t, powers[-1]))
+        f = _squarefree(_characteristic([ring.trace(v) for v in powers]))
+        d = len(f) - 1
+        if d == degree:
+            break  # D distinct values: D simple solutions, t separates them
+        if solutions is None:
+            solutions = ring.hermite_rank()
+        if d == solutions:
+            break
+    # Horner polynomials of f: H_j = f_(d-j) + f_(d-j+1) T + ... + f_d T^j
+    horner = [f[d - j :] for j in range(d)]
+
+    def parametrization(traces: List[Fraction]) -> Coefficients:
+        out = [Fraction(0)] * d
+        for k, tr in enumerate(traces[:d]):
+            if tr:
+                for j, c in enumerate(horner[d - 1 - k]):
+                    out[j] += tr * c
+        return _trim(out)
+
+    denominator = parametrization([ring.trace(v) for v in powers])
+    numerators = [parametrization([ring.trace(_apply(matrices[i], v)) for v in powers]) for i in range(nvars)]
+    return RationalUnivariateRepresentation(tuple(variables), weights, f, denominator, numerators)
+
+
+def _roots(f: Coefficients) -> List[complex]:
+    """numerical roots of a squarefree polynomial (Durand-Kerner iteration, then Newton steps)"""
+    z = durand_kerner_roots(f)
+    # Newton steps evaluated exactly, so large coefficients cost no accuracy
+    derivative = [k * c for k, c in enumerate(f)][1:]
+    for i in range(len(z)):
+        for _ in range(2):
+            slope = _evaluate_at(derivative, z[i])
+            if slope == (0, 0):
+                break
+            z[i] -= _complex(_divide(_evaluate_at(f, z[i]), slope))
+    return z
+
+
+def _numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - numpy is an optional dependency
+        raise ImportError(
+            "irrational solutions of a rational univariate representation require numpy; "
+            "install extras: pip install 'PolynomialCalculator[algebra]'"
+        )
+    return np
+
+
+def _evaluate_at(a: Coefficients, z: complex) -> Tuple[Fraction, Fraction]:
+    """a(z) as exact (real, imaginary) parts, for the float or complex number z"""
+    if not a:
+        return Fraction(0), Fraction(0)
+    x, y = Fraction(z.real), Fraction(z.imag)
+    # floats are dyadic: z = (X + iY) / scale, and Horner runs on integers
+    scale = max(x.denominator, y.denominator)
+    X, Y = x.numerator * (scale // x.denominator), y.numerator * (scale // y.denominator)
+    common = 1
+    for c in a:
+        common = common * c.denominator // gcd(common, c.denominator)
+    re, im, power = 0, 0, 1
+    for c in reversed(a):
+        re, im = re * X - im * Y + c.numerator * (common // c.denominator) * power, re * Y + im * X
+        power *= scale
+    denominator = common * power // scale
+    return Fraction(re, denominator), Fraction(im, denominator)
+
+
+def _divide(a: Tuple[Fraction, Fraction], b: Tuple[Fraction, Fraction]) -> Tuple[Fraction, Fraction]:
+    norm = b[0] * b[0] + b[1] * b[1]
+    return (a[0] * b[0] + a[1] * b[1]) / norm, (a[1] * b[0] - a[0] * b[1]) / norm
+
+
+def _complex(z: Tuple[Fraction, Fraction]) -> complex:
+    return complex(float(z[0]), float(z[1]))
+
+
+def _exact_root(f: Coefficients, z: complex) -> Optional[Fraction]:
+    """the rational root of f approximated by z, if there is one"""
+    if abs(z.imag) > 1e-8 * (1 + abs(z)):
+        return None
+    # a rational root p/q of an integer polynomial has q | leading coefficient
+    scale = 1
+    for c in f:
+        scale = scale * c.denominator // gcd(scale, c.denominator)
+    lead = abs(f[-1] * scale)
+    try:
+        r = Fraction(z.real).limit_denominator(int(lead))
+    except (OverflowError, ValueError):
+        return None
+    return r if _evaluate(f, r) == 0 else None
+
+
+def rur_solutions(rur: RationalUnivariateRepresentation) -> List[Dict[str, Any]]:
+    """
+    returns the solutions {variable: value} of the representation: Fractions where the root of
+    the polynomial is rational, floats where it is real, complex numbers otherwise
+    the parametrizations are evaluated at all the irrational roots at once (needs numpy)
+    """
+    if len(rur.polynomial) <= 1:
+        return []
+    out: List[Dict[str, Any]] = []
+    inexact: List[complex] = []
+    for z in _roots(rur.polynomial):
+        exact = _exact_root(rur.polynomial, z)
+        if exact is None:
+            inexact.append(z)
+            continue
+        g = _evaluate(rur.denominator, exact)
+        out.append({v: _evaluate(n, exact) / g for v, n in zip(rur.variables, rur.numerators)})
+    if not inexact:
+        return out
+    np = _numpy()
+    z = np.array(inexact, dtype=complex)
+    real = np.abs(z.imag) <= 1e-8 * (1 + np.abs(z))
+    # a real root gives a real point
+    z[real] = z[real].real
+    # x_i = g_i / g is unchanged by a common scale, which keeps large coefficients within floats
+    scale = max(abs(c) for a in (rur.denominator, *rur.numerators) for c in a)
+    g = np.polyval([float(c / scale) for c in reversed(rur.denominator)], z)
+    values = [np.polyval([float(c / scale) for c in reversed(n)], z) / g for n in rur.numerators]
+    for k in range(len(z)):
+        if real[k]:
+            out.append({v: float(x[k].real) for v, x in zip(rur.variables, values)})
+            continue
+        point = {}
+        for v, x in zip(rur.variables, values):
+            c = complex(x[k])
+            point[v] = complex(c.real, 0.0) if abs(c.imag) <= 1e-12 * abs(c) else c
+        out.append(point)
+    return out
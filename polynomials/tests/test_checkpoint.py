@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+
+from polynomials.checkpoint import load_checkpoint
+from polynomials.execution import ExecutionContext, Incomplete
+from polynomials.groebner import GroebnerState, exact_system
+from polynomials.groebner_cache import get_groebner_cache
+from polynomials.ideal import Ideal
+from polynomials.polynomial import Polynomial
+
+_GENERATORS = ["x^2 + yz - 2", "y^2 + xz - 3", "xy + z^2 - 5"]
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        get_groebner_cache().clear()
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "run.json")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_state_round_trip(self):
+        for char in (0, 7):
+            names, char, exact = exact_system([Polynomial(s, char) for s in _GENERATORS])
+            state = GroebnerState(len(names), "lex", char)
+            state.add(exact)
+            copy = GroebnerState.from_dict(state.to_dict())
+            self.assertEqual(copy.pairs, state.pairs)
+            self.assertEqual(copy.basis(), state.basis())
+
+    def test_stop_and_resume(self):
+        I = Ideal(*(Polynomial(s) for s in _GENERATORS))
+        with self.assertRaises(Incomplete):
+            I.groebner_basis("grevlex", context=ExecutionContext(max_steps=2), checkpoint=self.path)
+        _, _, state = load_checkpoint(self.path)
+        self.assertEqual(state.pairs_processed, 2)
+        # a fresh Ideal (as on another machine) picks up the saved run and its order
+        J = Ideal(*(Polynomial(s) for s in _GENERATORS))
+        basis = J.groebner_basis(resume_from=self.path, checkpoint=self.path)
+        get_groebner_cache().clear()
+        self.assertEqual(basis, Ideal(*(Polynomial(s) for s in _GENERATORS)).groebner_basis("grevlex"))
+        _, _, state = load_checkpoint(self.path)
+        self.assertEqual(state.pairs, set())
+
+    def test_mismatch(self):
+        I = Ideal(*(Polynomial(s) for s in _GENERATORS))
+        I.groebner_basis("grevlex", checkpoint=self.path)
+        with self.assertRaises(ValueError):
+            Ideal(Polynomial("x^2 - y")).groebner_basis(resume_from=self.path)
+        with self.assertRaises(ValueError):
+            I.groebner_basis("lex", resume_from=self.path)
+        with self.assertRaises(ValueError):
+            I.groebner_basis(checkpoint=self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -38,6 +38,18 @@ class TestCLI(unittest.TestCase):
         self.assertIn("1 solutions:", out)
         self.assertIn("x = 1.0", out)  # default may be float prior to display mode flags
 
+    def test_solve_system_numeric_cli(self):
+        code, out, err = run_cli(["solve-system", "--numeric", "x^2+y^2-5", "x*y-2"])
+        self.assertEqual(code, 0)
+        self.assertIn("4 solutions:", out)
+        self.assertIn("x = 2.0, y = 1.0", out)
+
+    def test_solve_system_mod_p_cli(self):
+        code, out, err = run_cli(["--rational", "solve-system", "-p", "7", "x^2+y^2-1", "x-y"])
+        self.assertEqual(code, 0)
+        self.assertIn("2 solutions:", out)
+        self.assertIn("x = 5, y = 5", out)
+
     def test_json_solve(self):
         code, out, err = run_cli(["--json", "solve", "x^2-2", "x"])
         self.assertEqual(code, 0)
@@ -66,6 +78,18 @@ class TestCLI(unittest.TestCase):
         self.assertEqual(payload.get("status"), "ok")
         self.assertIsInstance(payload.get("basis"), list)
 
+    def test_groebner_stats(self):
+        code, out, err = run_cli(
+            ["--json", "groebner", "x^2+y^2-1", "xy-1", "--order", "grevlex", "--engine", "exact", "--stats"]
+        )
+        self.assertEqual(code, 0)
+        stats = json.loads(out)["stats"]
+        self.assertEqual((stats["engine"], stats["order"]), ("exact", "grevlex"))
+        self.assertGreater(stats["pairs_created"], 0)
+        code, out, err = run_cli(["groebner", "x^2+y^2-1", "x-y", "--stats"])
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(out.strip().splitlines()[-1])["engine"], "legacy")
+
     def test_json_failure_invalid_poly(self):
         # Provide an invalid polynomial to trigger runtime error in JSON mode
         code, out, err = run_cli(["--json", "solve", "x^2+-", "x"])
@@ -108,9 +132,7 @@ class TestCLI(unittest.TestCase):
 
     def test_numeric_output_flags_groebner(self):
         # Rational mode should drop .0 in integer constants
-        code, out, err = run_cli(
-            ["--rational", "groebner", "x^2+y^2-1", "x-y", "--order", "grevlex"]
-        )
+        code, out, err = run_cli(["--rational", "groebner", "x^2+y^2-1", "x-y", "--order", "grevlex"])
         self.assertEqual(code, 0)
         self.assertIn("Groebner basis:", out)
         self.assertIn("x - y", out)
@@ -0,0 +1,107 @@
+import random
+import unittest
+from fractions import Fraction
+
+from polynomials.divisibility import divide_exact
+from polynomials.groebner import to_exact
+from polynomials.multivariate_gcd import exact_divide
+from polynomials.polynomial import NonFactor, Polynomial, divexact, divides, lcm
+
+
+def _random_terms(rng, nvars, terms, degree, char=0):
+    out = {}
+    for _ in range(terms):
+        m = tuple(rng.randint(0, degree) for _ in range(nvars))
+        out[m] = rng.randrange(1, char) if char else Fraction(rng.randint(-9, 9) or 1, rng.randint(1, 4))
+    return out
+
+
+def _multiply(a, b, char=0):
+    out = {}
+    for ma, ca in a.items():
+        for mb, cb in b.items():
+            m = tuple(x + y for x, y in zip(ma, mb))
+            out[m] = out.get(m, 0) + ca * cb
+    if char:
+        return {m: c % char for m, c in out.items() if c % char}
+    return {m: c for m, c in out.items() if c}
+
+
+def _add_one(a, nvars, char=0):
+    one = (0,) * nvars
+    out = dict(a)
+    out[one] = out.get(one, 0) + 1
+    if char:
+        out[one] %= char
+    return {m: c for m, c in out.items() if c}
+
+
+class TestDivideExact(unittest.TestCase):
+
+    def test_quotients(self):
+        rng = random.Random(3)
+        for char in (0, 7, 10007):
+            for nvars in (1, 2, 3):
+                for _ in range(10):
+                    a = _random_terms(rng, nvars, 6, 4, char)
+                    b = _random_terms(rng, nvars, 4, 3, char)
+                    ab = _multiply(a, b, char)
+                    self.assertEqual(divide_exact(ab, b, nvars, char), a)
+                    self.assertEqual(divide_exact(ab, a, nvars, char), b)
+                    if any(any(m) for m in b):
+                        # b is not a unit, so it does not divide ab + 1
+                        self.assertIsNone(divide_exact(_add_one(ab, nvars, char), b, nvars, char))
+
+    def test_non_divisors(self):
+        # degrees, images at a random point and the term by term division each reject
+        self.assertIsNone(divide_exact({(3, 0): 1, (0, 0): 1}, {(0, 1): 1, (0, 0): 1}, 2))
+        self.assertIsNone(divide_exact({(5, 1): 1}, {(2, 0): 1, (0, 0): 1}, 2))
+        self.assertIsNone(divide_exact({(100,): 1}, {(1,): 1, (0,): -1}, 1))
+        self.assertIsNone(divide_exact({(2, 1): 1, (0, 1): 3}, {(1, 0): 1, (0, 0): 1}, 2, 5))
+        self.assertEqual(divide_exact({(2, 0): Fraction(3, 2)}, {(1, 0): Fraction(1)}, 2), {(1, 0): Fraction(3, 2)})
+        self.assertEqual(divide_exact({(): 6}, {(): 4}, 0), {(): Fraction(3, 2)})
+        self.assertEqual(divide_exact({(): 6}, {(): 4}, 0, 7), {(): 5})
+        with self.assertRaises(ZeroDivisionError):
+            divide_exact({(1,): 1}, {}, 1)
+
+    def test_exact_divide_lowest_monomial(self):
+        # x^100 / (x - 1) over Z: rejected before any term is divided
+        self.assertIsNone(exact_divide({(100, 0): 1}, {(1, 0): 1, (0, 0): -1}))
+        self.assertEqual(exact_divide({(2, 1): 2, (1, 2): 2}, {(1, 1): 2}), {(1, 0): 1, (0, 1): 1})
+
+
+class TestDivexact(unittest.TestCase):
+
+    def test_divexact(self):
+        f, g = Polynomial("x^2 + 3xy - 2"), Polynomial("y^3 - x + 5")
+        self.assertEqual(divexact(f * g, g), f)
+        self.assertEqual(divexact(f * g * 0.5, g * 3), f * (1 / 6))
+        self.assertEqual(divexact(Polynomial(0), g), 0)
+        p, q = Polynomial("x^2 + y + 1", 3), Polynomial("2xy + 1", 3)
+        self.assertEqual(divexact(p * q, q), p)
+        with self.assertRaises(NonFactor):
+            divexact(f * g + 1, g)
+        with self.assertRaises(NonFactor):
+            divexact(Polynomial("x^100"), Polynomial("x - 1"))
+        with self.assertRaises(ZeroDivisionError):
+            divexact(f, Polynomial(0))
+
+    def test_divides(self):
+        t, s = Polynomial("xy - 1"), Polynomial("x^2y + xy^2 + y^2")
+        self.assertTrue(divides(t, s))
+        self.assertFalse(divides(t, s, exact=True))
+        self.assertTrue(divides(t, t * s, exact=True))
+        self.assertTrue(divides(t, Polynomial(0), exact=True))
+        self.assertFalse(divides(Polynomial(0), t, exact=True))
+        self.assertEqual(lcm(Polynomial("x^2 - 1"), Polynomial("x^2 + 2x + 1")), Polynomial("x^3 + x^2 - x - 1"))
+
+    def test_exact_representation(self):
+        a = Polynomial("x^2 - y^2")
+        names = ("x", "y")
+        self.assertEqual(
+            divide_exact(to_exact(a, names), to_exact(Polynomial("x + y"), names), 2), {(1, 0): 1, (0, 1): -1}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
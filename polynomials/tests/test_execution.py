@@ -0,0 +1,72 @@
+import unittest
+from unittest import mock
+
+from polynomials import polynomial as polynomial_module
+from polynomials.execution import CANCELLED, STEP_LIMIT, CancellationToken, ExecutionContext, Incomplete
+from polynomials.groebner_cache import get_groebner_cache
+from polynomials.ideal import Ideal
+from polynomials.polynomial import Polynomial, division_algorithm, gcd_singlevariate
+
+
+def _ideal():
+    return Ideal(Polynomial("x^2 + yz - 2"), Polynomial("y^2 + xz - 3"), Polynomial("xy + z^2 - 5"))
+
+
+class TestExecutionContext(unittest.TestCase):
+
+    def setUp(self):
+        get_groebner_cache().clear()
+
+    def test_step_limit_and_resume(self):
+        I = _ideal()
+        reports = []
+        with self.assertRaises(Incomplete) as caught:
+            I.groebner_basis("grevlex", context=ExecutionContext(max_steps=3, on_progress=reports.append))
+        e = caught.exception
+        self.assertEqual(e.reason, STEP_LIMIT)
+        self.assertEqual(e.progress.pairs_processed, 3)
+        self.assertEqual([r.steps for r in reports], [1, 2, 3])
+        self.assertTrue(all(isinstance(g, Polynomial) for g in e.partial))
+        # nothing was cached, and the next call finishes the stopped run
+        self.assertEqual(len(get_groebner_cache()), 0)
+        self.assertEqual(I.groebner_basis("grevlex"), _ideal()._basis("grevlex"))
+
+    def test_cancellation_and_deadline(self):
+        token = CancellationToken()
+        token.cancel()
+        with self.assertRaises(Incomplete) as caught:
+            _ideal().groebner_basis(context=ExecutionContext(token=token))
+        self.assertEqual(caught.exception.reason, CANCELLED)
+        with self.assertRaises(Incomplete):
+            _ideal().lex_basis(context=ExecutionContext(timeout=0))
+
+    def test_division_and_gcd(self):
+        p, d = Polynomial("x^5 + x + 1"), Polynomial("x + 1")
+        self.assertEqual(division_algorithm(p, d, context=ExecutionContext()), division_algorithm(p, d))
+        with self.assertRaises(Incomplete) as caught:
+            division_algorithm(p, d, context=ExecutionContext(max_steps=2))
+        quotients, remainder, rest = caught.exception.partial
+        self.assertEqual(quotients[0] * d + remainder + rest, p)
+        self.assertEqual(
+            gcd_singlevariate(Polynomial("x^3 - 1"), Polynomial("x^2 - 1"), ExecutionContext()), Polynomial("x - 1")
+        )
+        with self.assertRaises(Incomplete):
+            gcd_singlevariate(Polynomial("x^3 - 1"), Polynomial("x^2 - 1"), ExecutionContext(max_steps=0))
+
+    def test_default_step_limit(self):
+        # without a context the default budget raises instead of returning a truncated result
+        p, d = Polynomial("x^5 + x + 1"), Polynomial("x + 1")
+        with mock.patch.object(polynomial_module, "_DEFAULT_MAX_STEPS", 2):
+            with self.assertRaises(Incomplete) as caught:
+                division_algorithm(p, d)
+            self.assertEqual(caught.exception.reason, STEP_LIMIT)
+            quotients, remainder, rest = caught.exception.partial
+            self.assertEqual(quotients[0] * d + remainder + rest, p)
+            # complex coefficients take floating point Euclid
+            with self.assertRaises(Incomplete):
+                gcd_singlevariate(Polynomial("x^3 - 1") * 1j, Polynomial("x^2 - 1"))
+        self.assertEqual(gcd_singlevariate(Polynomial("x^3 - 1") * 1j, Polynomial("x^2 - 1")).degree(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
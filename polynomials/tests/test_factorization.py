@@ -0,0 +1,175 @@
+import random
+import unittest
+from fractions import Fraction
+from unittest import mock
+
+from polynomials import factorization
+from polynomials.factorization import (
+    distinct_degree_mod,
+    factor_integer,
+    factor_mod,
+    hensel_lift,
+    is_irreducible_mod,
+    roots_mod,
+    squarefree_mod,
+)
+from polynomials.polynomial import Polynomial
+from polynomials.univariate import monic_mod, mul, mul_mod
+
+
+def _expand(lc, factors, p):
+    product = [lc]
+    for g, e in factors:
+        for _ in range(e):
+            product = mul_mod(product, g, p)
+    return product
+
+
+def _expand_integer(c, factors):
+    product = [c]
+    for g, e in factors:
+        for _ in range(e):
+            product = mul(product, g)
+    return product
+
+
+# the minimal polynomial of sqrt(2) + sqrt(3) + sqrt(5): a product of linear and quadratic factors mod every p
+SWINNERTON_DYER = [576, 0, -960, 0, 352, 0, -40, 0, 1]
+
+
+class TestFactorMod(unittest.TestCase):
+
+    def test_random_polynomials(self):
+        rng = random.Random(7)
+        for p in (2, 3, 5, 101, 2**31 - 1):
+            for n in (1, 2, 5, 12, 40):
+                f = [rng.randrange(p) for _ in range(n)] + [rng.randrange(1, p)]
+                # with repeated factors as well
+                for g in (f, mul_mod(mul_mod(f, f, p), [1, 1], p)):
+                    lc, factors = factor_mod(g, p)
+                    self.assertEqual(_expand(lc, factors, p), g)
+                    self.assertEqual(len({tuple(h) for h, _ in factors}), len(factors))
+                    for h, _ in factors:
+                        self.assertEqual(h[-1], 1)
+                        self.assertTrue(is_irreducible_mod(h, p))
+
+    def test_stages(self):
+        # (x + 1)^3 (x^2 + 1) over F_3: x^2 + 1 is irreducible, (x + 1)^3 = x^3 + 1 a cube
+        f = _expand(1, [([1, 1], 3), ([1, 0, 1], 1)], 3)
+        self.assertEqual(squarefree_mod(f, 3), [([1, 0, 1], 1), ([1, 1], 3)])
+        self.assertEqual(factor_mod(f, 3), (1, [([1, 1], 3), ([1, 0, 1], 1)]))
+        # x^5 - x over F_5 is the product of the linear factors
+        self.assertEqual(distinct_degree_mod([0, 4, 0, 0, 0, 1], 5), [([0, 4, 0, 0, 0, 1], 1)])
+        self.assertEqual(factor_mod([0, 0, 2], 3), (2, [([0, 1], 2)]))
+        with self.assertRaises(ValueError):
+            factor_mod([], 3)
+
+    def test_irreducibility(self):
+        self.assertTrue(is_irreducible_mod([1, 0, 1], 3))
+        self.assertFalse(is_irreducible_mod([1, 0, 1], 5))
+        self.assertTrue(is_irreducible_mod([1, 1, 0, 0, 1], 2))
+        self.assertFalse(is_irreducible_mod([1, 0, 0, 0, 1], 2))
+        self.assertFalse(is_irreducible_mod([3], 5))
+        # x^2 + x + 1 squared has no linear factor over F_2
+        self.assertFalse(is_irreducible_mod(mul_mod([1, 1, 1], [1, 1, 1], 2), 2))
+
+    def test_roots(self):
+        p = 10007
+        f = _expand(1, [([p - r, 1], 1) for r in (3, 17, 5000)] + [([1, 0, 1, 0, 1], 2)], p)
+        self.assertEqual(roots_mod(f, p), [3, 17, 5000])
+        self.assertEqual(roots_mod([1, 0, 1], 3), [])
+        self.assertEqual(roots_mod([0, 1, 1], 2), [0, 1])
+        self.assertEqual(roots_mod([4], 5), [])
+
+
+class TestFactorInteger(unittest.TestCase):
+
+    def test_random_products(self):
+        rng = random.Random(5)
+        for _ in range(30):
+            factors = []
+            for _ in range(rng.randrange(1, 5)):
+                g = [rng.randrange(-20, 21) for _ in range(rng.randrange(1, 6))] + [rng.randrange(1, 4)]
+                factors.append((g, rng.randrange(1, 3)))
+            f = _expand_integer(rng.choice([1, -3, 6]), factors)
+            c, found = factor_integer(f)
+            self.assertEqual(_expand_integer(c, found), f)
+            self.assertGreaterEqual(sum(e for _, e in found), sum(e for g, e in factors if len(g) > 1 and g[0]))
+            for g, _ in found:
+                self.assertGreater(g[-1], 0)
+                self.assertEqual(factor_integer(g), (1, [(g, 1)]))
+
+    def test_recombination(self):
+        linear = [([-k, 1], 1) for k in range(12, 0, -1)]
+        # twelve factors mod p: the lattice by default, one combination at a time as well
+        for threshold in (factorization.ZASSENHAUS_FACTORS, 12):
+            with mock.patch.object(factorization, "ZASSENHAUS_FACTORS", threshold):
+                self.assertEqual(factor_integer(_expand_integer(1, linear)), (1, linear))
+        with mock.patch.object(factorization, "ZASSENHAUS_FACTORS", 0):
+            self.assertEqual(factor_integer(SWINNERTON_DYER), (1, [(SWINNERTON_DYER, 1)]))
+            quartic = [1, 0, -10, 0, 1]
+            f = mul(mul(SWINNERTON_DYER, quartic), [-1, 0, 2])
+            self.assertEqual(factor_integer(f), (1, [([-1, 0, 2], 1), (quartic, 1), (SWINNERTON_DYER, 1)]))
+
+    def test_hensel_lift(self):
+        g = [-6, 0, 0, 0, 6]  # 6 (x^4 - 1)
+        p = 5
+        factors = [h for h, _ in factor_mod([c % p for c in g], p)[1]]
+        lifted, m = hensel_lift(g, factors, p, 10**6)
+        self.assertGreater(m, 10**6)
+        self.assertEqual(_expand(1, [(u, 1) for u in lifted], m), monic_mod([c % m for c in g], m))
+        self.assertEqual([[c % p for c in u] for u in lifted], factors)
+
+    def test_special_cases(self):
+        self.assertEqual(factor_integer([0, 0, -4, -4]), (-4, [([0, 1], 2), ([1, 1], 1)]))
+        self.assertEqual(factor_integer([-4]), (-4, []))
+        self.assertEqual(factor_integer([6, -5, 1]), (1, [([-3, 1], 1), ([-2, 1], 1)]))
+        with self.assertRaises(ValueError):
+            factor_integer([])
+
+
+class TestPolynomialFactor(unittest.TestCase):
+
+    def test_factor(self):
+        c, factors = (Polynomial("x^3 - x") * 0.5).factor()
+        self.assertEqual(c, Fraction(1, 2))
+        self.assertEqual(factors, [(Polynomial("x - 1"), 1), (Polynomial("x"), 1), (Polynomial("x + 1"), 1)])
+        c, factors = Polynomial("-2x^5 + 4x^4 - 2x^3").factor()
+        self.assertEqual((c, factors), (-2, [(Polynomial("x - 1"), 2), (Polynomial("x"), 3)]))
+        self.assertEqual(Polynomial("x^2 + 1", 3).factor(), Polynomial("x^2 + 1", 3).factor_mod_p())
+        self.assertEqual(Polynomial(6).factor(), (6, []))
+        with self.assertRaises(ValueError):
+            Polynomial(0).factor()
+        with self.assertRaises(ValueError):
+            Polynomial("x + y").factor()
+
+    def test_solve(self):
+        self.assertEqual(sorted(Polynomial("x^3 - x").solve()), [-1, 0, 1])
+        roots = Polynomial("x^4 - 2x^3 - 4x^2 + 10x - 5").solve()  # (x - 1)^2 (x^2 - 5)
+        self.assertEqual(roots[:2], [1, 1])
+        self.assertEqual(sorted(roots[2:]), [-(5**0.5), 5**0.5])
+
+
+class TestPolynomialFactorModP(unittest.TestCase):
+
+    def test_factor_mod_p(self):
+        lc, factors = Polynomial("2x^3 + 2", 3).factor_mod_p()
+        self.assertEqual(lc, 2)
+        self.assertEqual(factors, [(Polynomial("x + 1", 3), 3)])
+        lc, factors = Polynomial("x^4 - 1").factor_mod_p(13)
+        self.assertEqual([f for f, _ in factors], [Polynomial("x + %d" % a, 13) for a in (1, 5, 8, 12)])
+        with self.assertRaises(ValueError):
+            Polynomial("x^2 + 1").factor_mod_p()
+        with self.assertRaises(ValueError):
+            Polynomial("x^2 + y", 3).factor_mod_p()
+        with self.assertRaises(ValueError):
+            Polynomial("x^2 + 1", 3).factor_mod_p(5)
+
+    def test_solve(self):
+        self.assertEqual(Polynomial("x^2 - 1", 7).solve(), [1, 6])
+        self.assertEqual(Polynomial("x^3 - 2", 7).solve(), [])
+        self.assertEqual(Polynomial("3x + 1", 5).solve(), [3])
+
+
+if __name__ == "__main__":
+    unittest.main()
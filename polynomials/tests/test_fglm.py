@@ -0,0 +1,47 @@
+import unittest
+
+from polynomials.fglm import NotZeroDimensional, fglm, is_zero_dimensional, standard_monomials
+from polynomials.groebner import exact_system, reduced_groebner_basis
+from polynomials.ideal import Ideal
+from polynomials.polynomial import Polynomial
+
+
+class TestFGLM(unittest.TestCase):
+
+    def _convert(self, generators, char=0):
+        names, char, exact = exact_system([Polynomial(s, char) for s in generators])
+        grevlex = reduced_groebner_basis(exact, len(names), "grevlex", char)
+        lex = reduced_groebner_basis(exact, len(names), "lex", char)
+        return fglm(grevlex, len(names), "grevlex", "lex", char), lex
+
+    def test_matches_lex_buchberger(self):
+        systems = [
+            ["x^2 + yz - 2", "y^2 + xz - 3", "xy + z^2 - 5"],
+            ["x^3 + y^2 - z - 1", "y^3 + z^2 - x - 2", "z^3 + x^2 - y - 3"],
+            ["x^2 - y", "y^2 - 1"],
+            ["x^3 - 2xy", "x^2y - 2y^2 + x"],
+        ]
+        for generators in systems:
+            converted, lex = self._convert(generators)
+            self.assertEqual(converted, lex)
+        converted, lex = self._convert(["x^2 + y^2 - 1", "x^3 - y + 2"], 7)
+        self.assertEqual(converted, lex)
+
+    def test_standard_monomials(self):
+        self.assertEqual(standard_monomials([(2, 0), (1, 1), (0, 2)], 2), [(0, 0), (0, 1), (1, 0)])
+        self.assertEqual(standard_monomials([(0, 0)], 2), [])
+        self.assertFalse(is_zero_dimensional([(2, 0), (1, 1)], 2))
+        with self.assertRaises(NotZeroDimensional):
+            self._convert(["xy", "y"])
+
+    def test_solve_system_uses_lex_basis(self):
+        I = Ideal(Polynomial("x^2 + y^2 - 5"), Polynomial("xy - 2"))
+        self.assertEqual([str(g) for g in I.lex_basis()], ["0.5y^3 + x - 2.5y", "y^4 - 5.0y^2 + 4.0"])
+        solutions = I.solve_system_structured()
+        points = sorted((round(s["x"].real, 9), round(s["y"].real, 9)) for s in solutions)
+        self.assertEqual(points, [(-2, -1), (-1, -2), (1, 2), (2, 1)])
+        self.assertIsNone(Ideal(Polynomial("xy"), Polynomial("y")).solve_system_structured())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import itertools
+import unittest
+
+from polynomials.grid_solver import ModularEvaluator, grid_solutions
+from polynomials.groebner import to_exact
+from polynomials.ideal import Ideal
+from polynomials.polynomial import Polynomial
+
+
+class TestGridSolver(unittest.TestCase):
+
+    def test_evaluator(self):
+        import numpy as np
+
+        f = Polynomial("x^3 + 4xy^2 - 2", 7)
+        evaluate = ModularEvaluator(to_exact(f, ["x", "y"], 7), 7)
+        points = np.array(list(itertools.product(range(7), repeat=2)), dtype=np.int64)
+        expected = [(x**3 + 4 * x * y * y - 2) % 7 for x, y in points.tolist()]
+        self.assertEqual(evaluate(points).tolist(), expected)
+
+    def test_matches_brute_force(self):
+        p = 13
+        generators = [Polynomial("x^3 + yz - 2", p), Polynomial("xy - z^2 + 1", p)]
+        expected = [
+            {"x": x, "y": y, "z": z}
+            for x, y, z in itertools.product(range(p), repeat=3)
+            if (x**3 + y * z - 2) % p == 0 and (x * y - z * z + 1) % p == 0
+        ]
+        self.assertEqual(grid_solutions(generators, processes=1), expected)
+        # small chunks, in a process pool
+        self.assertEqual(grid_solutions(generators, chunk_size=100, processes=2), expected)
+
+    def test_solve_system(self):
+        ideal = Ideal(Polynomial("x^2 + y^2 - 1", 7), Polynomial("x - y", 7))
+        self.assertEqual(ideal.solve_system_structured(), [{"x": 2, "y": 2}, {"x": 5, "y": 5}])
+        self.assertEqual(ideal.solve_system_structured("rur"), [{"x": 2, "y": 2}, {"x": 5, "y": 5}])
+        self.assertEqual(ideal.solve_system(), "2 solutions: \n[x = 2, y = 2],\n[x = 5, y = 5]")
+        # x^2 = 3 has no solution in F_5
+        self.assertEqual(Ideal(Polynomial("x^2 + y^2 - 1", 5), Polynomial("x - y", 5)).solve_system_structured(), [])
+        # over F_p there are always finitely many points
+        self.assertEqual(len(Ideal(Polynomial("x - y", 3)).solve_system_structured()), 3)
+
+    def test_limits(self):
+        with self.assertRaises(ValueError):
+            grid_solutions([Polynomial("x - y")])
+        with self.assertRaises(ValueError):
+            grid_solutions([Polynomial("x - y", 101)], max_points=10**4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+from fractions import Fraction
+
+from polynomials.groebner import (
+    GroebnerState,
+    divide_in_turn,
+    exact_system,
+    groebner_basis,
+    normal_form,
+    reduced_groebner_basis,
+    to_exact,
+)
+from polynomials.ideal import Ideal
+from polynomials.polynomial import Polynomial
+
+
+class TestGroebner(unittest.TestCase):
+
+    def test_reduced_bases_per_order(self):
+        F = [Polynomial("x^2 + yz - 2"), Polynomial("y^2 + xz - 3"), Polynomial("xy + z^2 - 5")]
+        names, char, exact = exact_system(F)
+        lex = reduced_groebner_basis(exact, len(names), "lex", char)
+        # shape position: x and y are polynomials in z, z has degree 8
+        self.assertEqual([max(g, key=lambda m: m) for g in lex], [(1, 0, 0), (0, 1, 0), (0, 0, 8)])
+        self.assertEqual(lex[2][(0, 0, 0)], Fraction(361, 8))
+        grevlex = reduced_groebner_basis(exact, len(names), "grevlex", char)
+        self.assertEqual(len(grevlex), 6)
+        for f in exact:
+            self.assertEqual(normal_form(f, grevlex, len(names), "grevlex"), {})
+            self.assertEqual(normal_form(f, lex, len(names), "lex"), {})
+        with self.assertRaises(ValueError):
+            groebner_basis(F, order="revlex")
+
+    def test_exact_coefficients(self):
+        self.assertEqual(to_exact(Polynomial("x") * 0.1 + 1, ("x",)), {(1,): Fraction(1, 10), (0,): 1})
+        G = groebner_basis([Polynomial("3x - 1"), Polynomial("y^2 - x")], order="lex")
+        self.assertEqual(G, [Polynomial("x - 0.3333333333333333"), Polynomial("y^2 - 0.3333333333333333")])
+
+    def test_finite_field(self):
+        G = groebner_basis([Polynomial("x^2 - 2", 5), Polynomial("xy - 1", 5)], order="lex")
+        # 2^-1 = 3 and 1/2 * x = 3x in F_5
+        self.assertEqual(G, [Polynomial("x - 2y", 5), Polynomial("y^2 - 3", 5)])
+        self.assertEqual(G[0].field_characteristic, 5)
+
+    def test_divide_in_turn(self):
+        # 2x^2 + y leaves y on division by 3x, then 3x is divided by y; coefficients are kept
+        names, char, exact = exact_system([Polynomial("2x^2 + y"), Polynomial("3x")])
+        self.assertEqual(divide_in_turn(exact, len(names), "grlex", char), [{(1, 0): 3}, {(0, 1): 1}])
+        # 1 - 49 * (1 / 49) is 1.1e-16 in floats: with eps it counts as cancelled
+        terms = [{(1,): 49.0, (0,): 1.0}, {(1,): 1.0, (0,): 1 / 49}]
+        self.assertEqual(divide_in_turn(terms, 1, "grlex", 0, 1e-12), [{(1,): 1.0, (0,): 1 / 49}])
+        self.assertEqual(divide_in_turn(terms, 1, "grlex", 0), [{(0,): 1 - 49 * (1 / 49)}])
+
+    def test_ideal_groebner_basis_with_order(self):
+        I = Ideal(Polynomial("x^2 - y"), Polynomial("xy - 1"))
+        self.assertEqual(I.groebner_basis("lex"), [Polynomial("x - y^2"), Polynomial("y^3 - 1")])
+        self.assertEqual(
+            I.groebner_basis("grevlex"), [Polynomial("x^2 - y"), Polynomial("xy - 1"), Polynomial("y^2 - x")]
+        )
+        # the default is still the original implementation
+        self.assertEqual(I.groebner_basis(), Ideal(*I.polynomials)._buchberger())
+
+    def test_incremental_state(self):
+        names, char, exact = exact_system(
+            [Polynomial("x^2 + yz - 2"), Polynomial("y^2 + xz - 3"), Polynomial("xy + z^2 - 5")]
+        )
+        state = GroebnerState(len(names), "grevlex", char)
+        for f in exact:
+            state.add([f])
+            state.basis()
+        self.assertEqual(state.basis(), reduced_groebner_basis(exact, len(names), "grevlex", char))
+        # copies are independent
+        copy = state.copy()
+        copy.add([to_exact(Polynomial("x - 1"), names)])
+        self.assertEqual(state.basis(), reduced_groebner_basis(exact, len(names), "grevlex", char))
+        self.assertEqual(copy.basis(), [{(0, 0, 0): 1}])
+
+    def test_add_generators(self):
+        generators = ["x^2 + yz - 2", "y^2 + xz - 3", "xy + z^2 - 5", "w - x - y"]
+        I = Ideal(Polynomial(generators[0]))
+        for g in generators[1:]:
+            I.groebner_basis("grevlex")
+            I = I.add_generators(Polynomial(g))
+            # a new variable (w sorts first) is taken in
+            self.assertEqual(I._exact_basis("grevlex"), Ideal(*I.polynomials)._exact_basis("grevlex"))
+        self.assertEqual(len(I.polynomials), 4)
+        self.assertEqual(I.degree(), 8)
+        J = Ideal(Polynomial("x^2 - 2", 7))
+        J.groebner_basis("lex")
+        self.assertEqual(
+            J.add_generators(Polynomial("y^2 - x", 7)).groebner_basis("lex"),
+            Ideal(Polynomial("x^2 - 2", 7), Polynomial("y^2 - x", 7)).groebner_basis("lex"),
+        )
+
+    def test_stats(self):
+        I = Ideal(Polynomial("x^2 + yz - 2"), Polynomial("y^2 + xz - 3"), Polynomial("xy + z^2 - 5"))
+        basis, stats = I.groebner_basis("lex", stats=True)
+        self.assertEqual(basis, I.groebner_basis("lex"))
+        self.assertEqual(stats.basis_size, 3)
+        # every pair is either pruned by a criterion or processed
+        self.assertEqual(stats.pairs_created, stats.pruned_product + stats.pruned_chain + stats.pairs_processed)
+        self.assertLessEqual(stats.reductions_to_zero, stats.pairs_processed)
+        self.assertGreater(stats.peak_memory, 0)
+        self.assertGreaterEqual(stats.time_total, stats.time_spoly + stats.time_reduction)
+        basis, stats = I.groebner_basis(stats=True)
+        self.assertEqual(basis, Ideal(*I.polynomials)._buchberger())
+        self.assertEqual(stats.engine, "legacy")
+        self.assertEqual(set(stats.as_dict()), set(type(stats).__dataclass_fields__))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+
+from polynomials.groebner_cache import (
+    GroebnerCache,
+    configure_groebner_cache,
+    get_groebner_cache,
+    ideal_fingerprint,
+)
+from polynomials.ideal import Ideal
+from polynomials.polynomial import Polynomial
+from polynomials.primitives.polycalc_numbers import Integer
+
+
+class TestGroebnerCache(unittest.TestCase):
+
+    def setUp(self):
+        self._previous = get_groebner_cache()
+        self.cache = configure_groebner_cache(maxsize=8)
+
+    def tearDown(self):
+        configure_groebner_cache(self._previous.maxsize, self._previous.cache_dir)
+
+    def test_fingerprint_is_canonical(self):
+        f = Polynomial("x^2y - 1")
+        g = Polynomial("xy^2 - x")
+        key = ideal_fingerprint((f, g))
+        # same generators built differently
+        self.assertEqual(key, ideal_fingerprint((Polynomial("-1 + yx^2"), Polynomial("-x + xy^2"))))
+        h = Polynomial("x^2y")
+        h.terms = {m: Integer(1) for m in h.terms.keys()}
+        self.assertEqual(ideal_fingerprint((h,)), ideal_fingerprint((Polynomial("x^2y"),)))
+        # generator sequence, monomial order and characteristic all matter
+        self.assertNotEqual(key, ideal_fingerprint((g, f)))
+        self.assertNotEqual(key, ideal_fingerprint((f, g), order="lex"))
+        self.assertNotEqual(key, ideal_fingerprint((Polynomial("x^2y - 1", 3), Polynomial("xy^2 - x", 3))))
+
+    def test_hits_and_misses(self):
+        I = Ideal(Polynomial("x^2y - 1"), Polynomial("xy^2 - x"))
+        G = I.groebner_basis()
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+        J = Ideal(Polynomial("x^2y - 1"), Polynomial("xy^2 - x"))
+        self.assertEqual(J.groebner_basis(), G)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertTrue(I == J)
+        self.assertEqual(self.cache.info().hits, 3)
+        self.assertEqual(self.cache.info().currsize, 1)
+
+    def test_returned_bases_are_copies(self):
+        G = Ideal(Polynomial("x^2y - 1"), Polynomial("xy^2 - x")).groebner_basis()
+        expected = [g.copy() for g in G]
+        G[0].terms = {}
+        G.append(Polynomial("z"))
+        H = Ideal(Polynomial("x^2y - 1"), Polynomial("xy^2 - x")).groebner_basis()
+        self.assertEqual(H, expected)
+        H[1].terms = {}
+        self.assertEqual(Ideal(Polynomial("x^2y - 1"), Polynomial("xy^2 - x")).groebner_basis(), expected)
+        self.assertEqual(self.cache.hits, 2)
+
+    def test_lru_eviction(self):
+        cache = GroebnerCache(maxsize=2)
+        cache.put("a", [Polynomial("x")])
+        cache.put("b", [Polynomial("y")])
+        cache.get("a")
+        cache.put("c", [Polynomial("z")])
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.info().misses, 1)
+
+    def test_disabled_memory_store(self):
+        cache = GroebnerCache(maxsize=0)
+        self.assertEqual(cache.get_or_compute("a", lambda: [Polynomial("x")]), [Polynomial("x")])
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get("a"))
+
+    def test_disk_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            basis = [Polynomial("x^2 - 0.5y"), Polynomial("y^2 - 1", 5)]
+            GroebnerCache(maxsize=4, cache_dir=tmp).put("key", basis)
+            self.assertTrue(os.path.exists(os.path.join(tmp, "key.json")))
+            fresh = GroebnerCache(maxsize=4, cache_dir=tmp)
+            loaded = fresh.get("key")
+            self.assertEqual(loaded, basis)
+            self.assertEqual(loaded[1].field_characteristic, 5)
+            self.assertEqual(fresh.info(), (1, 0, 4, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from polynomials.groebner import exact_system, reduced_groebner_basis
+from polynomials.groebner_walk import groebner_walk, initial_form, interior_weight, next_weight
+from polynomials.ideal import Ideal
+from polynomials.orderings import order_matrix
+from polynomials.polynomial import Polynomial
+
+
+class TestGroebnerWalk(unittest.TestCase):
+
+    def _check(self, generators, start, target, char=0):
+        names, char, exact = exact_system([Polynomial(s, char) for s in generators])
+        basis = reduced_groebner_basis(exact, len(names), start, char)
+        walked = groebner_walk(basis, len(names), start, target, char)
+        self.assertEqual(walked, reduced_groebner_basis(exact, len(names), target, char))
+
+    def test_positive_dimensional(self):
+        # the twisted cubic and a surface: FGLM cannot convert these
+        for generators in [
+            ["xy - z^2", "x^2 - yz"],
+            ["x^2 + y^2 + z^2 - 1", "xyz - 1"],
+            ["x^3 - 2xy", "x^2y - 2y^2 + x"],
+        ]:
+            for start, target in [("grevlex", "lex"), ("lex", "grevlex"), ("grlex", "lex")]:
+                self._check(generators, start, target)
+        self._check(["xy - z^2", "x^2 - yz"], "grevlex", "lex", char=7)
+
+    def test_zero_dimensional(self):
+        self._check(["x^5 - y^2z", "xy - z^3 + 1", "y^4 - xz^2"], "grevlex", "lex")
+        self._check(["x^5 - y^2z", "xy - z^3 + 1", "y^4 - xz^2"], "lex", "grevlex", char=32003)
+
+    def test_weights(self):
+        g = {(2, 0): 1, (1, 1): -1, (0, 3): 2}
+        self.assertEqual(initial_form(g, (1, 1)), {(0, 3): 2})
+        self.assertEqual(initial_form(g, (3, 2)), {(2, 0): 1, (0, 3): 2})
+        # (1, 0) is on the boundary of the lex cone; an interior weight picks x^2 strictly
+        w = interior_weight([g], order_matrix("lex", 2))
+        self.assertGreater(2 * w[0], 3 * w[1])
+        # moving from grevlex's (1, 1) towards lex, y^3 and x^2 tie at (3, 2)
+        self.assertEqual(next_weight([g], order_matrix("grevlex", 2), (1, 1), (1, 0)), (3, 2))
+
+    def test_ideal_walk_basis(self):
+        I = Ideal(Polynomial("t^2 - x"), Polynomial("t^3 - y"))
+        # eliminating t gives the implicit equation of the curve
+        self.assertEqual(I.walk_basis("lex")[-1], Polynomial("x^3 - y^2"))
+        self.assertEqual(I.walk_basis("lex"), I.groebner_basis("lex"))
+
+
+if __name__ == "__main__":
+    unittest.main()
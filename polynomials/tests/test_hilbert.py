@@ -0,0 +1,64 @@
+import unittest
+from itertools import product
+from math import comb
+
+from polynomials.hilbert import hilbert_numerator, hilbert_series
+from polynomials.ideal import Ideal
+from polynomials.polynomial import Polynomial
+
+
+def _count_standard(monomials, nvars, degree):
+    """number of monomials of the given degree outside the monomial ideal, by brute force"""
+    return sum(
+        1
+        for e in product(range(degree + 1), repeat=nvars)
+        if sum(e) == degree and not any(all(a <= b for a, b in zip(g, e)) for g in monomials)
+    )
+
+
+class TestHilbertSeries(unittest.TestCase):
+
+    def test_numerator(self):
+        self.assertEqual(hilbert_numerator([(2, 0), (0, 2)]), [1, 0, -2, 0, 1])
+        self.assertEqual(hilbert_numerator([(1, 1)]), [1, 0, -1])
+        self.assertEqual(hilbert_numerator([(0, 0)]), [])
+
+    def test_matches_brute_force(self):
+        ideals = [
+            ([(2, 0, 0), (1, 1, 0), (0, 3, 0), (0, 0, 1)], 3),
+            ([(1, 2, 0), (0, 1, 3), (2, 0, 1)], 3),
+            ([(3, 1), (1, 3), (2, 2)], 2),
+            ([(1, 1, 1, 0), (0, 2, 0, 1), (2, 0, 0, 2), (0, 0, 3, 0)], 4),
+        ]
+        for monomials, nvars in ideals:
+            series = hilbert_series(monomials, nvars)
+            for degree in range(8):
+                expected = _count_standard(monomials, nvars, degree)
+                if series.dimension == 0:
+                    value = series.numerator[degree] if degree < len(series.numerator) else 0
+                else:
+                    value = sum(
+                        c * comb(degree - j + series.dimension - 1, series.dimension - 1)
+                        for j, c in enumerate(series.numerator)
+                        if j <= degree
+                    )
+                self.assertEqual(value, expected, (monomials, degree))
+
+    def test_dimension_and_degree(self):
+        self.assertEqual(hilbert_series([(2, 0, 0), (1, 1, 0), (0, 3, 0), (0, 0, 1)], 3)[1:], (0, 4))
+        self.assertEqual(hilbert_series([(1, 1)], 2)[1:], (1, 2))
+        self.assertEqual(hilbert_series([], 2)[1:], (2, 1))
+        self.assertEqual(hilbert_series([(0, 0)], 2)[1:], (-1, 0))
+
+    def test_ideal(self):
+        I = Ideal(Polynomial("x^2 + y^2 - 5"), Polynomial("xy - 2"))
+        self.assertEqual((I.dimension(), I.degree()), (0, 4))
+        self.assertEqual(Ideal(Polynomial("x^2 + y^2 + z^2 - 1")).dimension(), 2)
+        self.assertEqual(Ideal(Polynomial("x"), Polynomial("x + 1")).dimension(), -1)
+        # a double root counts twice
+        self.assertEqual(Ideal(Polynomial("x^2 - 2x + 1"), Polynomial("y - x")).degree(), 2)
+        self.assertEqual(Ideal(Polynomial("xy"), Polynomial("x^2")).solve_system(), "finite solutions don't exit")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import warnings
+from unittest import mock
+
+from polynomials import homotopy
+from polynomials.homotopy import PolynomialSystem, total_degree_start
+from polynomials.ideal import Ideal
+from polynomials.polynomial import Polynomial
+
+
+def _ideal(*generators):
+    return Ideal(*(Polynomial(g) for g in generators))
+
+
+def _close(a, b):
+    return all(abs(complex(a[v]) - complex(b[v])) < 1e-6 for v in a)
+
+
+class TestHomotopyContinuation(unittest.TestCase):
+
+    def test_start_system(self):
+        starts = total_degree_start([2, 3])
+        self.assertEqual(starts.shape, (6, 2))
+        self.assertTrue(all(abs(x**2 - 1) < 1e-12 and abs(y**3 - 1) < 1e-12 for x, y in starts))
+
+    def test_jacobian(self):
+        system = PolynomialSystem([Polynomial("x^2y + 3y"), Polynomial("x - y^3")], ["x", "y"])
+        self.assertEqual(system.degrees, [3, 3])
+        point = total_degree_start([1, 1]) * 2  # (2, 2)
+        self.assertAlmostEqual(system(point)[0, 0], 14)
+        self.assertEqual([[complex(v) for v in row] for row in system.jacobian(point)[0]], [[8, 7], [1, -12]])
+
+    def test_matches_exact_solutions(self):
+        for generators in [
+            ("x^2 + y^2 - 5", "xy - 2"),
+            ("x^3 - 2xy + y^2 - 1", "x + y - 3"),
+            ("x^2 + 1", "y^3 - x"),
+            ("x^2 - 2x + 1", "y - 2"),  # a double root is reported once
+            ("a + 2b + 2c + 2d - 1", "a^2 + 2b^2 + 2c^2 + 2d^2 - a", "2ab + 2bc + 2cd - b", "b^2 + 2ac + 2bd - c"),
+        ]:
+            ideal = _ideal(*generators)
+            numeric = ideal.solve_numeric()
+            exact = ideal.solve_system_structured("rur")
+            self.assertEqual(len(numeric), len(exact), generators)
+            for point in exact:
+                self.assertTrue(any(_close(point, found) for found in numeric), (generators, point))
+
+    def test_singular_solutions(self):
+        # the Jacobian vanishes at the origin: the paths stall before t = 1 and the endgame finishes them
+        for generators, count in [(("x^2", "y"), 1), (("x^3 - 2x", "y^2 - x"), 5), (("x^3", "y^2 - x"), 1)]:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                numeric = _ideal(*generators).solve_numeric()
+            self.assertEqual(len(numeric), count, generators)
+            self.assertTrue(any(abs(p["x"]) < 1e-6 and abs(p["y"]) < 1e-6 for p in numeric), generators)
+
+    def test_inconsistent_system(self):
+        # every path runs off to infinity, some of them on the step reaching t = 1
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertEqual(_ideal("x^2 - y", "x^2 - y + 1").solve_numeric(), [])
+
+    def test_lost_paths_are_reported(self):
+        with mock.patch.dict(homotopy._DEFAULTS, {"max_steps": 2}):
+            with self.assertWarns(RuntimeWarning) as caught:
+                self.assertEqual(_ideal("x^2 - 2", "y - 1").solve_numeric(), [])
+        self.assertIn("2 of 2 homotopy paths were lost", str(caught.warning))
+
+    def test_real_solutions_are_floats(self):
+        solutions = _ideal("x^2 - 2", "y^2 - 3").solve_numeric()
+        self.assertEqual(len(solutions), 4)
+        self.assertTrue(all(isinstance(x, float) for point in solutions for x in point.values()))
+        self.assertAlmostEqual(solutions[-1]["x"], 2**0.5)
+        self.assertAlmostEqual(solutions[-1]["y"], 3**0.5)
+
+    def test_process_pool(self):
+        ideal = _ideal("x^2 + y^2 - 5", "xy - 2")
+        pooled, serial = ideal.solve_numeric(batch_size=1, processes=2), ideal.solve_numeric()
+        self.assertEqual(len(pooled), len(serial))
+        self.assertTrue(all(_close(a, b) for a, b in zip(pooled, serial)))
+
+    def test_not_square(self):
+        with self.assertRaises(ValueError):
+            _ideal("x + y").solve_numeric()
+        with self.assertRaises(ValueError):
+            _ideal("x - 1", "y - 2", "x + y - 3").solve_numeric()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 
 from polynomials.ideal import Ideal
-from polynomials.polynomial import Polynomial
+from polynomials.polynomial import Polynomial, lcm
 
 
 class TestIdeal(unittest.TestCase):
@@ -21,8 +21,38 @@ class TestIdeal(unittest.TestCase):
     def test_s_polynomial(self):
         f = Polynomial("x^3y^2 -x^2y^3 + x")
         g = Polynomial("3x^4y + y^2")
-        # The result should be -3x^3y^3 + 3x^2 - y^3 (scaled by 3 from the expected result)
-        self.assertEqual(Ideal.s_polynomial(f, g), Polynomial("-3x^3y^3 + 3x^2 - y^3"))
+        # x * f - (y / 3) * g, the lcm x^4y^2 taken with coefficient 1
+        self.assertEqual(Ideal.s_polynomial(f, g), Polynomial("-x^3y^3 + x^2 - 0.3333333333333333y^3"))
+        # over F_5 the scales are the inverses 2^-1 = 3 and 3^-1 = 2
+        s = Ideal.s_polynomial(Polynomial("2x^2 + y", 5), Polynomial("3xy + 1", 5))
+        self.assertEqual(s, Polynomial("3y^2 + 3x", 5))
+        self.assertEqual(s.field_characteristic, 5)
+
+    def test_s_polynomial_non_unit_leading_coefficient(self):
+        # 49 * (1 / 49) is not 1 in floating point: the lcm term must not survive as a residue
+        f, g = Polynomial("49x^2 + 1"), Polynomial("xy + 1")
+        s = Ideal.s_polynomial(f, g)
+        self.assertEqual(s, Polynomial("-x + 0.02040816326530612y"))
+        self.assertEqual(s.degree(), 1)
+        # the legacy basis keeps its coefficients: compare it made monic
+        G = Ideal(f, g).groebner_basis()
+        monic = [p * (1 / p.leading_term()[1]) for p in G]
+        self.assertEqual(monic, [Polynomial("x - 0.02040816326530612y"), Polynomial("y^2 + 49")])
+
+    def test_s_polynomial_matches_polynomial_arithmetic(self):
+        pairs = [
+            ("2x^2y - 3z", "4xz^2 - y + 1"),
+            ("0.5 + 3x^2", "6xy - 7"),
+            ("x^3 - 2xy", "y^2 - 1"),
+            ("5", "x - 2y"),
+            ("12xy^2 + z", "18x^2y - 1"),
+        ]
+        for a, b in pairs:
+            f, g = Polynomial(a), Polynomial(b)
+            # S(f, g) is the S-polynomial of the monic f and g
+            u, v = f * (1 / f.leading_term()[1]), g * (1 / g.leading_term()[1])
+            expected = (lcm(u.LT(), v.LT()) / u.LT()) * u - (lcm(u.LT(), v.LT()) / v.LT()) * v
+            self.assertEqual(Ideal.s_polynomial(f, g), expected)
 
     def test_groebner_basis(self):
         f = Polynomial("x^2y - 1")
@@ -49,6 +79,16 @@ class TestIdeal(unittest.TestCase):
         ]
         self.assertEqual(Ideal.reduce(G), res)
 
+    def test_reduce_without_divisions(self):
+        # no leading term divides another element's terms: elements come back aligned, in reverse
+        f = Polynomial("x^2 + y")
+        g = Polynomial("y^3z + 1")
+        res = Ideal.reduce([f, g])
+        self.assertEqual(res, [g, f])
+        self.assertEqual([p.vars for p in res], [("x", "y", "z"), ("x", "y", "z")])
+        # duplicates reduce to zero against each other
+        self.assertEqual(Ideal.reduce([f, f.copy(), g]), [g, f])
+
     def test___eq__(self):
         f = Polynomial("x^2y - 1")
         g = Polynomial("xy^2 - x")
@@ -62,6 +102,13 @@ class TestIdeal(unittest.TestCase):
         self.assertTrue(I == I)
         self.assertTrue(I == J)
 
+    def test_normal_form_and_contains(self):
+        I = Ideal(Polynomial("x^2y - 1"), Polynomial("xy^2 - x"))
+        self.assertEqual(I.normal_form(Polynomial("x^3y^2 + xy + 7")), Polynomial("2xy + 7"))
+        self.assertTrue(I.contains(Polynomial("x^2y - 1") * Polynomial("x + y^3")))
+        self.assertFalse(I.contains(Polynomial("xy")))
+        self.assertEqual(I.normal_forms([Polynomial("x^2"), Polynomial("y^3")]), [Polynomial("y"), Polynomial("y")])
+
     def test_solvability_criteria(self):
         f1 = Polynomial("x")
         f2 = Polynomial("y")
@@ -0,0 +1,39 @@
+import itertools
+import unittest
+
+from polynomials.grid_solver import grid_solutions
+from polynomials.ideal import Ideal
+from polynomials.modular_solver import modular_solutions
+from polynomials.polynomial import Polynomial
+
+
+class TestModularSolver(unittest.TestCase):
+
+    def test_matches_grid(self):
+        # grid_points=0 forces the lex basis and root finding
+        for p in (7, 13):
+            generators = [Polynomial("x^3 + yz - 2", p), Polynomial("xy - z^2 + 1", p), Polynomial("x + y + z", p)]
+            expected = grid_solutions(generators, processes=1)
+            self.assertEqual(modular_solutions(generators, grid_points=0), expected)
+        generators = [Polynomial("x^2 + y^2 - 1", 5), Polynomial("x - y", 5)]
+        self.assertEqual(modular_solutions(generators, grid_points=0), [])
+
+    def test_positive_dimension(self):
+        # every x, and y from the line: all of F_3 is tried for the free variable
+        expected = [{"x": x, "y": y} for x, y in itertools.product(range(3), repeat=2) if (x - y) % 3 == 0]
+        self.assertEqual(modular_solutions([Polynomial("x - y", 3)], grid_points=0), expected)
+        with self.assertRaises(ValueError):
+            modular_solutions([Polynomial("x - y", 101)], grid_points=0, max_points=50)
+
+    def test_large_prime(self):
+        # a grid of 10^8 points
+        p = 10007
+        ideal = Ideal(Polynomial("x^3 + y^2 - 2", p), Polynomial("xy - y^2 + 1", p))
+        solutions = ideal.solve_system_structured()
+        self.assertEqual(solutions, [{"x": 6497, "y": 1234}])
+        with self.assertRaises(ValueError):
+            modular_solutions([Polynomial("x - y")])
+
+
+if __name__ == "__main__":
+    unittest.main()
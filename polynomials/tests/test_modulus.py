@@ -0,0 +1,61 @@
+import random
+import unittest
+
+from polynomials.modulus import Modulus
+from polynomials.polynomial import Polynomial, powmod
+from polynomials.univariate import divmod_mod, from_dense, mul_mod
+
+
+class TestModulus(unittest.TestCase):
+
+    def test_polynomials(self):
+        h = Polynomial("x^3 + 2x + 1", 5)
+        modulus = Modulus(h)
+        a, b = Polynomial("x^2 + 3", 5), Polynomial("4x^2 + x", 5)
+        self.assertEqual(modulus.mulmod(a, b), a * b % h)
+        self.assertEqual(modulus.sqrmod(a), a * a % h)
+        self.assertEqual(modulus.reduce(a * b * b), a * b * b % h)
+        self.assertEqual(modulus.powmod(a, 100), powmod(a, 100, h))
+        self.assertEqual(modulus.mulmod(modulus.powmod(a, -1), a), 1)
+        self.assertEqual(modulus.powmod(a, 0), 1)
+
+    def test_newton_reductions(self):
+        # degree 100: reductions by the precomputed inverse, extended for long inputs
+        rng = random.Random(1)
+        p = 10007
+        h = [rng.randrange(p) for _ in range(100)] + [rng.randrange(1, p)]
+        modulus = Modulus(from_dense(h, "x", p))
+        for length in (50, 150, 201, 1000):
+            a = [rng.randrange(p) for _ in range(length - 1)] + [1]
+            self.assertEqual(modulus.reduce_dense(a), divmod_mod(a, h, p)[1])
+        a = modulus.reduce_dense([rng.randrange(p) for _ in range(300)])
+        b = modulus.reduce_dense([rng.randrange(p) for _ in range(300)])
+        self.assertEqual(modulus.mulmod_dense(a, b), divmod_mod(mul_mod(a, b, p), h, p)[1])
+        expected = [1]
+        for _ in range(37):
+            expected = divmod_mod(mul_mod(expected, a, p), h, p)[1]
+        self.assertEqual(modulus.powmod_dense(a, 37), expected)
+
+    def test_frobenius(self):
+        rng = random.Random(2)
+        for p, n in ((3, 5), (10007, 40)):
+            h = [rng.randrange(p) for _ in range(n)] + [1]
+            modulus = Modulus(from_dense(h, "x", p))
+            a = [rng.randrange(p) for _ in range(2 * n)]
+            self.assertEqual(modulus.frobenius_dense(a), modulus.powmod_dense(a, p))
+            self.assertEqual(modulus.frobenius_dense([]), [])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            Modulus(Polynomial("x^2 + 1"))
+        with self.assertRaises(ValueError):
+            Modulus(Polynomial("x^2 + y", 3))
+        with self.assertRaises(ZeroDivisionError):
+            Modulus(Polynomial(0, 3))
+        with self.assertRaises(ValueError):
+            Modulus(Polynomial("x^2 - 1", 3)).powmod(Polynomial("x + 1", 3), -1)
+        self.assertEqual(Modulus(Polynomial(2, 3)).powmod(Polynomial("x", 3), 5), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import random
+import unittest
+from unittest import mock
+
+import polynomials.polynomial as polynomial_module
+from polynomials.ideal import Ideal
+from polynomials.monomial_index import MonomialIndex, divmask
+from polynomials.polynomial import Polynomial, division_algorithm
+
+
+def divides(a, b):
+    return all(x <= y for x, y in zip(a, b))
+
+
+class TestMonomialIndex(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.monomials = [tuple(rng.randint(0, 4) for _ in range(3)) for _ in range(60)]
+        self.queries = [tuple(rng.randint(0, 6) for _ in range(3)) for _ in range(200)]
+
+    def test_divmask_is_necessary_for_divisibility(self):
+        for a in self.monomials:
+            for b in self.queries:
+                if divides(a, b):
+                    self.assertEqual(divmask(a) & ~divmask(b), 0)
+
+    def test_queries_match_linear_scan(self):
+        index = MonomialIndex(3, self.monomials)
+        self.assertEqual(len(index), len(self.monomials))
+        for q in self.queries:
+            expected = [k for k, m in enumerate(self.monomials) if divides(m, q)]
+            self.assertEqual(index.divisors(q), expected)
+            self.assertEqual(index.find_divisor(q), expected[0] if expected else None)
+            self.assertEqual(index.multiples(q), [k for k, m in enumerate(self.monomials) if divides(q, m)])
+
+    def test_remove(self):
+        index = MonomialIndex(2, [(1, 0), (0, 1), (1, 1), (1, 0)])
+        self.assertEqual(index.find_divisor((2, 2)), 0)
+        index.remove(0)
+        self.assertEqual(index.find_divisor((2, 2)), 1)
+        self.assertEqual(index.divisors((1, 0)), [3])
+        index.remove(3)
+        self.assertIsNone(index.find_divisor((3, 0)))
+        self.assertEqual(index.multiples((0, 0)), [1, 2])
+        self.assertEqual(index.add((0, 0)), 3)
+        self.assertEqual(index.find_divisor((5, 0)), 3)
+        with self.assertRaises(KeyError):
+            index.add((1, 1), 2)
+
+    def test_division_algorithm_with_index(self):
+        G = [
+            Polynomial(s)
+            for s in ["x^3 - y", "xy^2 - z", "y^3 - x", "z^2 - 1", "xz - y", "yz - 2", "x^2y - 1", "y - 3"]
+        ]
+        for s in ["x^4y^3z + 2xy", "x^3y^3 - z^2 + 5", "y^5z^3"]:
+            p = Polynomial(s)
+            with mock.patch.object(polynomial_module, "_INDEX_MIN_DIVISORS", len(G) + 1):
+                scanned = division_algorithm(p, *G)
+            indexed = division_algorithm(p, *G)
+            self.assertEqual(indexed, scanned)
+
+    def test_minimize_matches_pairwise_division(self):
+        G = [Polynomial(s) for s in ["x^2 - y", "x^3 + 1", "y^2 - 1", "xy^3 - x", "y - z"]]
+        legacy = list(G)
+        extra = []
+        for p in legacy:
+            for term in p.terms():
+                for q in legacy:
+                    if p != q and term % q.LT() == 0:
+                        extra.append(p)
+        for p in extra:
+            if p in legacy:
+                legacy.remove(p)
+        self.assertEqual(Ideal.minimize(G), legacy)
+
+
+if __name__ == "__main__":
+    unittest.main()
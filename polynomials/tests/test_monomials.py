@@ -0,0 +1,39 @@
+import unittest
+
+from polynomials.monomials import coprime, divides, gcd, lcm, product, quotient, spoly
+
+
+class TestMonomials(unittest.TestCase):
+
+    def test_exponent_arithmetic(self):
+        a, b = (3, 0, 1), (1, 2, 1)
+        self.assertEqual(lcm(a, b), (3, 2, 1))
+        self.assertEqual(gcd(a, b), (1, 0, 1))
+        self.assertEqual(product(a, b), (4, 2, 2))
+        self.assertEqual(quotient(lcm(a, b), a), (0, 2, 0))
+        self.assertTrue(divides(gcd(a, b), a))
+        self.assertFalse(divides(a, b))
+        self.assertFalse(coprime(a, b))
+        self.assertTrue(coprime((2, 0, 0), (0, 1, 3)))
+        self.assertEqual(product((2, 0), (0, 1)), lcm((2, 0), (0, 1)))
+
+    def test_spoly(self):
+        # f = x^2 + y, g = 2xy - 1: S = y * f - (x / 2) * g = y^2 + x/2
+        f = {(2, 0): 1, (0, 1): 1}
+        g = {(1, 1): 2, (0, 0): -1}
+        m = lcm((2, 0), (1, 1))
+        s = spoly(f, quotient(m, (2, 0)), 1, g, quotient(m, (1, 1)), 0.5, m)
+        self.assertEqual(s, {(0, 2): 1, (1, 0): 0.5})
+        # over F_5 the leading terms cancel and the rest is reduced
+        s = spoly({(1,): 1, (0,): 4}, (1,), 1, {(2,): 1, (0,): 3}, (0,), 1, (2,), 5)
+        self.assertEqual(s, {(1,): 4, (0,): 2})
+        # with floats 49 * (1 / 49) is not 1: the lcm term is left out, not subtracted to a residue
+        f = {(2, 0): 49.0, (0, 0): 1.0}
+        g = {(1, 1): 1.0, (0, 0): 1.0}
+        m = lcm((2, 0), (1, 1))
+        s = spoly(f, quotient(m, (2, 0)), 1 / 49.0, g, quotient(m, (1, 1)), 1.0, m)
+        self.assertEqual(s, {(0, 1): 1 / 49.0, (1, 0): -1.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import random
+import unittest
+
+from polynomials.multivariate_gcd import exact_divide, gcd_integer, gcd_mod_p
+from polynomials.polynomial import Polynomial, gcd, lcm
+
+
+def _random(rng, nvars, terms, degree, coeffs):
+    out = {}
+    for _ in range(terms):
+        exps = [0] * nvars
+        for _ in range(rng.randint(0, degree)):
+            exps[rng.randrange(nvars)] += 1
+        out[tuple(exps)] = rng.randint(-coeffs, coeffs) or 1
+    return out
+
+
+def _multiply(a, b, p=0):
+    out = {}
+    for m, c in a.items():
+        for n, d in b.items():
+            k = tuple(x + y for x, y in zip(m, n))
+            out[k] = out.get(k, 0) + c * d
+    return {m: c % p if p else c for m, c in out.items() if (c % p if p else c)}
+
+
+class TestMultivariateGcd(unittest.TestCase):
+
+    def test_polynomials(self):
+        self.assertEqual(gcd(Polynomial("x^2y - y"), Polynomial("xy + y")), Polynomial("xy + y"))
+        self.assertEqual(gcd(Polynomial("x^2 - y^2"), Polynomial("x^2 + 2xy + y^2")), Polynomial("x + y"))
+        # integer inputs keep the gcd of their contents
+        self.assertEqual(gcd(Polynomial("6x^2y - 6y"), Polynomial("4xy + 4y")), Polynomial("2xy + 2y"))
+        self.assertEqual(gcd(Polynomial("x^2 - y^2") * 0.5, Polynomial("x + y")), Polynomial("x + y"))
+        self.assertEqual(gcd(Polynomial("x + y + 1"), Polynomial("x - y")), Polynomial("1"))
+        self.assertEqual(gcd(Polynomial("x^2 + y^2 + 1", 2), Polynomial("x + y + 1", 2)), Polynomial("x + y + 1"))
+        self.assertEqual(lcm(Polynomial("x^2 - y^2"), Polynomial("x + y")), Polynomial("x^2 - y^2"))
+
+    def test_integer_gcd(self):
+        rng = random.Random(1)
+        for nvars in (3, 4, 5):
+            g = _random(rng, nvars, 8, 4, 50)
+            a = _multiply(g, _random(rng, nvars, 8, 4, 50))
+            b = _multiply(g, _random(rng, nvars, 8, 4, 50))
+            h = gcd_integer(a, b, nvars)
+            self.assertIsNotNone(exact_divide(a, h))
+            self.assertIsNotNone(exact_divide(b, h))
+            # g divides the gcd, and the cofactors are coprime
+            self.assertIsNotNone(exact_divide(h, g))
+            cofactors = exact_divide(a, h), exact_divide(b, h)
+            self.assertEqual(gcd_integer(*cofactors, nvars), {(0,) * nvars: 1})
+
+    def test_small_fields(self):
+        rng = random.Random(2)
+        for p in (101, 1009):
+            g = {m: c % p for m, c in _random(rng, 3, 4, 3, p).items() if c % p}
+            a = _multiply(g, _random(rng, 3, 4, 3, p), p)
+            b = _multiply(g, _random(rng, 3, 4, 3, p), p)
+            h = gcd_mod_p(a, b, 3, p)
+            self.assertEqual(h[max(h)], 1)
+            self.assertIsNotNone(exact_divide(a, h, p))
+            self.assertIsNotNone(exact_divide(h, g, p))
+        # xy^2 + x + y is quadratic in y: F_2 has too few points to interpolate it,
+        # the gcd comes from the lcm instead
+        g = {(1, 2): 1, (1, 0): 1, (0, 1): 1}
+        a, b = _multiply(g, {(1, 0): 1, (0, 0): 1}, 2), _multiply(g, {(1, 0): 1, (0, 1): 1}, 2)
+        self.assertIsNone(gcd_mod_p(a, b, 2, 2))
+        a = Polynomial("x^2y^2 + xy^2 + x^2 + xy + x + y", 2)
+        b = Polynomial("x^2y^2 + x^2 + xy^3 + y^2", 2)
+        self.assertEqual(gcd(a, b), Polynomial("xy^2 + x + y"))
+
+    def test_exact_divide(self):
+        a = _multiply({(1, 0): 2, (0, 1): -3}, {(2, 1): 1, (0, 0): 5})
+        self.assertEqual(exact_divide(a, {(1, 0): 2, (0, 1): -3}), {(2, 1): 1, (0, 0): 5})
+        self.assertIsNone(exact_divide(a, {(1, 0): 1, (0, 1): 1}))
+        self.assertIsNone(exact_divide({(1, 0): 3}, {(1, 0): 2}))  # not over Z
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from polynomials.polynomial import Polynomial, division_algorithm
+from polynomials.reducer import Reducer, from_sparse, to_sparse
+
+
+class TestReducer(unittest.TestCase):
+
+    def test_sparse_round_trip(self):
+        p = Polynomial("3x^2y + 2z - 1")
+        terms = to_sparse(p, ("x", "y", "z"))
+        self.assertEqual(terms, {(2, 1, 0): 3.0, (0, 0, 1): 2.0, (0, 0, 0): -1.0})
+        self.assertEqual(from_sparse(terms, ("x", "y", "z")), p)
+        # over F_p coefficients become field elements, 0.5 is the inverse of 2
+        self.assertEqual(to_sparse(Polynomial("7x + 0.5"), ("x",), 5), {(1,): 2, (0,): 3})
+
+    def test_matches_division_algorithm_on_groebner_basis(self):
+        G = [Polynomial("x^2 - y"), Polynomial("y^2 - 1")]
+        R = Reducer(G)
+        for s in ["x^3y^2 + xy + 7", "x^5y^7 - 3xy + z", "x^2y - 1", "2"]:
+            p = Polynomial(s)
+            self.assertEqual(R.reduce(p), division_algorithm(p, *G)[1])
+
+    def test_reduce_many_and_is_zero(self):
+        R = Reducer([Polynomial("x - 1"), Polynomial("y + 2")])
+        res = R.reduce_many([Polynomial("xy"), Polynomial("x^2 + y^2"), Polynomial("xz")])
+        self.assertEqual(res, [Polynomial("-2"), Polynomial("5"), Polynomial("z")])
+        self.assertTrue(R.is_zero(Polynomial("xy + 2")))
+        self.assertFalse(R.is_zero(Polynomial("xy")))
+        self.assertEqual(len(R), 2)
+
+    def test_finite_field(self):
+        # 2x - 1 over F_5 has leading coefficient inverse 3, so x reduces to 3
+        R = Reducer([Polynomial("2x - 1", 5)])
+        self.assertEqual(R.reduce(Polynomial("x^2 + 1", 5)), Polynomial("0", 5))
+        self.assertEqual(R.reduce(Polynomial("x", 5)), Polynomial("3", 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
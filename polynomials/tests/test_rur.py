@@ -0,0 +1,83 @@
+import unittest
+from fractions import Fraction
+
+from polynomials.fglm import NotZeroDimensional
+from polynomials.ideal import Ideal
+from polynomials.polynomial import Polynomial
+from polynomials.rur import rur_solutions
+
+
+def _ideal(*generators):
+    return Ideal(*(Polynomial(g) for g in generators))
+
+
+def _residual(generators, point):
+    worst = 0.0
+    for g in generators:
+        value = 0
+        for m, c in Polynomial(g).terms.items():
+            term = complex(c)
+            for v, e in zip(m.vars, m.exps):
+                term *= complex(point[v]) ** e
+            value += term
+        worst = max(worst, abs(value))
+    return worst
+
+
+class TestRationalUnivariateRepresentation(unittest.TestCase):
+
+    def test_representation(self):
+        rur = _ideal("x^2 + y^2 - 5", "xy - 2").rational_univariate_representation()
+        self.assertEqual(rur.variables, ("x", "y"))
+        self.assertEqual(len(rur.polynomial), 5)  # four solutions
+        self.assertEqual(rur.polynomial[-1], 1)
+        points = sorted((p["x"], p["y"]) for p in rur_solutions(rur))
+        self.assertEqual(points, [(-2, -1), (-1, -2), (1, 2), (2, 1)])
+        self.assertTrue(all(isinstance(x, Fraction) for point in points for x in point))
+
+    def test_multiple_roots(self):
+        # a double solution appears once, f stays squarefree
+        rur = _ideal("x^2 - 2x + 1", "y - x").rational_univariate_representation()
+        self.assertEqual(len(rur.polynomial), 2)
+        self.assertEqual(rur_solutions(rur), [{"x": 1, "y": 1}])
+
+    def test_irrational_roots(self):
+        rur = _ideal("x^2 - 2", "y - x^3").rational_univariate_representation()
+        points = sorted((p["x"], p["y"]) for p in rur_solutions(rur))
+        self.assertTrue(all(isinstance(x, float) for point in points for x in point))
+        for (x, y), r in zip(points, (-(2**0.5), 2**0.5)):
+            self.assertAlmostEqual(x, r)
+            self.assertAlmostEqual(y, 2 * r)
+        # x^2 + 1 has no real root: the points are complex
+        rur = _ideal("x^2 + 1", "y - 2x").rational_univariate_representation()
+        points = sorted(((p["x"], p["y"]) for p in rur_solutions(rur)), key=lambda point: point[0].imag)
+        self.assertTrue(all(isinstance(x, complex) for point in points for x in point))
+        self.assertLess(max(abs(points[0][0] + 1j), abs(points[0][1] + 2j), abs(points[1][1] - 2j)), 1e-9)
+
+    def test_solve_system(self):
+        systems = [
+            ["x^2 + yz - 2", "y^2 + xz - 3", "xy + z^2 - 5"],
+            ["x^2 - 1", "y^2 - 4", "z^2 - 2"],
+            ["x^2 - 3", "y^3 - 2"],
+        ]
+        for generators in systems:
+            I = _ideal(*generators)
+            solutions = I.solve_system_structured("rur")
+            self.assertEqual(len(solutions), I.degree())
+            for point in solutions:
+                self.assertLess(_residual(generators, point), 1e-9)
+            lex = I.solve_system_structured()
+            for a in solutions:
+                self.assertTrue(any(all(abs(complex(a[v]) - complex(b[v])) < 1e-6 for v in a) for b in lex))
+
+    def test_degenerate_systems(self):
+        self.assertEqual(_ideal("x", "x + 1").solve_system_structured("rur"), [])
+        self.assertIsNone(_ideal("xy", "y").solve_system_structured("rur"))
+        with self.assertRaises(NotZeroDimensional):
+            _ideal("xy", "y").rational_univariate_representation()
+        with self.assertRaises(ValueError):
+            _ideal("x - 1").solve_system_structured("newton")
+
+
+if __name__ == "__main__":
+    unittest.main()
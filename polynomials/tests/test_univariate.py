@@ -0,0 +1,238 @@
+import random
+import unittest
+from fractions import Fraction
+from unittest import mock
+
+from polynomials import univariate
+from polynomials.polynomial import NonFactor, Polynomial, gcd, gcd_singlevariate, invmod, powmod, xgcd
+from polynomials.univariate import (
+    add_mod,
+    divmod_mod,
+    exact_quotient,
+    fast_divmod,
+    fast_divmod_mod,
+    from_dense,
+    gcd_integer,
+    gcd_mod,
+    half_gcd,
+    inverse_series,
+    inverse_series_mod,
+    invmod_mod,
+    modular_gcd,
+    mul,
+    mul_mod,
+    powmod_mod,
+    pseudo_remainder,
+    subresultant_gcd,
+    xgcd_mod,
+    xgcd_rational,
+)
+
+
+def _random(rng, degree, bound):
+    a = [rng.randint(-bound, bound) for _ in range(degree + 1)]
+    a[-1] = a[-1] or 1
+    return a
+
+
+class TestUnivariateGcd(unittest.TestCase):
+
+    def test_pseudo_remainder(self):
+        # 4(x^3 + x + 1) = 2x(2x^2 + 1) + 2x + 4
+        self.assertEqual(pseudo_remainder([1, 1, 0, 1], [1, 0, 2]), [4, 2])
+        self.assertEqual(exact_quotient(mul([1, 2], [-3, 0, 5]), [1, 2]), [-3, 0, 5])
+        self.assertIsNone(exact_quotient([1, 0, 1], [1, 1]))
+        self.assertIsNone(exact_quotient([1, 3], [0, 2]))
+
+    def test_algorithms_agree(self):
+        rng = random.Random(1)
+        for bound in (10, 2**80):
+            for _ in range(20):
+                g = _random(rng, rng.randint(0, 6), bound)
+                a = mul(g, _random(rng, rng.randint(0, 6), bound))
+                b = mul(g, _random(rng, rng.randint(0, 6), bound))
+                expected = subresultant_gcd(a, b)
+                self.assertEqual(modular_gcd(a, b), expected)
+                self.assertEqual(gcd_integer(a, b), expected)
+                self.assertIsNotNone(exact_quotient(expected, g if g[-1] > 0 else [-c for c in g]))
+        # contents: gcd(6x + 6, 4x^2 - 4) = 2x + 2
+        self.assertEqual(subresultant_gcd([6, 6], [-4, 0, 4]), [2, 2])
+        self.assertEqual(modular_gcd([6, 6], [-4, 0, 4]), [2, 2])
+        self.assertEqual(subresultant_gcd([], [3, -6]), [-3, 6])
+
+    def test_polynomials(self):
+        # floating point Euclid drifted on repeated factors; the exact gcd does not
+        f = Polynomial("x - 1") ** 6 * Polynomial("x + 3")
+        g = Polynomial("x - 1") ** 4 * Polynomial("x - 7") ** 2
+        self.assertEqual(gcd(f, g), Polynomial("x - 1") ** 4)
+        self.assertEqual(
+            gcd_singlevariate(Polynomial("x^2 - 1") * 0.5, Polynomial("x^2 + 2x + 1")), Polynomial("x + 1")
+        )
+        self.assertEqual(gcd_singlevariate(Polynomial("x^2 - 1", 5), Polynomial("2x - 2", 5)), Polynomial("x - 1", 5))
+        # degree 60 with a common factor of six-digit coefficients, through the modular algorithm
+        rng = random.Random(2)
+        common = Polynomial("x + 1") ** 20
+        a = common * Polynomial("x^40 + %dx^3 + 1" % rng.randint(2, 9))
+        b = common * Polynomial("x^40 - %dx + 5" % rng.randint(2, 9))
+        self.assertEqual(gcd(a, b), common)
+
+
+class TestHalfGcd(unittest.TestCase):
+
+    def test_kronecker_product(self):
+        rng = random.Random(3)
+        for p in (2, 7, 2**31 - 1, 2**61 - 1):
+            a = [rng.randrange(p) for _ in range(40)] + [1]
+            b = [rng.randrange(p) for _ in range(70)] + [1]
+            self.assertEqual(mul_mod(a, b, p), [c % p for c in mul(a, b)])
+            self.assertEqual(mul_mod(a, a, p), [c % p for c in mul(a, a)])
+
+    def test_half_gcd(self):
+        # M (a, b) are consecutive remainders straddling half the degree of a
+        rng = random.Random(4)
+        p = 10007
+        a = [rng.randrange(p) for _ in range(300)] + [1]
+        b = [rng.randrange(p) for _ in range(280)] + [1]
+        m = half_gcd(a, b, p)
+        c = add_mod(mul_mod(m[0], a, p), mul_mod(m[1], b, p), p)
+        d = add_mod(mul_mod(m[2], a, p), mul_mod(m[3], b, p), p)
+        self.assertGreaterEqual(len(c) - 1, 150)
+        self.assertLess(len(d) - 1, 150)
+        while len(b) > len(c):
+            a, b = b, divmod_mod(a, b, p)[1]
+        self.assertEqual((b, divmod_mod(a, b, p)[1]), (c, d))
+
+    def test_gcd_and_cofactors(self):
+        rng = random.Random(5)
+        for p in (2, 3, 101, 2**31 - 1):
+            for _ in range(10):
+                g = [rng.randrange(p) for _ in range(rng.randint(0, 100))] + [1]
+                a = mul_mod(g, [rng.randrange(p) for _ in range(rng.randint(0, 200))] + [1], p)
+                b = mul_mod(g, [rng.randrange(p) for _ in range(rng.randint(0, 200))] + [1], p)
+                with mock.patch.object(univariate, "HALF_GCD_DEGREE", 10**9):
+                    expected = gcd_mod(a, b, p)
+                self.assertEqual(gcd_mod(a, b, p), expected)
+                h, s, t = xgcd_mod(a, b, p)
+                self.assertEqual(h, expected)
+                self.assertEqual(add_mod(mul_mod(s, a, p), mul_mod(t, b, p), p), h)
+                self.assertLess(len(s), max(len(b) - len(h) + 1, 1))
+                self.assertLess(len(t), max(len(a) - len(h) + 1, 1))
+        self.assertEqual(xgcd_mod([3, 1], [], 5), ([3, 1], [1], []))
+        self.assertEqual(xgcd_mod([], [], 5), ([], [], []))
+
+    def test_polynomials_mod_p(self):
+        x = Polynomial("x", 101)
+        common = (x + 3) ** 40
+        self.assertEqual(gcd(common * (x**150 + 2 * x + 1), common * (x**120 + 5)), common)
+
+
+class TestExtendedGcd(unittest.TestCase):
+
+    def test_dense(self):
+        g, s, t = xgcd_rational([-1, 0, 0, 1], [-1, 0, 1])
+        self.assertEqual((g, s, t), ([-1, 1], [1], [0, -1]))
+        self.assertIsInstance(g[0], Fraction)
+        p = 10007
+        h = [5] + [0] * 199 + [1]  # x^200 + 5
+        a = [3, 1, 4, 1, 5, 9, 2, 6]
+        inv = invmod_mod(a, h, p)
+        self.assertLess(len(inv), len(h))
+        self.assertEqual(divmod_mod(mul_mod(a, inv, p), h, p)[1], [1])
+        self.assertIsNone(invmod_mod([1, 1], [1, 0, 1], 2))  # x^2 + 1 = (x + 1)^2 mod 2
+
+    def test_polynomials(self):
+        a, b = Polynomial("x^4 - 1"), Polynomial("x^3 + 2x^2 - x - 2")
+        g, s, t = xgcd(a, b)
+        self.assertEqual(g, Polynomial("x^2 - 1"))
+        self.assertEqual(s * a + t * b, g)
+        a, b = Polynomial("x^5 + 3x + 1", 7), Polynomial("2x^2 + 1", 7)
+        g, s, t = xgcd(a, b)
+        self.assertEqual(g, Polynomial("1", 7))
+        self.assertEqual(s * a + t * b, Polynomial("1", 7))
+        h = Polynomial("x^2 + 1")
+        self.assertEqual(invmod(Polynomial("x + 1"), h), Polynomial("1 - x") * 0.5)
+        self.assertEqual(invmod(Polynomial("x^3 + 1", 3), Polynomial("x^2 + 1", 3)), Polynomial("2x + 2", 3))
+        with self.assertRaises(ValueError):
+            invmod(Polynomial("x + 1"), Polynomial("x^2 - 1"))
+        with self.assertRaises(ValueError):
+            xgcd(Polynomial("x + y"), Polynomial("x"))
+
+
+class TestPowmod(unittest.TestCase):
+
+    def test_newton_division(self):
+        rng = random.Random(6)
+        for p in (2, 101, 2**31 - 1):
+            for n in (1, 5, 40, 150):
+                b = [rng.randrange(p) for _ in range(n)] + [rng.randrange(1, p)]
+                inverse = inverse_series_mod(b[::-1], 50, p)
+                self.assertEqual(univariate.trim(mul_mod(b[::-1], inverse, p)[:50]), [1])
+                a = [rng.randrange(p) for _ in range(rng.randint(0, 400))] + [1]
+                self.assertEqual(fast_divmod_mod(a, b, p), divmod_mod(a, b, p))
+
+    def test_powmod(self):
+        rng = random.Random(7)
+        for p in (2, 7, 10007):
+            for n in (1, 3, 20, 70):
+                h = [rng.randrange(p) for _ in range(n)] + [1]
+                a = [rng.randrange(p) for _ in range(2 * n)] + [1]
+                e = rng.randint(0, 400)
+                expected = [1]
+                for _ in range(e):
+                    expected = divmod_mod(mul_mod(expected, a, p), h, p)[1]
+                self.assertEqual(powmod_mod(a, e, h, p), expected)
+        # Fermat in GF(2^127): x^(2^127) = x modulo an irreducible polynomial
+        self.assertEqual(powmod_mod([0, 1], 2**127, [1, 1] + [0] * 125 + [1], 2), [0, 1])
+
+    def test_polynomials(self):
+        h = Polynomial("x^4 + x + 2", 3)
+        self.assertEqual(powmod(Polynomial("x", 3), 3**4, h), Polynomial("x", 3))
+        self.assertEqual(powmod(Polynomial("x", 3), 3**40 + 1, h), Polynomial("x^2", 3))
+        self.assertEqual(powmod(Polynomial("x + 1", 5), -1, Polynomial("x^2 + 2", 5)), Polynomial("3x + 2", 5))
+        self.assertEqual(powmod(Polynomial("x + 1"), 5, Polynomial("x^2 + 1")), Polynomial("-4x - 4"))
+        self.assertEqual(
+            powmod(Polynomial("x + y"), 3, Polynomial("x^2 - y")), Polynomial("x + y") ** 3 % Polynomial("x^2 - y")
+        )
+
+
+class TestNewtonDivision(unittest.TestCase):
+
+    def test_integers(self):
+        rng = random.Random(8)
+        for bound in (3, 2**70):
+            a = [rng.randint(-bound, bound) for _ in range(300)] + [1]
+            b = [rng.randint(-bound, bound) for _ in range(120)] + [-1]
+            product = [0] * (len(a) + len(b) - 1)
+            for i, x in enumerate(a):
+                for j, y in enumerate(b):
+                    product[i + j] += x * y
+            self.assertEqual(mul(a, b), product)  # balanced digits of the Kronecker product
+            inverse = inverse_series(b[::-1], 40)
+            self.assertEqual(univariate.trim(mul(b[::-1], inverse)[:40]), [1])
+            q, r = fast_divmod(a, b)
+            self.assertLess(len(r), len(b))
+            self.assertEqual(univariate.trim([x - y for x, y in zip(a + [0], mul(q, b) + [0] * len(a))]), r)
+
+    def test_polynomials(self):
+        # 2000 quotient terms: more than the 1000 steps division_algorithm allows
+        x = Polynomial("x")
+        f = x**2000 - 1
+        self.assertEqual(f % (x - 1), Polynomial(0))
+        self.assertEqual(f / (x**1000 + 1), x**1000 - 1)
+        self.assertEqual((x**2003 + 3) % (x**2 + 1), Polynomial("-x + 3"))
+        # exact over Q and over F_p with a non-monic divisor
+        self.assertEqual(Polynomial("x^2 - 0.01") / Polynomial("x - 0.1"), Polynomial("x") + 0.1)
+        self.assertEqual(Polynomial("x^3 - 1") / Polynomial("2x - 2"), Polynomial("x^2 + x + 1") * 0.5)
+        self.assertEqual(Polynomial("x^2 + 3x + 1", 7) % Polynomial("3x + 2", 7), Polynomial("1", 7))
+        p = 10007
+        rng = random.Random(9)
+        a = [rng.randrange(p) for _ in range(3000)] + [1]
+        b = [rng.randrange(p) for _ in range(1000)] + [5]
+        q, r = divmod_mod(a, b, p)
+        self.assertEqual(from_dense(a, "x", p) % from_dense(b, "x", p), from_dense(r, "x", p))
+        with self.assertRaises(NonFactor):
+            Polynomial("x^2 + 1") / Polynomial("x + 1")
+
+
+if __name__ == "__main__":
+    unittest.main()
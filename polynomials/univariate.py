@@ -0,0 +1,651 @@
+"""
+Dense univariate polynomial arithmetic over Z and F_p.
+
+A polynomial is the list of its coefficients, constant term first, without trailing zeros
+(the zero polynomial is []). Coefficients are Python ints: arbitrary integers over Z, residues
+in [0, p) over F_p. The functions ending in _mod work over F_p, the others over Z.
+
+Exact gcds over Z come in two flavours. subresultant_gcd runs the subresultant polynomial
+remainder sequence, whose pseudo-remainders stay integral and grow only polynomially; its cost
+is dominated by the coefficient size, so it is used for moderate inputs. modular_gcd computes
+the gcd modulo word-sized primes, combines the images by Chinese remaindering and stops as soon
+as another prime leaves the combination unchanged and trial division confirms it, which is much
+faster for high degrees or large coefficients.
+
+Over F_p, long products go through Kronecker substitution, so that the big integer product of
+CPython does the work, and gcds of high degree use the half-gcd: the quotient sequence of a, b
+is computed recursively from the quotient sequences of their leading halves, as a product of
+2x2 polynomial matrices, in O(M(n) log n) operations against the O(n^2) of Euclid. The same
+matrices give the Bezout cofactors (xgcd_mod).
+"""
+
+import math
+from fractions import Fraction
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from polynomials.groebner import from_exact, to_exact
+from polynomials.polynomial import Polynomial
+
+__all__ = [
+    "HALF_GCD_DEGREE",
+    "KRONECKER_LENGTH",
+    "MODULAR_GCD_SIZE",
+    "Matrix",
+    "NEWTON_DIVISION_LENGTH",
+    "add_mod",
+    "divmod_mod",
+    "divmod_rational",
+    "evaluate_mod",
+    "exact_quotient",
+    "fast_divmod",
+    "fast_divmod_mod",
+    "from_dense",
+    "gcd_integer",
+    "gcd_mod",
+    "half_gcd",
+    "integral",
+    "inverse_series",
+    "inverse_series_mod",
+    "invmod_mod",
+    "modular_gcd",
+    "monic_mod",
+    "mul",
+    "mul_mod",
+    "powmod_mod",
+    "primes",
+    "primitive",
+    "pseudo_remainder",
+    "scale_mod",
+    "sub_mod",
+    "subresultant_gcd",
+    "to_dense",
+    "trim",
+    "window_power",
+    "xgcd_mod",
+    "xgcd_rational",
+]
+
+Dense = List[int]
+
+# gcd_integer switches to modular_gcd from this degree times coefficient bits on
+MODULAR_GCD_SIZE = 512
+# mul_mod multiplies by Kronecker substitution from this many coefficients on
+KRONECKER_LENGTH = 16
+# gcd_mod and xgcd_mod use the half-gcd from this degree on
+HALF_GCD_DEGREE = 64
+# powmod_mod reduces with a Newton inverse from this modulus degree on
+NEWTON_DIVISION_LENGTH = 16
+
+
+def trim(a: Dense) -> Dense:
+    while a and a[-1] == 0:
+        a.pop()
+    return a
+
+
+def to_dense(p: Polynomial, variable: str, char: int = 0) -> List[Any]:
+    """coefficients of p in variable, as Fractions (char 0) or ints mod char"""
+    out: List[Any] = []
+    for (e,), c in to_exact(p, (variable,), char).items():
+        if len(out) <= e:
+            out.extend([0] * (e + 1 - len(out)))
+        out[e] = c
+    return trim(out)
+
+
+def from_dense(a: List[Any], variable: str, char: int = 0) -> Polynomial:
+    return from_exact({(e,): c for e, c in enumerate(a) if c}, (variable,), char)
+
+
+def integral(a: List[Any]) -> Dense:
+    """rational coefficients times the lcm of their denominators"""
+    d = 1
+    for c in a:
+        d = d * c.denominator // math.gcd(d, c.denominator)
+    return [int(c * d) for c in a]
+
+
+# over F_p
+
+
+def scale_mod(a: Dense, c: int, p: int) -> Dense:
+    return trim([x * c % p for x in a])
+
+
+def monic_mod(a: Dense, p: int) -> Dense:
+    return scale_mod(a, pow(a[-1], -1, p), p) if a else []
+
+
+def add_mod(a: Dense, b: Dense, p: int) -> Dense:
+    if len(a) < len(b):
+        a, b = b, a
+    return trim([(x + b[k]) % p if k < len(b) else x for k, x in enumerate(a)])
+
+
+def sub_mod(a: Dense, b: Dense, p: int) -> Dense:
+    return add_mod(a, [-x % p for x in b], p)
+
+
+def _pack(a: Dense, width: int) -> int:
+    return int.from_bytes(b"".join(c.to_bytes(width, "little") for c in a), "little")
+
+
+def mul_mod(a: Dense, b: Dense, p: int) -> Dense:
+    """
+    product over F_p; from KRONECKER_LENGTH coefficients on by Kronecker substitution: both
+    polynomials are evaluated at a power of two wide enough to hold every product coefficient,
+    multiplied as integers (Karatsuba in CPython) and the coefficients read back off the bytes
+    """
+    if not a or not b:
+        return []
+    if min(len(a), len(b)) < KRONECKER_LENGTH:
+        return trim([x % p for x in mul(a, b)])
+    width = (2 * (p - 1).bit_length() + min(len(a), len(b)).bit_length() + 7) // 8
+    packed = _pack(a, width)
+    product = packed * packed if a is b else packed * _pack(b, width)
+    n = len(a) + len(b) - 1
+    data = product.to_bytes(n * width, "little")
+    return trim([int.from_bytes(data[k : k + width], "little") % p for k in range(0, n * width, width)])
+
+
+def divmod_mod(a: Dense, b: Dense, p: int) -> Tuple[Dense, Dense]:
+    r = list(a)
+    inv = pow(b[-1], -1, p)
+    q = [0] * max(len(a) - len(b) + 1, 0)
+    for k in range(len(q) - 1, -1, -1):
+        c = r[k + len(b) - 1] * inv % p
+        q[k] = c
+        if c:
+            for j, y in enumerate(b):
+                r[k + j] = (r[k + j] - c * y) % p
+    return trim(q), trim(r[: len(b) - 1])
+
+
+def inverse_series_mod(a: Dense, n: int, p: int) -> Dense:
+    """the power series inverse of a modulo x^n over F_p (a[0] != 0), by Newton iteration"""
+    g = [pow(a[0], -1, p)]
+    k = 1
+    while k < n:
+        k = min(2 * k, n)
+        # g <- g (2 - a g) doubles the number of correct terms
+        e = [-c % p for c in mul_mod(a[:k], g, p)[:k]]
+        e[0] = (e[0] + 2) % p
+        g = mul_mod(g, e, p)[:k]
+    return trim(g)
+
+
+def fast_divmod_mod(a: Dense, b: Dense, p: int, inverse: Optional[Dense] = None) -> Tuple[Dense, Dense]:
+    """
+    quotient and remainder over F_p with two products: the reversed quotient is the reversed a
+    times the power series inverse of reversed b, which can be passed in precomputed (inverse,
+    to at least deg a - deg b + 1 terms); schoolbook division when the quotient or b is shorter
+    than NEWTON_DIVISION_LENGTH
+    """
+    m = len(a) - len(b) + 1
+    if m <= 0:
+        return [], list(a)
+    if min(m, len(b) - 1) < NEWTON_DIVISION_LENGTH:
+        return divmod_mod(a, b, p)
+    if inverse is None:
+        inverse = inverse_series_mod(b[::-1], m, p)
+    reversed_q = mul_mod(a[::-1][:m], inverse[:m], p)[:m]
+    q = trim((reversed_q + [0] * (m - len(reversed_q)))[::-1])
+    n = len(b) - 1
+    return q, sub_mod(a[:n], mul_mod(q, b, p)[:n], p)
+
+
+def window_power(a: Dense, e: int, multiply: Callable[[Dense, Dense], Dense]) -> Dense:
+    """
+    a^e for e >= 1 by left-to-right sliding window exponentiation, every product (squares with
+    both arguments the same list) done by multiply
+    """
+    bits = bin(e)[2:]
+    window = next(w for w, top in ((1, 8), (2, 24), (3, 80), (4, 240), (5, 10**9)) if len(bits) <= top)
+    # odd powers a, a^3, ..., a^(2^window - 1)
+    odd = [a]
+    if window > 1:
+        square = multiply(a, a)
+        for _ in range(2 ** (window - 1) - 1):
+            odd.append(multiply(odd[-1], square))
+    result: Optional[Dense] = None
+    i = 0
+    while i < len(bits):
+        if bits[i] == "0":
+            result = multiply(result, result) if result is not None else None
+            i += 1
+            continue
+        j = min(i + window, len(bits))
+        while bits[j - 1] == "0":
+            j -= 1
+        if result is not None:
+            for _ in range(j - i):
+                result = multiply(result, result)
+            result = multiply(result, odd[int(bits[i:j], 2) >> 1])
+        else:
+            result = odd[int(bits[i:j], 2) >> 1]
+        i = j
+    return result  # type: ignore[return-value]
+
+
+def powmod_mod(a: Dense, e: int, h: Dense, p: int) -> Dense:
+    """
+    a^e mod h over F_p (e >= 0) by sliding window exponentiation, reducing after every product;
+    from NEWTON_DIVISION_LENGTH on the reductions share one Newton inverse of h
+    """
+    n = len(h) - 1
+    if n == 0:
+        return []
+    inverse = inverse_series_mod(h[::-1], n - 1, p) if n >= NEWTON_DIVISION_LENGTH else None
+
+    def multiply(b: Dense, c: Dense) -> Dense:
+        product = mul_mod(b, c, p)
+        if len(product) <= n:
+            return product
+        return fast_divmod_mod(product, h, p, inverse)[1] if inverse else divmod_mod(product, h, p)[1]
+
+    a = fast_divmod_mod(a, h, p)[1] if inverse else divmod_mod(a, h, p)[1]
+    if e == 0 or not a:
+        return [1] if e == 0 else []
+    return window_power(a, e, multiply)
+
+
+# half-gcd
+
+Matrix = Tuple[Dense, Dense, Dense, Dense]  # 2x2 polynomial matrix, row by row
+
+_IDENTITY: Matrix = ([1], [], [], [1])
+
+
+def _apply(m: Matrix, a: Dense, b: Dense, p: int) -> Tuple[Dense, Dense]:
+    return (
+        add_mod(mul_mod(m[0], a, p), mul_mod(m[1], b, p), p),
+        add_mod(mul_mod(m[2], a, p), mul_mod(m[3], b, p), p),
+    )
+
+
+def _compose(m: Matrix, n: Matrix, p: int) -> Matrix:
+    """m n"""
+    return (
+        add_mod(mul_mod(m[0], n[0], p), mul_mod(m[1], n[2], p), p),
+        add_mod(mul_mod(m[0], n[1], p), mul_mod(m[1], n[3], p), p),
+        add_mod(mul_mod(m[2], n[0], p), mul_mod(m[3], n[2], p), p),
+        add_mod(mul_mod(m[2], n[1], p), mul_mod(m[3], n[3], p), p),
+    )
+
+
+def _step(m: Matrix, q: Dense, p: int) -> Matrix:
+    """((0, 1), (1, -q)) m: the division step (c, d) -> (d, c - q d) after m"""
+    return m[2], m[3], sub_mod(m[0], mul_mod(q, m[2], p), p), sub_mod(m[1], mul_mod(q, m[3], p), p)
+
+
+def _euclid(a: Dense, b: Dense, stop: int, p: int) -> Matrix:
+    m = _IDENTITY
+    while len(b) - 1 >= stop:
+        q, r = divmod_mod(a, b, p)
+        a, b = b, r
+        m = _step(m, q, p)
+    return m
+
+
+def half_gcd(a: Dense, b: Dense, p: int) -> Matrix:
+    """
+    for deg a > deg b, the matrix M of the Euclidean steps on a, b with M (a, b) = (c, d) the
+    first consecutive remainders with deg c >= ceil(deg a / 2) > deg d (Thull and Yap)
+    """
+    n = len(a) - 1
+    m = (n + 1) // 2
+    if len(b) - 1 < m:
+        return _IDENTITY
+    if n < HALF_GCD_DEGREE:
+        return _euclid(a, b, m, p)
+    # the quotients of the leading halves are the first quotients of a, b
+    r = half_gcd(a[m:], b[m:], p)
+    c, d = _apply(r, a, b, p)
+    if len(d) - 1 < m:
+        return r
+    q, e = divmod_mod(c, d, p)
+    r = _step(r, q, p)
+    if len(e) - 1 < m:
+        return r
+    k = 2 * m - (len(d) - 1)
+    return _compose(half_gcd(d[k:], e[k:], p), r, p)
+
+
+def _gcd_matrix(
+    a: Dense, b: Dense, p: int, cofactors: bool, check: Optional[Callable[[Dense, Dense], None]]
+) -> Tuple[Dense, Matrix]:
+    """the last nonzero remainder of a, b and, if cofactors, the matrix taking (a, b) to (it, 0)"""
+    m = _IDENTITY
+    if len(a) < len(b):
+        a, b = b, a
+        m = ([], [1], [1], [])
+    while b:
+        if check is not None:
+            check(a, b)
+        if len(b) - 1 >= HALF_GCD_DEGREE and len(a) > len(b):
+            r = half_gcd(a, b, p)
+            a, b = _apply(r, a, b, p)
+            if cofactors:
+                m = _compose(r, m, p)
+            if not b:
+                break
+        q, rest = divmod_mod(a, b, p)
+        a, b = b, rest
+        if cofactors:
+            m = _step(m, q, p)
+    return a, m
+
+
+def gcd_mod(a: Dense, b: Dense, p: int, check: Optional[Callable[[Dense, Dense], None]] = None) -> Dense:
+    """
+    monic gcd over F_p, by the half-gcd from degree HALF_GCD_DEGREE on; check(a, b) is called
+    before every division or half-gcd step
+    """
+    return monic_mod(_gcd_matrix(a, b, p, False, check)[0], p)
+
+
+def xgcd_mod(a: Dense, b: Dense, p: int) -> Tuple[Dense, Dense, Dense]:
+    """(g, s, t) with g the monic gcd over F_p and s a + t b = g, deg s < deg b - deg g, deg t < deg a - deg g"""
+    g, m = _gcd_matrix(a, b, p, True, None)
+    if not g:
+        return [], [], []
+    inv = pow(g[-1], -1, p)
+    return scale_mod(g, inv, p), scale_mod(m[0], inv, p), scale_mod(m[1], inv, p)
+
+
+def invmod_mod(a: Dense, h: Dense, p: int) -> Optional[Dense]:
+    """the inverse of a modulo h over F_p, None if a and h are not coprime"""
+    g, s, _ = xgcd_mod(divmod_mod(a, h, p)[1], h, p)
+    return s if g == [1] else None
+
+
+def evaluate_mod(a: Dense, x: int, p: int) -> int:
+    v = 0
+    for c in reversed(a):
+        v = (v * x + c) % p
+    return v
+
+
+# over Q
+
+
+def divmod_rational(a: List[Fraction], b: List[Fraction]) -> Tuple[List[Fraction], List[Fraction]]:
+    r = list(a)
+    lb = b[-1]
+    q: List[Fraction] = [Fraction(0)] * max(len(a) - len(b) + 1, 0)
+    for k in range(len(q) - 1, -1, -1):
+        c = r[k + len(b) - 1] / lb
+        q[k] = c
+        if c:
+            for j, y in enumerate(b):
+                r[k + j] -= c * y
+    return trim(q), trim(r[: len(b) - 1])
+
+
+def _subtract(a: List[Any], b: List[Any]) -> List[Any]:
+    return trim([(a[k] if k < len(a) else 0) - (b[k] if k < len(b) else 0) for k in range(max(len(a), len(b)))])
+
+
+def xgcd_rational(a: List[Fraction], b: List[Fraction]) -> Tuple[List[Fraction], List[Fraction], List[Fraction]]:
+    """(g, s, t) with g the monic gcd over Q and s a + t b = g, by the extended Euclidean algorithm"""
+    r0, r1 = [Fraction(c) for c in a], [Fraction(c) for c in b]
+    s0: List[Fraction] = [Fraction(1)]
+    s1: List[Fraction] = []
+    t0: List[Fraction] = []
+    t1: List[Fraction] = [Fraction(1)]
+    while r1:
+        q, r = divmod_rational(r0, r1)
+        r0, r1 = r1, r
+        s0, s1 = s1, _subtract(s0, mul(q, s1))  # type: ignore[arg-type]
+        t0, t1 = t1, _subtract(t0, mul(q, t1))  # type: ignore[arg-type]
+    if not r0:
+        return [], [], []
+    lc = r0[-1]
+    return [c / lc for c in r0], [c / lc for c in s0], [c / lc for c in t0]
+
+
+# over Z
+
+
+def _pack_signed(a: Dense, width: int) -> int:
+    return _pack([c if c > 0 else 0 for c in a], width) - _pack([-c if c < 0 else 0 for c in a], width)
+
+
+def _mul_kronecker(a: Dense, b: Dense) -> Dense:
+    """product over Z by Kronecker substitution, the coefficients read back as balanced digits"""
+    bits = max(abs(c) for c in a).bit_length() + max(abs(c) for c in b).bit_length()
+    width = (bits + min(len(a), len(b)).bit_length() + 1 + 7) // 8
+    packed = _pack_signed(a, width)
+    product = packed * packed if a is b else packed * _pack_signed(b, width)
+    sign = -1 if product < 0 else 1
+    n = len(a) + len(b) - 1
+    data = (sign * product).to_bytes(n * width + 1, "little")
+    base, half = 1 << (8 * width), 1 << (8 * width - 1)
+    out = []
+    carry = 0
+    for k in range(0, n * width, width):
+        d = int.from_bytes(data[k : k + width], "little") + carry
+        carry = d >= half
+        out.append(sign * (d - base if carry else d))
+    return trim(out)
+
+
+def mul(a: Dense, b: Dense) -> Dense:
+    if not a or not b:
+        return []
+    if min(len(a), len(b)) >= KRONECKER_LENGTH and all(type(c) is int for c in a) and all(type(c) is int for c in b):
+        return _mul_kronecker(a, b)
+    out = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                out[i + j] += x * y
+    return trim(out)
+
+
+def inverse_series(a: Dense, n: int) -> Dense:
+    """the power series inverse of a modulo x^n over Z (a[0] = 1 or -1), by Newton iteration"""
+    g = [a[0]]
+    k = 1
+    while k < n:
+        k = min(2 * k, n)
+        e = [-c for c in mul(a[:k], g)[:k]]
+        e[0] += 2
+        g = mul(g, e)[:k]
+    return trim(g)
+
+
+def fast_divmod(a: Dense, b: Dense) -> Tuple[Dense, Dense]:
+    """
+    quotient and remainder over Z for b with leading coefficient 1 or -1, by Newton division
+    as fast_divmod_mod (schoolbook when the quotient or b is shorter than NEWTON_DIVISION_LENGTH)
+    """
+    m = len(a) - len(b) + 1
+    n = len(b) - 1
+    if m <= 0:
+        return [], list(a)
+    if min(m, n) < NEWTON_DIVISION_LENGTH:
+        r = list(a)
+        lb = b[-1]
+        q = [0] * m
+        for k in range(m - 1, -1, -1):
+            c = r[k + n] * lb
+            q[k] = c
+            if c:
+                for j, y in enumerate(b):
+                    r[k + j] -= c * y
+        return trim(q), trim(r[:n])
+    inverse = inverse_series(b[::-1], m)
+    reversed_q = mul(a[::-1][:m], inverse[:m])[:m]
+    q = trim((reversed_q + [0] * (m - len(reversed_q)))[::-1])
+    return q, _subtract(a[:n], mul(q, b)[:n])
+
+
+def _content(a: Dense) -> int:
+    g = 0
+    for c in a:
+        g = math.gcd(g, c)
+        if g == 1:
+            break
+    return g
+
+
+def primitive(a: Dense) -> Dense:
+    """a divided by its content, with a positive leading coefficient"""
+    g = _content(a)
+    if a[-1] < 0:
+        g = -g
+    return [c // g for c in a]
+
+
+def pseudo_remainder(a: Dense, b: Dense) -> Dense:
+    """lc(b)^(deg a - deg b + 1) * a mod b"""
+    r = list(a)
+    lb, n = b[-1], len(b)
+    for k in range(len(a) - n, -1, -1):
+        # r = lb * r - lc(r) x^k b, dropping the cancelled leading term
+        c = r[k + n - 1]
+        r = [x * lb for x in r[: k + n - 1]]
+        if c:
+            for j in range(n - 1):
+                r[k + j] -= c * b[j]
+    return trim(r)
+
+
+def exact_quotient(a: Dense, b: Dense) -> Optional[Dense]:
+    """a / b if b divides a over Z, else None"""
+    if not b:
+        return None
+    r = list(a)
+    lb, n = b[-1], len(b)
+    q = [0] * max(len(a) - n + 1, 0)
+    for k in range(len(q) - 1, -1, -1):
+        c, rest = divmod(r[k + n - 1], lb)
+        if rest:
+            return None
+        q[k] = c
+        if c:
+            for j in range(n):
+                r[k + j] -= c * b[j]
+    if any(r[: n - 1]):
+        return None
+    return trim(q)
+
+
+def subresultant_gcd(a: Dense, b: Dense, check: Optional[Callable[[Dense, Dense], None]] = None) -> Dense:
+    """
+    gcd over Z by the subresultant remainder sequence (the gcd of the contents times the
+    primitive gcd, with a positive leading coefficient); check(a, b) is called before every step
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return [-c for c in a] if a and a[-1] < 0 else list(a)
+    d = math.gcd(_content(a), _content(b))
+    a, b = primitive(a), primitive(b)
+    g = h = 1
+    while True:
+        if check is not None:
+            check(a, b)
+        delta = len(a) - len(b)
+        r = pseudo_remainder(a, b)
+        if not r:
+            return [d * c for c in primitive(b)]
+        if len(r) == 1:
+            return [d]
+        divisor = g * h**delta
+        a, b = b, [c // divisor for c in r]
+        g = a[-1]
+        h = g**delta // h ** (delta - 1) if delta else h
+
+
+def _is_prime(n: int) -> bool:
+    if n < 2:
+        return False
+    for q in (2, 3, 5, 7, 11, 13):
+        if n % q == 0:
+            return n == q
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for w in (2, 3, 5, 7, 11, 13):  # deterministic below 3.4e12
+        x = pow(w, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def primes(start: int = 2**31) -> Iterator[int]:
+    """primes below start, largest first"""
+    n = start - 1
+    while n > 2:
+        if _is_prime(n):
+            yield n
+        n -= 2 if n % 2 else 1
+
+
+def modular_gcd(a: Dense, b: Dense, check: Optional[Callable[[Dense, Dense], None]] = None) -> Dense:
+    """
+    gcd over Z (normalized as subresultant_gcd) from gcds modulo primes combined by Chinese
+    remaindering; check(a, b) is called before every prime
+    """
+    if not a or not b:
+        rest = a or b
+        return [-c for c in rest] if rest and rest[-1] < 0 else list(rest)
+    d = math.gcd(_content(a), _content(b))
+    a, b = primitive(a), primitive(b)
+    gamma = math.gcd(a[-1], b[-1])
+    combined: Dense = []
+    modulus = 1
+    degree = min(len(a), len(b)) - 1
+    for p in primes():
+        if a[-1] % p == 0 or b[-1] % p == 0:
+            continue
+        if check is not None:
+            check(a, b)
+        image = gcd_mod([c % p for c in a], [c % p for c in b], p)
+        if len(image) == 1:
+            return [d]
+        if len(image) - 1 < degree or not combined:
+            degree, combined, modulus = len(image) - 1, [0] * len(image), 1
+        elif len(image) - 1 > degree:
+            continue  # unlucky prime
+        inv = pow(modulus, -1, p)
+        new_modulus = modulus * p
+        half = new_modulus // 2
+        changed = False
+        for k, x in enumerate(image):
+            c = combined[k]
+            t = (x * gamma - c) * inv % p
+            if t:
+                changed = True
+                c += modulus * t
+                if c > half:
+                    c -= new_modulus
+                combined[k] = c
+        first = modulus == 1
+        modulus = new_modulus
+        if not first and not changed:
+            candidate = primitive(combined)
+            if exact_quotient(a, candidate) is not None and exact_quotient(b, candidate) is not None:
+                return [d * c for c in candidate]
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def gcd_integer(a: Dense, b: Dense, check: Optional[Callable[[Dense, Dense], None]] = None) -> Dense:
+    """
+    gcd over Z, by subresultant_gcd for small inputs and modular_gcd from degree times
+    coefficient bits MODULAR_GCD_SIZE on (the subresultant sequence wins below that)
+    """
+    if not a or not b:
+        return modular_gcd(a, b)
+    bits = max(abs(c) for c in a + b).bit_length()
+    if (min(len(a), len(b)) - 1) * max(bits, 8) >= MODULAR_GCD_SIZE:
+        return modular_gcd(a, b, check)
+    return subresultant_gcd(a, b, check)